@@ -0,0 +1,385 @@
+# bench.py
+#
+# 热点函数基准套件（用 game.py 里真正的函数，不是复制品）
+#   设备上（REPL）:  import bench; bench.run(zombies=5, board=100, difficulty="NORMAL")
+#                    （bench/ 不随游戏部署：先 tools/build_mpy.py --deploy ... --bench 复制到板子上）
+#                    或者把 bench_runner.py 复制成 code.py，重启后从串口看结果
+#   电脑上:          python3 tools/bench_host.py --zombies 5 --board 100 --difficulty NORMAL
+#
+# 每个基准打印一行机器可读的 JSON（前缀 "BENCH "）：
+#   BENCH {"bench": "update_zombies", "us": 41.2, "calls": 400, ...}
+# baseline: 上一次保存的结果（JSON 文件），每项打印 now / base / 比值，
+#   比 base 慢超过 tolerance 的标 SLOWER。save=True 把这次结果存成新的 baseline。
+import gc
+import json
+import random
+import sys
+import time
+
+import game
+import score
+from adxl_stream import SCALE
+from aim import to_q
+from hitindex import HitIndex
+from profiler import PhaseProfiler
+import sprites
+from zombie_registry import ZombieRegistry
+
+BASELINE_FILE = "bench_baseline.json"
+BENCH_SCORE_FMT = "bench_{}.bin"   # 不碰真正的排行榜文件
+
+
+def _loop_ns(clock_ns, calls):
+    """空循环的开销，从每个基准里减掉"""
+    t0 = clock_ns()
+    for _ in range(calls):
+        pass
+    return clock_ns() - t0
+
+
+def _result(name, total_ns, calls, overhead_ns, **extra):
+    net = max(0, total_ns - overhead_ns)
+    r = {"bench": name, "us": round(net / calls / 1000, 3), "calls": calls}
+    r.update(extra)
+    return r
+
+
+def _use_pool(n):
+    """
+    zombies > ZOMBIE_POOL_SIZE：临时换一个更大的 registry + hit index
+    （game 里的函数每次调用都查模块全局变量，所以换掉就生效）。返回旧的两个对象。
+    """
+    old = (game.zombies, game.hit_index)
+    game.zombies.clear()
+    if n > game.ZOMBIE_POOL_SIZE:
+        labels = [game.make_glyph("Z") for _ in range(n)]
+        game.hit_index = HitIndex(128, 64, n)
+        game.zombies = ZombieRegistry(labels, game.hit_index, game.sheet)
+    return old
+
+
+def _restore_pool(old):
+    game.zombies.clear()
+    game.zombies, game.hit_index = old
+
+
+def bench_map_to_range(clock_ns, calls):
+    # filter units (Q4 counts), a bit beyond the tilt limits so clamping is hit too
+    values = [to_q(random.uniform(-8.0, 8.0), SCALE) for _ in range(64)]
+    f = game.map_to_range
+    lo, hi = game.aim.x_min_q, game.aim.x_max_q
+    out_lo, out_hi = game.SCREEN_X_MIN, game.SCREEN_X_MAX
+    overhead = _loop_ns(clock_ns, calls)
+    t0 = clock_ns()
+    for i in range(calls):
+        f(values[i & 63], lo, hi, out_lo, out_hi)
+    return _result("map_to_range", clock_ns() - t0, calls, overhead)
+
+
+def bench_get_level_config(clock_ns, calls, difficulty):
+    f = game.get_level_config
+    overhead = _loop_ns(clock_ns, calls)
+    t0 = clock_ns()
+    for i in range(calls):
+        f(difficulty, i % 10 + 1)
+    return _result("get_level_config", clock_ns() - t0, calls, overhead)
+
+
+def bench_spawn_remove(clock_ns, rounds, zombies, difficulty):
+    cfg = game.get_level_config(difficulty, 5)
+    reg = game.zombies
+    now = 0
+    spawn_ns = 0
+    remove_ns = 0
+    for _ in range(rounds):
+        t0 = clock_ns()
+        for _ in range(zombies):
+            game.spawn_zombie(cfg, 5, now)
+        t1 = clock_ns()
+        active = reg.active
+        while active:
+            game.remove_zombie(active[-1])
+        t2 = clock_ns()
+        spawn_ns += t1 - t0
+        remove_ns += t2 - t1
+    calls = rounds * zombies
+    return [
+        _result("spawn_zombie", spawn_ns, calls, 0, zombies=zombies),
+        _result("remove_zombie", remove_ns, calls, 0, zombies=zombies),
+    ]
+
+
+def _fill(zombies, difficulty):
+    cfg = game.get_level_config(difficulty, 5)
+    for _ in range(zombies):
+        game.spawn_zombie(cfg, 5, 0)
+    return cfg
+
+
+def bench_update_zombies(clock_ns, calls, zombies, difficulty):
+    cfg = _fill(zombies, difficulty)
+    # 一半僵尸在闪烁窗口里，一半没有；now 固定，所以不会有僵尸到期被删
+    now = 100000   # game ms
+    for i, z in enumerate(game.zombies.active):
+        z.spawn_time = now - (z.lifetime - 1000 if i % 2 else 500)
+    f = game.update_zombies
+    overhead = _loop_ns(clock_ns, calls)
+    t0 = clock_ns()
+    for _ in range(calls):
+        f(now, False, 3, cfg)
+    r = _result("update_zombies", clock_ns() - t0, calls, overhead, zombies=zombies)
+    game.zombies.clear()
+    return r
+
+
+def bench_find_hit_zombie(clock_ns, calls, zombies, difficulty):
+    _fill(zombies, difficulty)
+    points = [(random.randint(0, 127), random.randint(18, 48)) for _ in range(64)]
+    f = game.find_hit_zombie
+    overhead = _loop_ns(clock_ns, calls)
+    t0 = clock_ns()
+    for i in range(calls):
+        px, py = points[i & 63]
+        f(px, py)
+    r = _result("find_hit_zombie", clock_ns() - t0, calls, overhead, zombies=zombies)
+    game.zombies.clear()
+    return r
+
+
+def bench_encoder_update(clock_ns, calls):
+    enc = game.encoder
+    overhead = _loop_ns(clock_ns, calls)
+    t0 = clock_ns()
+    for _ in range(calls):
+        enc.update()
+    r = _result("RotaryEncoder.update", clock_ns() - t0, calls, overhead, backend=enc.backend)
+    enc.get_delta()
+    return r
+
+
+def bench_profiler_lap(clock_ns, calls):
+    """PhaseProfiler.lap() as the game tasks call it: switched off, then on."""
+    prof = PhaseProfiler(game.PHASES)
+    results = []
+    for on in (False, True):
+        prof.on = on
+        lap = prof.lap
+        overhead = _loop_ns(clock_ns, calls)
+        t0 = clock_ns()
+        for _ in range(calls):
+            lap(0)
+        results.append(_result("PhaseProfiler.lap " + ("on" if on else "off"),
+                               clock_ns() - t0, calls, overhead))
+    return results
+
+
+def _render_group(kind, zombies):
+    """zombies + crosshair as the game builds them: labels, or sprites in one layer"""
+    if kind == "sprites":
+        sheet = sprites.sheet()
+        group = sheet.layer()
+        make = sheet.sprite
+    else:
+        group = game.displayio.Group()
+        make = lambda ch, x=0, y=0: game.label.Label(game.terminalio.FONT, text=ch, x=x, y=y)
+    cross = make("+", 64, 36)
+    group.append(cross)
+    glyphs = []
+    for i in range(zombies):
+        g = make("Z", 8 + (i * 37) % 112, 20 + (i * 11) % 28)
+        group.append(g)
+        glyphs.append(g)
+    return group, cross, glyphs
+
+
+def _build_bytes(kind, zombies):
+    """堆上搭一组 labels / sprites 要多少字节（搭好量完就丢掉，不在计时里）"""
+    gc.collect()
+    before = gc.mem_alloc()
+    group = _render_group(kind, zombies)
+    gc.collect()
+    used = gc.mem_alloc() - before
+    group = None
+    return used
+
+
+def bench_render(clock_ns, frames, zombies):
+    """
+    每帧：准星移动 + 每个僵尸闪烁（hidden）+ 每 4 帧一个僵尸换字形（Z/S/T）+ display.refresh()
+    labels vs sprites，另外记下搭这一组对象占了多少堆（bytes）
+    """
+    display = game.display
+    old_root = display.root_group
+    old_auto = display.auto_refresh
+    display.auto_refresh = False
+    types = ("Z", "S", "T")
+    results = []
+    try:
+        for kind in ("labels", "sprites"):
+            used = _build_bytes(kind, zombies)
+            group, cross, glyphs = _render_group(kind, zombies)
+            sheet = sprites.sheet() if kind == "sprites" else None
+            display.root_group = group
+
+            t0 = clock_ns()
+            for f in range(frames):
+                cross.x = 20 + (f * 3) % 90
+                cross.y = 20 + (f * 5) % 28
+                for i, g in enumerate(glyphs):
+                    g.hidden = ((f + i) & 4) != 0
+                if glyphs and f & 3 == 0:
+                    g = glyphs[(f >> 2) % len(glyphs)]
+                    ch = types[(f >> 2) % 3]
+                    if sheet is not None:
+                        g[0] = sheet.tile(ch)
+                    else:
+                        g.text = ch
+                display.refresh()
+            results.append(_result("render " + kind, clock_ns() - t0, frames, 0,
+                                   zombies=zombies, bytes=used))
+            display.root_group = old_root
+            group = cross = glyphs = None
+    finally:
+        display.root_group = old_root
+        display.auto_refresh = old_auto
+    return results
+
+
+def bench_scores(clock_ns, rounds, board, difficulty):
+    """load_scores() / add_score() on a board with `board` records (separate bench_*.bin file)"""
+    saved = (score.SCORE_FILE_FMT, score.MAX_SCORES)
+    score.SCORE_FILE_FMT = BENCH_SCORE_FMT
+    score.MAX_SCORES = board
+    score._meta.clear()
+    path = score._path(difficulty)
+    try:
+        try:
+            import os
+            os.remove(path)
+        except OSError:
+            pass
+        for i in range(board):
+            score.add_score("B%02d" % (i % 100), random.randint(1, 1000), difficulty)
+
+        t0 = clock_ns()
+        for _ in range(rounds):
+            score.load_scores(difficulty)
+        load_ns = clock_ns() - t0
+
+        t0 = clock_ns()
+        for _ in range(rounds):
+            score.add_score("NEW", random.randint(1, 1000), difficulty)
+        add_ns = clock_ns() - t0
+    finally:
+        score.SCORE_FILE_FMT, score.MAX_SCORES = saved
+        score._meta.clear()
+        try:
+            import os
+            os.remove(path)
+        except OSError:
+            pass
+    return [
+        _result("load_scores", load_ns, rounds, 0, board=board),
+        _result("add_score", add_ns, rounds, 0, board=board),
+    ]
+
+
+def baseline_key(zombies, board, difficulty):
+    return "{}/z{}/b{}/{}".format(sys.platform, zombies, board, difficulty)
+
+
+def compare(results, baseline, tolerance=0.2):
+    """打印每项和 baseline 的比值；返回变慢的基准名列表"""
+    slower = []
+    for r in results:
+        base = baseline.get(r["bench"])
+        if not base:
+            print("{:<22} {:>10.3f} us   (no baseline)".format(r["bench"], r["us"]))
+            continue
+        ratio = r["us"] / base
+        if ratio > 1 + tolerance:
+            status = "SLOWER"
+            slower.append(r["bench"])
+        elif ratio < 1 - tolerance:
+            status = "faster"
+        else:
+            status = "ok"
+        print("{:<22} {:>10.3f} us   base {:>10.3f} us   x{:.2f}  {}".format(
+            r["bench"], r["us"], base, ratio, status))
+    return slower
+
+
+def _load_baselines(path):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _run_once(clock_ns, zombies, board, difficulty, calls, rounds):
+    old_pool = _use_pool(zombies)
+    try:
+        results = [
+            bench_map_to_range(clock_ns, calls),
+            bench_get_level_config(clock_ns, calls, difficulty),
+        ]
+        results.extend(bench_spawn_remove(clock_ns, rounds, zombies, difficulty))
+        results.append(bench_update_zombies(clock_ns, calls, zombies, difficulty))
+        results.append(bench_find_hit_zombie(clock_ns, calls, zombies, difficulty))
+        results.append(bench_encoder_update(clock_ns, calls))
+        results.extend(bench_profiler_lap(clock_ns, calls))
+        results.extend(bench_render(clock_ns, rounds * 5, zombies))
+    finally:
+        _restore_pool(old_pool)
+    results.extend(bench_scores(clock_ns, rounds, board, difficulty))
+    gc.collect()
+    return results
+
+
+def run(zombies=5, board=100, difficulty="NORMAL", calls=1000, rounds=20, repeat=3,
+        baseline=BASELINE_FILE, save=False, tolerance=0.2, clock_ns=None):
+    """
+    跑全部基准，返回结果列表（每项一个 dict）。
+    - zombies: 同屏僵尸数（最多 32，超过游戏池大小时临时换大池）
+    - board: 排行榜记录数
+    - difficulty: "EASY" / "NORMAL" / "DIFFICULT"
+    - repeat: 每项跑几遍，取最快的
+    - clock_ns: 计时函数，默认 time.monotonic_ns（电脑上的假 time 是虚拟时钟，要传真时钟）
+    """
+    if clock_ns is None:
+        clock_ns = time.monotonic_ns
+    random.seed(1234)
+    game.rng_seed(1234)
+    gc.collect()
+
+    params = {"zombies": zombies, "board": board, "difficulty": difficulty,
+              "platform": sys.platform, "repeat": repeat}
+    print("BENCH_PARAMS " + json.dumps(params))
+
+    # 每项跑 repeat 次取最快的一次（GC / 中断 / 主机调度的噪声只会让结果变慢）
+    best = {}
+    order = []
+    for _ in range(repeat):
+        for r in _run_once(clock_ns, zombies, board, difficulty, calls, rounds):
+            name = r["bench"]
+            if name not in best:
+                order.append(name)
+                best[name] = r
+            elif r["us"] < best[name]["us"]:
+                best[name] = r
+    results = [best[name] for name in order]
+
+    for r in results:
+        print("BENCH " + json.dumps(r))
+
+    if baseline:
+        key = baseline_key(zombies, board, difficulty)
+        baselines = _load_baselines(baseline)
+        compare(results, baselines.get(key, {}), tolerance)
+        if save:
+            baselines[key] = {r["bench"]: r["us"] for r in results}
+            with open(baseline, "w") as f:
+                json.dump(baselines, f)
+            print("baseline saved:", baseline, key)
+    return results
@@ -0,0 +1,196 @@
+# bench_aim.py
+#
+# 瞄准 + 僵尸计时：原来的浮点管线 vs 定点管线（aim.AimFilter + 整数毫秒）
+#   设备上（REPL）:  import bench_aim; bench_aim.run()（先 tools/build_mpy.py --deploy ... --bench 复制到板子上）
+#   电脑上:          PYTHONPATH=src/codefiles python3 bench/bench_aim.py（在仓库根目录）
+#
+# 一帧 = 游戏 40 Hz 的一帧：2~3 个加速度样本（100 Hz FIFO）的 EMA + 准星映射
+#       + 5 个僵尸的寿命 / 闪烁更新（到期的马上重新生成）
+# 打印：
+#   frame_us   每帧平均耗时 float / fixed，以及省下的 CPU 比例（40 FPS 时每秒省多少 ms）
+#   max_px     两条管线准星位置的最大差别（像素，要求 <= 1），px_diff 有差别的帧数
+#   flash_diff 同一个僵尸状态，浮点公式和整数公式给出不同闪烁相位的次数：
+#              只发生在相位边界正好落在帧上的时候（浮点 1.4 - 0.4 = 0.99999...）
+import array
+import random
+import time
+
+from aim import AimFilter
+
+SCALE = 0.004 * 9.80665    # adxl_stream.SCALE: m/s^2 per count
+ALPHA = 1 - (1 - 0.2) ** (1 / (100 * 0.025))   # game.sample_alpha at 100 Hz / 40 FPS
+X_RANGE = (-6.0, 6.0)
+Y_RANGE = (-6.0, 6.0)
+SCREEN_X = (0, 127)
+SCREEN_Y = (18, 48)
+FLASH_WARNING_TIME = 3.0
+FLASH_WARNING_MS = 3000
+FRAME_MS = 25
+LIFETIMES_MS = (2000, 2800, 3400, 4500, 5000)
+
+
+class _Zombie:
+    __slots__ = ("spawn_time", "lifetime", "hidden")
+
+    def __init__(self, spawn_time, lifetime):
+        self.spawn_time = spawn_time
+        self.lifetime = lifetime
+        self.hidden = False
+
+
+def _make_samples(n, seed=7):
+    """Random-walk tilt in counts, beyond the ±6 m/s^2 limits now and then, plus noise."""
+    random.seed(seed)
+    xs = array.array("h")
+    ys = array.array("h")
+    x = y = 0
+    for _ in range(n):
+        x = max(-250, min(250, x + random.randint(-12, 12)))
+        y = max(-250, min(250, y + random.randint(-12, 12)))
+        xs.append(x + random.randint(-4, 4))
+        ys.append(y + random.randint(-4, 4))
+    return xs, ys
+
+
+# ----- old: float EMA in m/s^2, float map, float seconds -----
+
+def _map_float(value, in_min, in_max, out_min, out_max):
+    if value < in_min:
+        value = in_min
+    if value > in_max:
+        value = in_max
+    span_in = in_max - in_min
+    ratio = (value - in_min) / span_in
+    return int(out_min + ratio * (out_max - out_min))
+
+
+class _FloatAim:
+    def __init__(self):
+        self.x_f = 0.0
+        self.y_f = 0.0
+
+    def feed(self, x, y, z):
+        # drain() used to scale every sample to m/s^2
+        x = x * SCALE
+        y = y * SCALE
+        self.x_f = ALPHA * x + (1 - ALPHA) * self.x_f
+        self.y_f = ALPHA * y + (1 - ALPHA) * self.y_f
+
+    def px(self):
+        return _map_float(self.x_f, X_RANGE[0], X_RANGE[1], SCREEN_X[0], SCREEN_X[1])
+
+    def py(self):
+        return _map_float(-self.y_f, Y_RANGE[0], Y_RANGE[1], SCREEN_Y[0], SCREEN_Y[1])
+
+
+def _hidden_float(age, lifetime):
+    warn_time = min(FLASH_WARNING_TIME, lifetime)
+    if age >= lifetime - warn_time:
+        return int((age - (lifetime - warn_time)) * 6) % 2 == 1
+    return False
+
+
+def _update_float(zombies, now):
+    for i, z in enumerate(zombies):
+        age = now - z.spawn_time
+        lifetime = z.lifetime
+        if age >= lifetime:
+            zombies[i] = _Zombie(now, lifetime)
+            continue
+        warn_time = min(FLASH_WARNING_TIME, lifetime)
+        if age >= lifetime - warn_time:
+            z.hidden = (int((age - (lifetime - warn_time)) * 6) % 2 == 1)
+        else:
+            z.hidden = False
+
+
+# ----- new: integer counts / Q4 / whole ms -----
+
+def _update_fixed(zombies, now):
+    for i, z in enumerate(zombies):
+        age = now - z.spawn_time
+        lifetime = z.lifetime
+        if age >= lifetime:
+            zombies[i] = _Zombie(now, lifetime)
+            continue
+        warn_time = min(FLASH_WARNING_MS, lifetime)
+        if age >= lifetime - warn_time:
+            z.hidden = ((age - (lifetime - warn_time)) * 6 // 1000 % 2 == 1)
+        else:
+            z.hidden = False
+
+
+def _frame_samples(f, n):
+    """Sample index range for frame f: 2, 3, 2, 3, ... (100 Hz FIFO drained at 40 Hz)."""
+    start = f * 5 // 2
+    return start % n, (f + 1) * 5 // 2 - start
+
+
+def run(frames=2000):
+    xs, ys = _make_samples(1000)
+    n = len(xs)
+
+    # --- accuracy: both pipelines side by side on the same input ---
+    fa, qa = _FloatAim(), AimFilter(ALPHA, SCALE, X_RANGE, Y_RANGE, SCREEN_X, SCREEN_Y)
+    qz = [_Zombie(0, ms) for ms in LIFETIMES_MS]
+    checks = 0
+    max_px = 0
+    px_diff = 0
+    flash_diff = 0
+    for f in range(frames):
+        start, count = _frame_samples(f, n)
+        for i in range(start, start + count):
+            fa.feed(xs[i % n], ys[i % n], 256)
+            qa.feed(xs[i % n], ys[i % n], 256)
+        d = max(abs(fa.px() - qa.px()), abs(fa.py() - qa.py()))
+        if d:
+            px_diff += 1
+            if d > max_px:
+                max_px = d
+        now_ms = f * FRAME_MS
+        _update_fixed(qz, now_ms)
+        for z in qz:
+            if now_ms > z.spawn_time:
+                checks += 1
+                age = now_ms / 1000 - z.spawn_time / 1000
+                if _hidden_float(age, z.lifetime / 1000) != z.hidden:
+                    flash_diff += 1
+
+    # --- timing: each pipeline on its own ---
+    fa = _FloatAim()
+    fz = [_Zombie(0.0, ms / 1000) for ms in LIFETIMES_MS]
+    feed = fa.feed
+    t0 = time.monotonic_ns()
+    for f in range(frames):
+        start, count = _frame_samples(f, n)
+        for i in range(start, start + count):
+            feed(xs[i % n], ys[i % n], 256)
+        fa.px()
+        fa.py()
+        _update_float(fz, f * FRAME_MS / 1000)
+    float_us = (time.monotonic_ns() - t0) / 1000 / frames
+
+    qa = AimFilter(ALPHA, SCALE, X_RANGE, Y_RANGE, SCREEN_X, SCREEN_Y)
+    qz = [_Zombie(0, ms) for ms in LIFETIMES_MS]
+    feed = qa.feed
+    t0 = time.monotonic_ns()
+    for f in range(frames):
+        start, count = _frame_samples(f, n)
+        for i in range(start, start + count):
+            feed(xs[i % n], ys[i % n], 256)
+        qa.px()
+        qa.py()
+        _update_fixed(qz, f * FRAME_MS)
+    fixed_us = (time.monotonic_ns() - t0) / 1000 / frames
+
+    saved = float_us - fixed_us
+    print("frame_us float={:.1f} fixed={:.1f} saved={:.1f} ({:.0f}%, {:.2f} ms/s at 40 FPS)".format(
+        float_us, fixed_us, saved, 100 * saved / float_us if float_us else 0, saved * 40 / 1000))
+    print("max_px={} px_diff={}/{} flash_diff={}/{}".format(max_px, px_diff, frames, flash_diff, checks))
+    assert max_px <= 1
+    return {"float_us": float_us, "fixed_us": fixed_us, "max_px": max_px, "px_diff": px_diff,
+            "flash_diff": flash_diff}
+
+
+if __name__ == "__main__":
+    run()
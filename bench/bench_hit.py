@@ -0,0 +1,62 @@
+# bench_hit.py
+#
+# 射击判定基准：旧的逐个僵尸 abs() 扫描 vs hitindex.HitIndex 一次查表
+#   设备上（REPL）:  import bench_hit; bench_hit.run()（先 tools/build_mpy.py --deploy ... --bench 复制到板子上）
+#   电脑上:          PYTHONPATH=src/codefiles python3 bench/bench_hit.py（在仓库根目录）
+#
+# 每个僵尸数量打印一行（每次射击的平均耗时，单位 ns）：
+#   linear  旧 find_hit_zombie(): 遍历 zombies 列表
+#   index   HitIndex.find(): 一次 AND + 查最低位
+import random
+import time
+
+from hitindex import HitIndex, HIT_HALF_W, HIT_HALF_H
+
+
+def _linear_find(zombies, px, py):
+    for z in zombies:
+        if z["dead"]:
+            continue
+        dx = abs(px - z["x"])
+        dy = abs(py - z["y"])
+        if dx <= HIT_HALF_W and dy <= HIT_HALF_H:
+            return z
+    return None
+
+
+def run(counts=(5, 16, 32), shots=2000):
+    results = []
+    for n in counts:
+        index = HitIndex(128, 64, n)
+        zombies = []
+        for slot in range(n):
+            zx = random.randint(5, 122)
+            zy = random.randint(23, 43)
+            zombies.append({"x": zx, "y": zy, "dead": False})
+            index.add(slot, zx, zy)
+
+        # 大部分射击打空：这是线性扫描的最坏情况（要扫完整个列表）
+        points = [(random.randint(0, 127), random.randint(18, 48)) for _ in range(shots)]
+
+        t0 = time.monotonic_ns()
+        for px, py in points:
+            _linear_find(zombies, px, py)
+        linear_ns = (time.monotonic_ns() - t0) // shots
+
+        t0 = time.monotonic_ns()
+        for px, py in points:
+            index.find(px, py)
+        index_ns = (time.monotonic_ns() - t0) // shots
+
+        # 两种方法的命中/未命中结果必须一致
+        for px, py in points:
+            hit = _linear_find(zombies, px, py) is not None
+            assert hit == (index.find(px, py) >= 0)
+
+        print("zombies={} linear={}ns index={}ns".format(n, linear_ns, index_ns))
+        results.append({"zombies": n, "linear": linear_ns, "index": index_ns})
+    return results
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,14 @@
+# bench_runner.py
+#
+# 设备上跑 bench.py：先 tools/build_mpy.py --deploy ... --bench 把 bench/ 复制到板子上，
+# 再把这个文件复制成 code.py（先备份原来的 code.py），重启，
+# 从串口看 "BENCH {...}" 行。参数改下面几个常量就行。
+# 第一次跑设 SAVE = True 存 baseline（CIRCUITPY 要可写，和排行榜一样），以后比较。
+import bench
+
+ZOMBIES = 5
+BOARD = 100
+DIFFICULTY = "NORMAL"
+SAVE = False
+
+bench.run(zombies=ZOMBIES, board=BOARD, difficulty=DIFFICULTY, save=SAVE)
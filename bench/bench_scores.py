@@ -0,0 +1,90 @@
+# bench_scores.py
+#
+# 排行榜存储基准：旧的 JSON 路径 vs 定长二进制记录（score.py）
+#   设备上（REPL）:  import bench_scores; bench_scores.run()（先 tools/build_mpy.py --deploy ... --bench 复制到板子上）
+#   电脑上:          PYTHONPATH=src/codefiles python3 bench/bench_scores.py（在仓库根目录）
+#
+# 每个规模打印一行：
+#   json_load   旧 load_scores(): listdir + 解析整个 JSON + 排序
+#   json_add    旧 add_score():   load + append + 排序 + 整个写回
+#   bin_page    score.read_page(): 读排行榜一页（3 条）
+#   bin_load    读整张榜
+#   bin_insert  score._insert(): 二分找位置 + 只重写插入点之后的记录
+import json
+import os
+import random
+import struct
+import time
+
+import score
+
+JSON_FILE = "bench_scores.json"
+BIN_FILE = "bench_scores.bin"
+
+
+def _json_load(cap):
+    if JSON_FILE not in os.listdir():
+        return []
+    with open(JSON_FILE, "r") as f:
+        data = json.load(f)
+    scores = []
+    for item in data:
+        scores.append({"name": item["name"], "score": int(item["score"])})
+    scores.sort(key=lambda x: x["score"], reverse=True)
+    return scores[:cap]
+
+
+def _json_add(name, new_score, cap):
+    scores = _json_load(cap)
+    scores.append({"name": name, "score": int(new_score)})
+    scores = sorted(scores, key=lambda x: x["score"], reverse=True)[:cap]
+    with open(JSON_FILE, "w") as f:
+        json.dump(scores, f)
+
+
+def _fill(n):
+    values = sorted([random.randint(1, 5000) for _ in range(n)], reverse=True)
+    with open(JSON_FILE, "w") as f:
+        json.dump([{"name": "AAA", "score": v} for v in values], f)
+    with open(BIN_FILE, "wb") as f:
+        f.write(struct.pack(score._HEADER, score._MAGIC, n, score._RECORD_SIZE))
+        for v in values:
+            f.write(score._pack_record("AAA", v))
+
+
+def _time_us(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        t0 = time.monotonic_ns()
+        fn()
+        us = (time.monotonic_ns() - t0) // 1000
+        if best is None or us < best:
+            best = us
+    return best
+
+
+def run(sizes=(10, 100, 1000), repeat=5):
+    results = []
+    for n in sizes:
+        _fill(n)
+        row = {"size": n}
+        row["json_load"] = _time_us(lambda: _json_load(n), repeat)
+        row["json_add"] = _time_us(lambda: _json_add("BBB", random.randint(1, 5000), n), repeat)
+        row["bin_page"] = _time_us(lambda: score._read_records(BIN_FILE, n // 2, 3), repeat)
+        row["bin_load"] = _time_us(lambda: score._read_records(BIN_FILE, 0, n), repeat)
+        row["bin_insert"] = _time_us(
+            lambda: score._insert(BIN_FILE, n, "BBB", random.randint(1, 5000), n), repeat)
+        print("size={size} json_load={json_load}us json_add={json_add}us "
+              "bin_page={bin_page}us bin_load={bin_load}us bin_insert={bin_insert}us".format(**row))
+        results.append(row)
+
+    for path in (JSON_FILE, BIN_FILE):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    return results
+
+
+if __name__ == "__main__":
+    run()
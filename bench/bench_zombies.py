@@ -0,0 +1,126 @@
+# bench_zombies.py
+#
+# 僵尸存储基准：旧的 9 键 dict + list vs zombie_registry.ZombieRegistry
+#   设备上（REPL）:  import bench_zombies; bench_zombies.run()（先 tools/build_mpy.py --deploy ... --bench 复制到板子上）
+#   电脑上:          PYTHONPATH=src/codefiles python3 bench/bench_zombies.py（在仓库根目录）
+#
+# 打印：
+#   bytes/zombie  每个僵尸占用的堆内存（dict vs __slots__ 对象）
+#   frame_us      每帧 update_zombies() 的平均耗时（含到期删除 + 重新生成）
+import gc
+import random
+import time
+
+from zombie_registry import ZombieRegistry, Zombie
+
+FLASH_WARNING_TIME = 3.0
+
+
+class _FakeLabel:
+    """Stand-in for a pooled label (only text / x / y / hidden are used)."""
+
+    def __init__(self):
+        self.text = "Z"
+        self.x = 0
+        self.y = 0
+        self.hidden = True
+
+
+def _heap_used():
+    if hasattr(gc, "mem_alloc"):
+        return gc.mem_alloc()
+    import tracemalloc   # CPython: no gc.mem_alloc()
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def _bytes_per(make, n=50):
+    gc.collect()
+    before = _heap_used()
+    keep = [make(i) for i in range(n)]
+    used = _heap_used() - before
+    del keep
+    return used // n
+
+
+def _make_dict(i):
+    return {
+        "label": None, "x": i, "y": i, "spawn_time": 0.5 * i, "lifetime": 3.0 + i,
+        "type": "Z", "hp": 1, "max_hp": 1, "dead": False,
+    }
+
+
+# ----- old: list of dicts, copy per frame, `in` + list.remove -----
+
+def _old_frame(zombies, now, lifetime, count):
+    for z in zombies[:]:
+        if z["dead"]:
+            continue
+        age = now - z["spawn_time"]
+        if age >= z["lifetime"]:
+            if z in zombies:
+                z["dead"] = True
+                z["label"].hidden = True
+                zombies.remove(z)
+            continue
+        warn_time = min(FLASH_WARNING_TIME, z["lifetime"])
+        if age >= z["lifetime"] - warn_time:
+            z["label"].hidden = (int((age - (z["lifetime"] - warn_time)) * 6) % 2 == 1)
+        else:
+            z["label"].hidden = False
+    while len(zombies) < count:
+        zombies.append({
+            "label": _FakeLabel(), "x": 10, "y": 30, "spawn_time": now,
+            "lifetime": lifetime * random.random(), "type": "Z", "hp": 1, "max_hp": 1,
+            "dead": False,
+        })
+
+
+# ----- new: registry, backwards walk + swap-remove -----
+
+def _new_frame(reg, now, lifetime, count):
+    active = reg.active
+    i = len(active) - 1
+    while i >= 0:
+        z = active[i]
+        i -= 1
+        age = now - z.spawn_time
+        if age >= z.lifetime:
+            reg.remove(z)
+            continue
+        warn_time = min(FLASH_WARNING_TIME, z.lifetime)
+        if age >= z.lifetime - warn_time:
+            z.label.hidden = (int((age - (z.lifetime - warn_time)) * 6) % 2 == 1)
+        else:
+            z.label.hidden = False
+    while len(reg) < count:
+        reg.spawn("Z", 10, 30, now, lifetime * random.random())
+
+
+def run(counts=(5, 32), frames=2000, frame_dt=0.025, lifetime=2.0):
+    dict_bytes = _bytes_per(_make_dict)
+    slot_bytes = _bytes_per(lambda i: Zombie(i, None))
+    print("bytes/zombie dict={} slots={}".format(dict_bytes, slot_bytes))
+    results = {"dict_bytes": dict_bytes, "slots_bytes": slot_bytes, "frames": []}
+
+    for n in counts:
+        old = []
+        t0 = time.monotonic_ns()
+        for f in range(frames):
+            _old_frame(old, f * frame_dt, lifetime, n)
+        old_us = (time.monotonic_ns() - t0) // 1000 / frames
+
+        reg = ZombieRegistry([_FakeLabel() for _ in range(n)])
+        t0 = time.monotonic_ns()
+        for f in range(frames):
+            _new_frame(reg, f * frame_dt, lifetime, n)
+        new_us = (time.monotonic_ns() - t0) // 1000 / frames
+
+        print("zombies={} frame_us old={:.1f} new={:.1f}".format(n, old_us, new_us))
+        results["frames"].append({"zombies": n, "old_us": old_us, "new_us": new_us})
+    return results
+
+
+if __name__ == "__main__":
+    run()
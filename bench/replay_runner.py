@@ -0,0 +1,16 @@
+# replay_runner.py
+#
+# 设备上回放一局：把这个文件复制成 code.py（先备份原来的 code.py；bench/ 不随游戏部署，
+# 要手动复制），重启，从串口看结果。
+# trace 是 game.py 里 RECORD_TRACE = True 时录下的 trace.bin（也可以是电脑上录的，复制到 CIRCUITPY）。
+# FAST = True: 不刷屏、不放音效，逻辑帧一帧接一帧跑，打印每帧逻辑耗时（时序回归检查用）
+# FAST = False: 按正常 40 Hz 任务节奏回放，屏幕 / 音效都有
+# PROFILE = True: 最后打印每个阶段的耗时（profiler.py）
+import game
+
+TRACE = "trace.bin"
+FAST = True
+PROFILE = False
+
+game.prof.on = PROFILE
+game.replay_trace(TRACE, fast=FAST)
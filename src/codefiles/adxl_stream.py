@@ -0,0 +1,111 @@
+# adxl_stream.py
+import time
+import struct
+from adafruit_bus_device.i2c_device import I2CDevice
+
+_REG_DATAX0 = 0x32
+_REG_FIFO_CTL = 0x38
+_REG_FIFO_STATUS = 0x39
+_FIFO_STREAM = 0b10 << 6       # FIFO_CTL D7:D6 = 10: stream mode (keeps the newest 32 samples)
+_FIFO_ENTRIES_MASK = 0x3F
+SCALE = 0.004 * 9.80665        # full resolution: 4 mg/LSB -> m/s^2 (same as adafruit_adxl34x)
+
+# BW_RATE code -> output data rate (Hz)
+RATE_HZ = {
+    6: 6.25, 7: 12.5, 8: 25, 9: 50, 10: 100,
+    11: 200, 12: 400, 13: 800, 14: 1600, 15: 3200,
+}
+
+
+class AccelStream:
+    """
+    AccelStream(accelerometer, i2c, *, data_rate, g_range, address=0x53, watermark=16)
+
+    ADXL345 in FIFO stream mode: the chip buffers every sample at `data_rate`,
+    drain() reads everything that piled up since the last call.
+    - accelerometer: adafruit_adxl34x.ADXL345 (used for init, data_rate and range)
+    - data_rate / g_range: adafruit_adxl34x.DataRate.* / Range.* constants
+    - drain(on_sample, raw=False): calls on_sample(x, y, z) in m/s^2 for each buffered
+      sample, oldest first, all under one I2C bus lock; returns the sample count.
+      raw=True passes the integer counts instead (x SCALE = m/s^2), no float math.
+    - flush(): drop everything buffered so far (call before aiming starts again)
+    - report(): samples per frame and I2C time per frame since reset_stats()
+    Every FIFO entry is its own 6-byte read from DATAX0 (the chip pops one entry per read),
+    so a frame costs 1 FIFO_STATUS read + one read per sample.
+    """
+
+    def __init__(self, accelerometer, i2c, *, data_rate, g_range, address=0x53, watermark=16):
+        accelerometer.data_rate = data_rate
+        accelerometer.range = g_range
+        self.rate_hz = RATE_HZ.get(data_rate, 100)
+
+        self._dev = I2CDevice(i2c, address)
+        self._cmd = bytearray(1)
+        self._reg = bytearray(2)
+        self._status = bytearray(1)
+        self._buf = bytearray(6)
+
+        self._fifo_ctl = _FIFO_STREAM | (watermark & 0x1F)
+        self.flush()
+        self.reset_stats()
+
+    def _write_fifo_ctl(self, value):
+        self._reg[0] = _REG_FIFO_CTL
+        self._reg[1] = value
+        with self._dev as dev:
+            dev.write(self._reg)
+
+    def flush(self):
+        """Drop stale samples (e.g. buffered during a menu): bypass mode clears the FIFO."""
+        self._write_fifo_ctl(0)
+        self._write_fifo_ctl(self._fifo_ctl)
+
+    def reset_stats(self):
+        self.frames = 0
+        self.samples = 0
+        self.max_samples = 0
+        self.empty_frames = 0
+        self.i2c_ns = 0
+        self.max_i2c_ns = 0
+        self.errors = 0
+
+    def drain(self, on_sample, raw=False):
+        t0 = time.monotonic_ns()
+        n = 0
+        try:
+            with self._dev as dev:
+                self._cmd[0] = _REG_FIFO_STATUS
+                dev.write_then_readinto(self._cmd, self._status)
+                entries = self._status[0] & _FIFO_ENTRIES_MASK
+
+                self._cmd[0] = _REG_DATAX0
+                buf = self._buf
+                for _ in range(entries):
+                    dev.write_then_readinto(self._cmd, buf)
+                    x, y, z = struct.unpack_from("<hhh", buf)
+                    if raw:
+                        on_sample(x, y, z)
+                    else:
+                        on_sample(x * SCALE, y * SCALE, z * SCALE)
+                    n += 1
+        except OSError:
+            # I2C 偶尔出错：这一帧不更新，准星停在原处（不再归零跳动）
+            self.errors += 1
+
+        dt = time.monotonic_ns() - t0
+        self.frames += 1
+        self.samples += n
+        if n > self.max_samples:
+            self.max_samples = n
+        if n == 0:
+            self.empty_frames += 1
+        self.i2c_ns += dt
+        if dt > self.max_i2c_ns:
+            self.max_i2c_ns = dt
+        return n
+
+    def report(self):
+        frames = max(1, self.frames)
+        return "Accel FIFO {} Hz: {:.2f} samples/frame (max {}, empty {}), I2C {:.2f} ms/frame (max {:.2f} ms), errors {}".format(
+            self.rate_hz, self.samples / frames, self.max_samples, self.empty_frames,
+            self.i2c_ns / frames / 1000000, self.max_i2c_ns / 1000000, self.errors)
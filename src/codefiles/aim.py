@@ -0,0 +1,67 @@
+# aim.py
+#
+# 定点瞄准管线：ESP32-C3 (RISC-V) 没有 FPU，每个浮点乘法 / 除法都是软件模拟
+#   输入：ADXL345 原始计数（4 mg/LSB，AccelStream.drain(raw=True)），不换算成 m/s^2
+#   滤波：EMA，状态是 Q4（1/16 计数），alpha 是 Q12，带四舍五入
+#   映射：整数 clamp + 乘除，结果和原来的 int(float) 版本最多差 1 像素
+# 乘积最大 ±16 g 的计数 * 16 * 4096 < 2^30：一直是 small int，不分配内存
+
+AIM_FRAC_BITS = 4      # filter state: counts * 16
+ALPHA_BITS = 12        # alpha: * 4096
+_ALPHA_ROUND = 1 << (ALPHA_BITS - 1)
+
+
+def to_q(ms2, scale):
+    """m/s^2 -> filter units (Q4 counts); scale = m/s^2 per count."""
+    return int(round(ms2 / scale * (1 << AIM_FRAC_BITS)))
+
+
+def map_to_range(value, in_min, in_max, out_min, out_max):
+    """Clamp value to [in_min, in_max] and scale to an int in [out_min, out_max] (all ints, no floats)."""
+    if value < in_min:
+        value = in_min
+    if value > in_max:
+        value = in_max
+    return out_min + (value - in_min) * (out_max - out_min) // (in_max - in_min)
+
+
+class AimFilter:
+    """
+    AimFilter(sample_alpha, scale, x_range, y_range, screen_x, screen_y)
+
+    Integer low-pass filter + screen mapping for the crosshair.
+    - sample_alpha: EMA strength per accelerometer sample (float, converted once)
+    - scale: m/s^2 per accelerometer count (adxl_stream.SCALE)
+    - x_range / y_range: (min, max) tilt in m/s^2 mapped to the screen edges
+      (y is inverted: tilting forward moves the crosshair up)
+    - screen_x / screen_y: (min, max) crosshair pixels
+    - feed(x, y, z): one sample in counts (AccelStream.drain(..., raw=True) callback)
+    - reset(): filter back to level (0, 0)
+    - px() / py(): crosshair position
+    """
+
+    def __init__(self, sample_alpha, scale, x_range, y_range, screen_x, screen_y):
+        self.alpha_q = int(sample_alpha * (1 << ALPHA_BITS) + 0.5)
+        self.x_min_q = to_q(x_range[0], scale)
+        self.x_max_q = to_q(x_range[1], scale)
+        self.y_min_q = to_q(y_range[0], scale)
+        self.y_max_q = to_q(y_range[1], scale)
+        self.screen_x = screen_x
+        self.screen_y = screen_y
+        self.x_q = 0
+        self.y_q = 0
+
+    def reset(self):
+        self.x_q = 0
+        self.y_q = 0
+
+    def feed(self, x, y, z):
+        a = self.alpha_q
+        self.x_q += (a * ((x << AIM_FRAC_BITS) - self.x_q) + _ALPHA_ROUND) >> ALPHA_BITS
+        self.y_q += (a * ((y << AIM_FRAC_BITS) - self.y_q) + _ALPHA_ROUND) >> ALPHA_BITS
+
+    def px(self):
+        return map_to_range(self.x_q, self.x_min_q, self.x_max_q, self.screen_x[0], self.screen_x[1])
+
+    def py(self):
+        return map_to_range(-self.y_q, self.y_min_q, self.y_max_q, self.screen_y[0], self.screen_y[1])
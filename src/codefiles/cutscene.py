@@ -0,0 +1,448 @@
+# cutscene.py
+#
+# 剧情 / 教程文字页 / 彩蛋共用的过场动画引擎
+#   以前每个画面自己 new Group + 一堆 Label，自己写阻塞的闪烁 / 抖动 / 滚动循环；
+#   现在画面只是一段脚本（一串 tuple），由同一个 Cutscene 播放：
+#   - 全部显示对象开机时建好一次：ROWS 个文字 label、一块 ASCII 小图 TileGrid、
+#     光标 N、一个角色、LANES 条“僵尸队列”（每条一个 Group，整组移动，不是一个个 label 挪）
+#   - update(now) 每帧推进一点，从不 sleep；play() 是阻塞的便利函数
+#   - 每段过场记下帧数、峰值堆占用（开始时读 mem_free，之后每帧 mem_free）和播完留下的字节；
+#     跟 heapwatch 一样只有 inp.heap.collect（分析内存的时候）才在开始 / 结束时 gc.collect()
+#
+# 脚本指令（op, args...）：
+#   ("screen", name)                  结束上一个 InputManager 画面（CPU / 堆统计），开始新的
+#   文字 text：story.bin 里的 id（textids.SECTION + n，textpack.py），或者直接一个字符串
+#   layout：None = 整段文字一个多行 label（在 0, 8）；或者 ((x, y), ...)：每行一个 label
+#   ("text", text, layout)            显示文字，不等待
+#   ("page", text, layout)            显示文字，等按钮
+#   ("pages", first, count, layout)   第 first .. first + count - 1 条文字，每条一页，按一次翻一页
+#   ("press",)                        等按钮
+#   ("wait", seconds, press_ends)     停 seconds 秒；press_ends=True 时按钮提前结束
+#   ("slide", row, text, x0, x1, y, seconds)   第 row 行文字 seconds 秒内从 x0 移到 x1
+#   ("style", flags)                  CURSOR: 等按钮时右下角 N 闪烁；GLITCH: 抖动 + 文字闪 + 杂音
+#   ("art", lines, x, y) / ("art", None)       ASCII 小图（精灵 tile，label 坐标）
+#   ("actor", ch, x, y)               一个左右晃动的角色（跑步）；("actor", None) 隐藏
+#   ("lane", i, ch, count, x, y0, dy, speed)   第 i 条队列：count 个 ch 竖排，整组以 speed px/s 横向循环移动
+#   ("music", tune, priority)         music.Tune 交给蜂鸣器音乐引擎（effects.music，不阻塞）；
+#                                     priority 省略 = MUSIC（任何音效都能盖过它）
+#   ("clear",)                        文字、小图、角色、队列全部隐藏
+import gc
+import random
+import time
+
+import displayio
+import terminalio
+from adafruit_display_text import label
+from inputs import TICK, BTN
+from music import MUSIC
+
+ROWS = 6                  # text labels (tutorial page: title + 3 lines + hint)
+ART_W = 4                 # ASCII art grid, in tiles
+ART_H = 3
+LANES = 2
+LANE_SPRITES = 5
+
+CURSOR = 1
+GLITCH = 2
+
+BLINK_TIME = 0.3          # cursor N on / off
+SHAKE_TIME = 0.1          # GLITCH: screen moves by up to 1 px this often
+FLICKER_CHANCE = 0.03     # GLITCH: text hidden on this share of frames
+LANE_MIN_X = -10          # lanes wrap around between these x
+LANE_MAX_X = 138
+
+_IDLE = 0
+_PRESS = 1
+_WAIT = 2
+_SLIDE = 3
+
+
+class Cutscene:
+    """
+    Cutscene(display, inp, effects, sheet, texts=None)
+
+    Plays cutscene scripts (see the op list at the top of cutscene.py) on one set of
+    display objects built here, once. texts: textpack.TextPack for text ids.
+    - play(script, name, setup=(), skip_hold=None): blocking, returns "button" if skipped
+    - start(...) + update(now) each frame: the same without blocking (update() returns
+      False when the script is done, the reason is in .result)
+    - setup: jobs run one per frame while the cutscene plays (the rest when it ends)
+    - skip_hold: holding BTN this long ends the whole script with result "button"
+    - stats: name -> (frames, peak heap bytes, bytes kept) of the last run; report()
+    """
+
+    def __init__(self, display, inp, effects, sheet, texts=None):
+        self._display = display
+        self._inp = inp
+        self._effects = effects
+        self._sheet = sheet
+        self._texts = texts
+        self.stats = {}
+
+        self.group = displayio.Group()
+
+        self._text = displayio.Group()
+        self._rows = []
+        for _ in range(ROWS):
+            lbl = label.Label(terminalio.FONT, text="", x=0, y=0)
+            lbl.hidden = True
+            self._text.append(lbl)
+            self._rows.append(lbl)
+        self.group.append(self._text)
+
+        art = sheet.layer()
+        self._art = sheet.art([" " * ART_W] * ART_H)
+        self._art.hidden = True
+        art.append(self._art)
+        self.group.append(art)
+
+        layer = sheet.layer()
+        self._cursor = sheet.sprite("N", 118, 60)
+        self._actor = sheet.sprite("@")
+        layer.append(self._cursor)
+        layer.append(self._actor)
+        self._lanes = []
+        for _ in range(LANES):
+            lane = displayio.Group()
+            for _ in range(LANE_SPRITES):
+                lane.append(sheet.sprite("Z"))
+            layer.append(lane)
+            # [group, speed px/s, start x, start time]
+            self._lanes.append([lane, 0, 0, 0.0])
+        self.group.append(layer)
+
+        # every attribute is set here, so playing never grows the object's dict
+        self.running = False
+        self.result = None
+        self._name = None
+        self._script = ()
+        self._pc = 0
+        self._step = _IDLE
+        self._jobs = []
+        self._skip_hold = None
+        self._down_since = None
+        self._screen = None
+        self._until = 0.0
+        self._press_ends = False
+        self._slide = None
+        self._page = 0
+        self._page_end = 0
+        self._page_layout = None
+        self._blink_at = 0.0
+        self._cursor_on = False
+        self._free0 = 0
+        self._low = 0
+        self._frames = 0
+        self._clear()
+
+    # ---------- playing ----------
+
+    def play(self, script, name, setup=(), skip_hold=None):
+        inp = self._inp
+        self.start(script, name, setup, skip_hold)
+        while True:
+            inp.tick()
+            if not self.update(inp.now):
+                break
+            inp.idle(TICK)
+        return self.result
+
+    def _collect(self):
+        heap = self._inp.heap
+        if heap is not None and heap.collect:
+            gc.collect()
+
+    def start(self, script, name, setup=(), skip_hold=None):
+        self._collect()
+        self._free0 = gc.mem_free()
+        self._low = self._free0
+        self._frames = 0
+
+        self._name = name
+        self._script = script
+        self._pc = 0
+        self._jobs = list(setup)
+        self._skip_hold = skip_hold
+        self._down_since = None
+        self._screen = None
+        self.result = None
+        self.running = True
+
+        self._clear()
+        self._display.root_group = self.group
+        self._inp.begin_screen()
+        self._next(time.monotonic())
+
+    def update(self, now):
+        """One frame (after inp.tick()). Never sleeps."""
+        if not self.running:
+            return False
+        self._frames += 1
+        free = gc.mem_free()
+        if free < self._low:
+            self._low = free
+        if self._jobs:
+            self._jobs.pop(0)()
+
+        inp = self._inp
+        if self._skip_hold is not None:
+            if not inp.is_down(BTN):
+                self._down_since = None
+            elif self._down_since is None:
+                self._down_since = now
+            elif now - self._down_since >= self._skip_hold:
+                self._finish("button")
+                return False
+
+        self._animate(now)
+        step = self._step
+        if step == _PRESS:
+            if inp.pressed():
+                self._page += 1
+                if self._page < self._page_end:
+                    # ("pages", ...): next text, same op
+                    self._show(self._page, self._page_layout)
+                    self._wait_press(now)
+                else:
+                    self._next(now)
+        elif step == _WAIT:
+            if now >= self._until or (self._press_ends and inp.pressed()):
+                self._next(now)
+        elif step == _SLIDE:
+            if now >= self._until:
+                self._next(now)
+
+        self._effects.update(now)
+        return self.running
+
+    def _next(self, now):
+        """Run instant ops up to the next one that takes time (or the end of the script)."""
+        script = self._script
+        self._cursor.hidden = True
+        while self._pc < len(script):
+            op = script[self._pc]
+            self._pc += 1
+            kind = op[0]
+            if kind == "page":
+                self._page_end = 0
+                self._show(op[1], op[2] if len(op) > 2 else None)
+                self._wait_press(now)
+                return
+            if kind == "pages":
+                self._page = op[1]
+                self._page_end = op[1] + op[2]
+                self._page_layout = op[3] if len(op) > 3 else None
+                self._show(self._page, self._page_layout)
+                self._wait_press(now)
+                return
+            if kind == "press":
+                self._wait_press(now)
+                return
+            if kind == "wait":
+                self._step = _WAIT
+                self._until = now + op[1]
+                self._press_ends = op[2]
+                return
+            if kind == "slide":
+                _, row, text, x0, x1, y, seconds = op
+                lbl = self._rows[row]
+                if not isinstance(text, str):
+                    text = self._texts.text(text)
+                self._set_row(lbl, x0, y, text)
+                self._slide = (lbl, x0, x1, now, seconds)
+                self._step = _SLIDE
+                self._until = now + seconds
+                return
+            if kind == "text":
+                self._show(op[1], op[2] if len(op) > 2 else None)
+            elif kind == "screen":
+                if self._screen is not None:
+                    self._inp.end_screen(self._screen)
+                    self._inp.begin_screen()
+                self._screen = op[1]
+            elif kind == "style":
+                self._flags = op[1]
+            elif kind == "art":
+                self._set_art(op)
+            elif kind == "actor":
+                self._set_actor(op, now)
+            elif kind == "lane":
+                self._set_lane(op, now)
+            elif kind == "music":
+                self._effects.music.play(op[1], op[2] if len(op) > 2 else MUSIC)
+            elif kind == "clear":
+                self._clear()
+            else:
+                raise ValueError("unknown cutscene op: " + kind)
+        self._finish(None)
+
+    def _finish(self, result):
+        self.running = False
+        self.result = result
+        self._step = _IDLE
+        for job in self._jobs:
+            job()
+        self._jobs = []
+        if result == "button":
+            self._effects.stop()
+        else:
+            self._effects.finish()
+        self.group.x = 0
+        self.group.y = 0
+        self._text.hidden = False
+        # 剧情文字也从 label 里拿掉：两个画面之间 RAM 里不留剧情字符串
+        for lbl in self._rows:
+            if lbl.text:
+                lbl.text = ""
+        if self._screen is not None:
+            self._inp.end_screen(self._screen)
+
+        self._collect()
+        self.stats[self._name] = (self._frames, self._free0 - self._low, self._free0 - gc.mem_free())
+        print(self.report(self._name))
+
+    # ---------- per frame ----------
+
+    def _wait_press(self, now):
+        self._step = _PRESS
+        self._blink_at = now
+        self._cursor_on = False
+        self._cursor.hidden = not self._flags & CURSOR
+
+    def _animate(self, now):
+        if self._step == _SLIDE:
+            lbl, x0, x1, t0, seconds = self._slide
+            lbl.x = x1 if now >= self._until else x0 + int((now - t0) * (x1 - x0) / seconds)
+
+        for lane in self._lanes:
+            group, speed, x0, t0 = lane
+            if speed and not group.hidden:
+                span = LANE_MAX_X - LANE_MIN_X
+                group.x = LANE_MIN_X + (x0 - LANE_MIN_X + int((now - t0) * speed)) % span
+
+        if not self._actor.hidden:
+            # 左右晃 1 px，像在跑
+            self._actor.x = self._actor_x + int((now - self._actor_t) * 10) % 3 - 1
+
+        flags = self._flags
+        if self._step == _PRESS and flags & CURSOR and now >= self._blink_at:
+            self._blink_at = now + BLINK_TIME
+            self._cursor_on = not self._cursor_on
+            self._cursor.hidden = not self._cursor_on
+            if flags & GLITCH:
+                # 每次闪烁顺便来一下短促的杂音
+                self._effects.music.beep(random.randint(300, 2000), 30, 30)
+        if flags & GLITCH:
+            if now >= self._shake_at:
+                self._shake_at = now + SHAKE_TIME
+                self.group.x = random.randint(-1, 1)
+                self.group.y = random.randint(-1, 1)
+            self._text.hidden = random.random() < FLICKER_CHANCE
+        elif self.group.x or self.group.y:
+            self.group.x = 0
+            self.group.y = 0
+            self._text.hidden = False
+
+    # ---------- display objects ----------
+
+    def _set_row(self, lbl, x, y, text):
+        # only touch .text when it changes: a label re-renders on every text assignment
+        if lbl.text != text:
+            lbl.text = text
+        lbl.x = x
+        lbl.y = y
+        lbl.hidden = False
+
+    def _show(self, text, layout=None):
+        """Text id (or str) on the row labels: one multi-line label, or one label per line."""
+        texts = self._texts
+        rows = self._rows
+        if layout is None:
+            if not isinstance(text, str):
+                text = texts.text(text)
+            self._set_row(rows[0], 0, 8, text)
+            used = 1
+        else:
+            if len(layout) > ROWS:
+                raise ValueError("cutscene layout has more than {} rows".format(ROWS))
+            lines = text.split("\n") if isinstance(text, str) else texts.lines(text)
+            used = 0
+            for line in lines:
+                if used < len(layout):
+                    x, y = layout[used]
+                    self._set_row(rows[used], x, y, line)
+                used += 1
+            used = min(used, len(layout))
+        for i in range(used, ROWS):
+            rows[i].hidden = True
+
+    def _set_art(self, op):
+        grid = self._art
+        if op[1] is None:
+            grid.hidden = True
+            return
+        _, lines, x, y = op
+        tile = self._sheet.tile
+        for row in range(ART_H):
+            line = lines[row] if row < len(lines) else ""
+            for col in range(ART_W):
+                grid[col, row] = tile(line[col]) if col < len(line) else 0
+        grid.x = x
+        grid.y = y
+        grid.hidden = False
+
+    def _set_actor(self, op, now):
+        actor = self._actor
+        if op[1] is None:
+            actor.hidden = True
+            return
+        _, ch, x, y = op
+        actor[0] = self._sheet.tile(ch)
+        self._actor_x = x
+        actor.x = x
+        actor.y = y
+        actor.hidden = False
+        self._actor_t = now
+
+    def _set_lane(self, op, now):
+        _, i, ch, count, x, y0, dy, speed = op
+        lane = self._lanes[i]
+        group = lane[0]
+        tile = self._sheet.tile(ch)
+        for k, sprite in enumerate(group):
+            sprite[0] = tile
+            sprite.y = y0 + k * dy
+            sprite.hidden = k >= count
+        group.x = x
+        group.hidden = False
+        lane[1] = speed
+        lane[2] = x
+        lane[3] = now
+
+    def _clear(self):
+        for lbl in self._rows:
+            lbl.hidden = True
+        self._art.hidden = True
+        self._cursor.hidden = True
+        self._actor.hidden = True
+        for lane in self._lanes:
+            lane[0].hidden = True
+            lane[1] = 0
+        self._flags = 0
+        self._shake_at = 0.0
+        self._actor_t = 0.0
+        self._actor_x = 0
+        self.group.x = 0
+        self.group.y = 0
+        self._text.hidden = False
+
+    # ---------- measurement ----------
+
+    def report(self, name=None):
+        """Cutscene Boot story: 812 frames, peak +1536 B, kept +0 B  (all names if name is None)"""
+        names = (name,) if name is not None else tuple(self.stats)
+        lines = []
+        for n in names:
+            frames, peak, kept = self.stats[n]
+            lines.append("Cutscene {}: {} frames, peak +{} B, kept {:+d} B".format(n, frames, peak, kept))
+        return "\n".join(lines)
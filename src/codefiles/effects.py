@@ -0,0 +1,112 @@
+# effects.py
+import time
+
+from music import SFX
+
+
+class EffectScheduler:
+    """
+    EffectScheduler(pixel, motor, music=None)
+
+    Non-blocking feedback queue for the NeoPixel and vibration motor; also drives the
+    buzzer's music engine (music.Music), so one update() advances every output.
+
+    - play(steps, priority=SFX): start one effect now. steps is a list of
+      (offset_s, target, value), in time order:
+        "pixel" -> (r, g, b)
+        "motor" -> True / False
+      Same rules as music.Music.play(): the new effect replaces the steps still
+      queued from one of the same or lower priority (pixel / motor switched off first),
+      and is dropped (returns False, counted in .dropped) while a higher one plays.
+      So the light stays in step with the effect's sound; nothing sleeps, update()
+      applies the steps that are due.
+      Sounds are Tunes played on `music` (effects.music.play / beep).
+    - update(now): call once per frame; steps `music` too.
+    - busy() / run_for() / finish() / stop() cover the music as well.
+    - muted: play() drops effects (fast-forward replay: nothing calls update()).
+    """
+
+    def __init__(self, pixel, motor, music=None):
+        self._pixel = pixel
+        self._motor = motor
+        self.music = music
+
+        # (due_time, target, value) of the effect playing now, sorted by due_time
+        self._steps = []
+        self._priority = SFX
+        self.dropped = 0
+        self.muted = False
+
+    def play(self, steps, priority=SFX):
+        """Start an effect now, cutting off a queued one of the same or lower priority."""
+        if self.muted:
+            return False
+        if self._steps:
+            if self._priority > priority:
+                self.dropped += 1
+                return False
+            # 旧效果剩下的步骤作废；它可能正亮着 / 正震着，先关掉
+            self._steps = []
+            self._pixel[0] = (0, 0, 0)
+            self._pixel.show()
+            self._motor.value = False
+        now = time.monotonic()
+        self._priority = priority
+        for offset, target, value in steps:
+            self._steps.append((now + offset, target, value))
+        return True
+
+    def busy(self):
+        return len(self._steps) > 0 or (self.music is not None and self.music.busy())
+
+    def update(self, now=None):
+        """Apply every step whose time has come. Never sleeps."""
+        if now is None:
+            now = time.monotonic()
+        if self.music is not None and self.music.busy():
+            self.music.update(now)
+        if not self._steps:
+            return
+
+        pixel_dirty = False
+        while self._steps and self._steps[0][0] <= now:
+            _, target, value = self._steps.pop(0)
+            if target == "pixel":
+                self._pixel[0] = value
+                pixel_dirty = True
+            elif target == "motor":
+                self._motor.value = value
+
+        # 一帧只推一次 NeoPixel
+        if pixel_dirty:
+            self._pixel.show()
+
+    def _pending(self):
+        return len(self._steps) > 0 or (self.music is not None and self.music.pending())
+
+    def run_for(self, seconds):
+        """
+        Blocking helper for screens outside the game loop (tutorial, end of game):
+        keep effects running for at least `seconds`, and until the queue is empty
+        (looping background music does not count).
+        """
+        end = time.monotonic() + seconds
+        while True:
+            now = time.monotonic()
+            self.update(now)
+            if now >= end and not self._pending():
+                break
+            time.sleep(0.01)
+
+    def finish(self):
+        """Play out everything still queued (blocking)."""
+        self.run_for(0)
+
+    def stop(self):
+        """Drop queued steps and switch all outputs off."""
+        self._steps = []
+        self._pixel[0] = (0, 0, 0)
+        self._pixel.show()
+        self._motor.value = False
+        if self.music is not None:
+            self.music.stop()
@@ -0,0 +1,1451 @@
+import time
+import gc
+import os
+
+# time.monotonic_ns() counts from power-on: how long the board took to get to code.py
+BOOT_IMPORT_NS = time.monotonic_ns()
+
+import board
+import busio
+try:
+    import supervisor       # run_reason: skip the boot story after an auto-reload
+except ImportError:
+    supervisor = None
+import displayio
+import terminalio
+import digitalio
+from adafruit_display_text import label
+import i2cdisplaybus
+import adafruit_displayio_ssd1306
+import adafruit_adxl34x
+
+import neopixel
+import pwmio
+import ui
+
+from rotary_encoder import RotaryEncoder
+from inputs import InputManager, PRESS, HOLD, EDGE, TURN, BTN, TOUCH, SOUND, TICK
+from effects import EffectScheduler
+from music import Music, Tune, REST, SFX, ALERT
+from pacer import TickTimer
+from runtime import Runtime
+from adxl_stream import AccelStream, SCALE as ACCEL_SCALE
+from aim import AimFilter, map_to_range
+from hitindex import HitIndex, in_hitbox
+from zombie_registry import ZombieRegistry
+from replay import TraceWriter, TraceReader
+from heapwatch import HeapMonitor
+from profiler import PhaseProfiler
+import sprites
+from cutscene import Cutscene
+from textids import TUTORIAL
+from textpack import TextPack
+import lazy
+
+# imported on first use, not at boot (lazy.load):
+#   menu, score                 menus, leaderboard (stay loaded afterwards)
+#   NameInput, easter, easter2  name input, no-shot egg, all-levels-cleared egg:
+#                               rarely reached, unloaded again when their screen is done
+
+
+# ========== 0. CONSTANTS ==========
+
+GAME_DURATION = 10.0       # seconds per level
+MAX_HP = 3                 # player HP
+MAX_LEVEL = 10             # 10 levels per difficulty
+FLASH_WARNING_TIME = 3.0   # last seconds flashing before zombie disappears
+FRAME_PERIOD = 0.025       # game logic + display refresh period (40 FPS), same on every difficulty
+INPUT_PERIOD = 0.01        # button / touch / sound sampling task (100 Hz)
+EFFECTS_PERIOD = 0.005     # NeoPixel / motor / buzzer effect task
+LEVEL_BANNER_TIME = 1.2    # "LEVEL X" banner (game logic pauses, other tasks keep running)
+
+# the game logic counts time in whole ms: integer math, no soft-float on the ESP32-C3
+GAME_DURATION_MS = int(GAME_DURATION * 1000)
+FLASH_WARNING_MS = int(FLASH_WARNING_TIME * 1000)
+LEVEL_BANNER_MS = int(LEVEL_BANNER_TIME * 1000)
+SHIELD_INFO_MS = 100       # "SHIELD UP!" message
+
+# fingerprint unlock on/off
+FINGERPRINT_UNLOCK_ENABLED = True
+
+# record every game's inputs + RNG seed to TRACE_FILE (overwritten each game, needs a
+# writable CIRCUITPY like the leaderboard); play it back with replay_trace() / bench/replay_runner.py
+RECORD_TRACE = False
+TRACE_FILE = "trace.bin"
+
+# per-phase frame profiler (profiler.py): summary on the serial console at game over.
+# Switch at runtime: hold the touch pad while choosing SETTINGS (or game.prof.on = True in the REPL)
+PROFILE_PHASES = False
+
+# heap profiling run: gc.collect() on every screen in / out, so the "Heap screens" line
+# counts live data only (otherwise it just reads mem_free: no stall on screen changes).
+# Switch at runtime: game.heap.collect = True in the REPL
+PROFILE_HEAP = False
+
+# gameplay glyphs (zombies, crosshair, the tutorial's practice Z / S / T): one terminalio
+# label each, or with True 1-bit sprite sheet tiles (sprites.py). Labels stay the default
+# until bench/bench.py "render" bytes / times from the device show the sprites are cheaper (on the
+# host the sprite group is the bigger one). Cutscenes (boot story, tutorial pages, easter
+# eggs) always use the sprite sheet: their art, cursor and horde only exist as tiles.
+GAMEPLAY_SPRITES = False
+
+# boot: straight to the menu (no melody, title or story) when this file exists on
+# CIRCUITPY, or when code.py was restarted by a file save (auto-reload while tuning).
+# Holding the button during the title does the same for one boot.
+BOOT_SKIP_FILE = "skip_boot"
+BOOT_SKIP_ON_RELOAD = True
+
+# tutorial only once per power-on
+tutorial_shown = False
+
+# 每难度、每一关僵尸停留时间（秒）——你可以自己改
+ZOMBIE_LIFETIME_TABLE = {
+    "EASY":      [8, 8, 7.5, 7.5, 7, 6.5, 6, 5.5, 5, 4.5],
+    "NORMAL":    [7, 6.5, 6, 5.5, 5, 4.5, 4, 3.7, 3.4, 3],
+    "DIFFICULT": [5, 4.5, 4, 3.5, 3, 2.8, 2.6, 2.4, 2.2, 2],
+}
+
+
+# ========== LEVEL CONFIG HELPER ==========
+
+def get_level_config(difficulty, level_index):
+    """
+    Return parameters for a given difficulty + level:
+      - max_on_screen: max zombies on screen (only depends on difficulty)
+      - spawn_interval: spawn interval (seconds, only depends on difficulty)
+      - zombie_lifetime: how long each zombie stays (seconds, depends on level)
+      - spawn_interval_ms / zombie_lifetime_ms: the same in whole ms (used by the game logic)
+      - hp_bonus: extra HP (here always 0, all zombies = 1 HP)
+      - boss: True if this is the boss level (level 10)
+    """
+
+    # 同屏数量 & 刷新速度：只随难度变化
+    if difficulty == "EASY":
+        max_on_screen  = 3      # fewer zombies on screen
+        spawn_interval = 2.5    # slower spawn
+    elif difficulty == "NORMAL":
+        max_on_screen  = 4
+        spawn_interval = 1.8
+    else:  # DIFFICULT
+        max_on_screen  = 5      # more zombies
+        spawn_interval = 1.2    # much faster spawn
+
+    # 僵尸停留时间：由上面的表 + 当前关卡决定
+    lifetime_list = ZOMBIE_LIFETIME_TABLE[difficulty]
+    zombie_lifetime = lifetime_list[level_index - 1]  # level_index is 1-based
+
+    # 所有僵尸 1 血，不再有多血僵尸
+    hp_bonus = 0
+
+    boss = (level_index == MAX_LEVEL)
+
+    return {
+        "max_on_screen": max_on_screen,
+        "spawn_interval": spawn_interval,
+        "zombie_lifetime": zombie_lifetime,
+        "spawn_interval_ms": int(spawn_interval * 1000 + 0.5),
+        "zombie_lifetime_ms": int(zombie_lifetime * 1000 + 0.5),
+        "hp_bonus": hp_bonus,
+        "boss": boss,
+    }
+
+
+# ========== 1. DISPLAY & I2C INIT ==========
+
+displayio.release_displays()
+
+i2c = busio.I2C(board.SCL, board.SDA)  # OLED + ADXL345 share I2C
+
+display_bus = i2cdisplaybus.I2CDisplayBus(i2c, device_address=0x3C)
+display = adafruit_displayio_ssd1306.SSD1306(display_bus, width=128, height=64)
+
+
+# ========== 2. SENSORS / IO ==========
+
+# ADXL345 accelerometer: FIFO stream mode, every sample is drained once per frame
+ACCEL_DATA_RATE = adafruit_adxl34x.DataRate.RATE_100_HZ
+ACCEL_RANGE = adafruit_adxl34x.Range.RANGE_2_G
+accelerometer = adafruit_adxl34x.ADXL345(i2c)
+accel_stream = AccelStream(accelerometer, i2c, data_rate=ACCEL_DATA_RATE, g_range=ACCEL_RANGE)
+
+# rotary encoder on D0, D1
+encoder = RotaryEncoder(board.D0, board.D1, debounce_ms=3, pulses_per_detent=1)
+
+# NeoPixel at D10
+pixel = neopixel.NeoPixel(board.D10, 1, brightness=0.3, auto_write=False)
+
+# vibration motor on D8
+motor = digitalio.DigitalInOut(board.D8)
+motor.switch_to_output(value=False)
+
+# buzzer on D7 (PWM)
+buzzer = pwmio.PWMOut(board.D7, duty_cycle=0, frequency=440, variable_frequency=True)
+
+# buzzer music engine: note tables (music.Tune) stepped by timestamp, sound effects
+# pre-empt music by priority. music.masked(t): was the buzzer on around t (ignore the
+# sound sensor's self-noise)
+music = Music(buzzer)
+
+# non-blocking NeoPixel / motor effects, advanced once per frame; update() steps `music` too
+effects = EffectScheduler(pixel, motor, music)
+
+# heap watermarks: every screen in / out, low-water mark per level, largest block per game.
+# Report on the serial console after each game; hidden debug screen: hold the touch pad
+# while choosing SCORES in the main menu.
+heap = HeapMonitor(sample_every=8, collect=PROFILE_HEAP)
+
+# ========== 3. INPUT EVENTS ==========
+
+# trigger button D9 (pull-up, pressed = low), capacitive touch pad (shield) D2,
+# sound sensor D3 (quiet = 1, sound = 0) and the rotary encoder are all sampled and
+# debounced in one place: call inp.tick() once per tick / frame, then read inp.events
+# (PRESS / RELEASE / LONG_PRESS / HOLD / EDGE / TURN) or inp.is_down(TOUCH).
+# Sound edges are latched in the background (keypad, 1 ms scan) and timestamped;
+# edges while the buzzer sounds are dropped by the mask.
+inp = InputManager(board.D9, board.D2, board.D3, encoder, debounce=0.02,
+                   sound_mask=music.masked, heap=heap)
+
+# boot story, tutorial text pages and easter eggs are cutscene scripts, all played on
+# one set of labels / sprites built here, once (cutscene.py); their text is read from
+# story.bin in flash one page at a time (textpack.py)
+texts = TextPack("story.bin")
+scene = Cutscene(display, inp, effects, sprites.sheet(), texts)
+
+
+# ========== 4. LEADERBOARD & GAME OVER ==========
+
+LEADERBOARD_PAGE_LINES = 3
+HEAP_SCREEN_LINES = 4
+
+# leaderboard screen is built once; scrolling only rewrites the row texts
+leaderboard_screen = None   # (group, title label, [row labels], hint label)
+
+
+def build_leaderboard_screen():
+    group = displayio.Group()
+    title = label.Label(terminalio.FONT, text="HIGH SCORES", x=0, y=8)
+    group.append(title)
+
+    rows = []
+    y = 20
+    for _ in range(LEADERBOARD_PAGE_LINES):
+        row = label.Label(terminalio.FONT, text="", x=0, y=y)
+        group.append(row)
+        rows.append(row)
+        y += 12
+
+    hint = label.Label(terminalio.FONT, text="", x=0, y=56)
+    group.append(hint)
+    return group, title, rows, hint
+
+
+def prebuild_leaderboard_screen():
+    global leaderboard_screen
+    if leaderboard_screen is None:
+        leaderboard_screen = build_leaderboard_screen()
+
+
+def set_label_text(lbl, text):
+    """Only rewrite a label when its text really changes."""
+    if lbl.text != text:
+        lbl.text = text
+
+
+def show_leaderboard(display_obj, difficulty):
+    """Leaderboard of one difficulty; only the visible page is read from flash."""
+    global leaderboard_screen
+
+    scores = lazy.load("score")
+    total = scores.count_scores(difficulty)
+
+    prebuild_leaderboard_screen()
+    group, title, rows, hint = leaderboard_screen
+    set_label_text(title, "HIGH SCORES " + difficulty)
+    display_obj.root_group = group
+
+    # no records
+    if total == 0:
+        set_label_text(rows[0], "")
+        set_label_text(rows[1], "No records yet")
+        set_label_text(rows[2], "")
+        set_label_text(hint, "BTN: BACK")
+
+        inp.begin_screen()
+        inp.wait_press()
+        inp.end_screen("Leaderboard")
+        return
+
+    PAGE_LINES = LEADERBOARD_PAGE_LINES
+    start_index = 0
+
+    def clamp_start(idx):
+        if total <= PAGE_LINES:
+            return 0
+        if idx < 0:
+            return 0
+        max_start = total - PAGE_LINES
+        if idx > max_start:
+            idx = max_start
+        return idx
+
+    def draw_page(start):
+        page = scores.read_page(difficulty, start, PAGE_LINES)
+        for row_i in range(PAGE_LINES):
+            if row_i < len(page):
+                item = page[row_i]
+                line = f"{start+row_i+1}. {item['name']} {item['score']}"
+            else:
+                line = ""
+            set_label_text(rows[row_i], line)
+
+    set_label_text(hint, "ENC:SCROLL  BTN:BACK")
+    start_index = clamp_start(0)
+    draw_page(start_index)
+    tick_timer = TickTimer()
+    inp.begin_screen()
+
+    while True:
+        inp.tick()
+        for kind, source, _, delta in inp.events:
+            if kind == TURN:
+                t0 = time.monotonic_ns()
+                new_start = clamp_start(start_index + (1 if delta > 0 else -1))
+                if new_start != start_index:
+                    start_index = new_start
+                    draw_page(start_index)
+                tick_timer.add(t0)
+
+            elif kind == PRESS and source == BTN:
+                tick_timer.report("Leaderboard")
+                inp.end_screen("Leaderboard")
+                return
+
+        inp.idle(TICK)
+
+
+def show_heap_screen(display_obj):
+    """Hidden debug screen: heapwatch rows, encoder scrolls, BTN goes back."""
+    heap.measure()
+    rows = heap.lines()
+    group = displayio.Group()
+    group.append(label.Label(terminalio.FONT, text="HEAP", x=0, y=6))
+    row_labels = []
+    for i in range(HEAP_SCREEN_LINES):
+        lbl = label.Label(terminalio.FONT, text="", x=0, y=18 + i * 11)
+        group.append(lbl)
+        row_labels.append(lbl)
+    display_obj.root_group = group
+
+    def draw(start):
+        for i, lbl in enumerate(row_labels):
+            set_label_text(lbl, rows[start + i] if start + i < len(rows) else "")
+
+    start = 0
+    draw(start)
+    inp.begin_screen()
+    while True:
+        inp.tick()
+        for kind, source, _, delta in inp.events:
+            if kind == TURN:
+                new_start = max(0, min(len(rows) - HEAP_SCREEN_LINES, start + (1 if delta > 0 else -1)))
+                if new_start != start:
+                    start = new_start
+                    draw(start)
+            elif kind == PRESS and source == BTN:
+                inp.end_screen("Heap")
+                return
+        inp.idle(TICK)
+
+
+def show_game_over(display_obj, score_value, hp_reached_zero):
+    group = displayio.Group()
+    display_obj.root_group = group
+
+    text = "YOU DIED" if hp_reached_zero else "TIME UP"
+
+    go_label = label.Label(terminalio.FONT, text=text, x=20, y=20)
+    group.append(go_label)
+
+    score_lbl = label.Label(terminalio.FONT, text=f"Score: {score_value}", x=20, y=35)
+    group.append(score_lbl)
+
+    hint_label = label.Label(terminalio.FONT, text="BTN: CONTINUE", x=5, y=56)
+    group.append(hint_label)
+
+    inp.begin_screen()
+    inp.wait_press()
+    inp.end_screen("Game over")
+
+
+def save_high_score(score_value, difficulty):
+    """Name input + save, only for a score that makes the leaderboard."""
+    scores = lazy.load("score")
+    if not scores.can_enter_leaderboard(score_value, difficulty):
+        print("Score not high enough for leaderboard:", score_value)
+        return
+    player_name = lazy.load("NameInput").enter_name(display, inp, max_len=3)
+    lazy.unload("NameInput")
+    scores.add_score(player_name, score_value, difficulty)
+    print("Saved score:", player_name, score_value)
+
+
+# ========== 5. FINGERPRINT UNLOCK (OPTIONAL) ==========
+
+def fingerprint_unlock():
+    """
+    Simulated fingerprint unlock: ask player to touch the left capacitive pad.
+    """
+    group = displayio.Group()
+    display.root_group = group
+
+    line1 = label.Label(terminalio.FONT,
+                        text="Know: put your finger",
+                        x=0, y=15)
+    line2 = label.Label(terminalio.FONT,
+                        text="on the left touch pad",
+                        x=0, y=27)
+    line3 = label.Label(terminalio.FONT,
+                        text="when it glows green,",
+                        x=0, y=39)
+    line4 = label.Label(terminalio.FONT,
+                        text="to unlock your weapon.",
+                        x=0, y=51)
+    group.append(line1)
+    group.append(line2)
+    group.append(line3)
+    group.append(line4)
+
+    pixel[0] = (0, 80, 0)
+    pixel.show()
+
+    REQUIRED_HOLD = 0.5  # seconds
+    inp.hold_time = REQUIRED_HOLD
+    inp.begin_screen()
+
+    # HOLD fires once the pad has been touched for REQUIRED_HOLD
+    while True:
+        inp.tick()
+        if inp.has(HOLD, TOUCH):
+            line1.text = "Weapon unlocked!"
+            line2.text = "Welcome back,"
+            line3.text = "Zombie Hunter."
+            line4.text = "Press BTN to start"
+            pixel[0] = (0, 255, 0)
+            pixel.show()
+            break
+        inp.idle(0.02)
+
+    # 以前这里是没有 sleep 的忙等
+    inp.wait_press()
+    inp.end_screen("Fingerprint unlock")
+
+    pixel[0] = (0, 0, 0)
+    pixel.show()
+
+
+# ========== 6. GAME UI GROUP (ONLY ONCE) ==========
+
+main_group = displayio.Group()
+
+score_label = label.Label(terminalio.FONT, text="S:0", x=0, y=8)
+hp_label    = label.Label(terminalio.FONT, text=f"HP:{MAX_HP}", x=44, y=8)
+timer_label = label.Label(terminalio.FONT, text="T:10", x=88, y=8)
+
+sheet = sprites.sheet() if GAMEPLAY_SPRITES else None
+
+
+def glyph_layer():
+    """Group for make_glyph() objects (sprites: shifted so they take label coordinates)."""
+    if sheet is not None:
+        return sheet.layer()
+    return displayio.Group()
+
+
+def make_glyph(ch, x=0, y=0):
+    """One character at label coordinates: a sprite tile, or a terminalio label."""
+    if sheet is not None:
+        return sheet.sprite(ch, x, y)
+    return label.Label(terminalio.FONT, text=ch, x=x, y=y)
+
+
+# zombies + crosshair in one group; the crosshair goes first, so zombies draw over it
+zombies_group = glyph_layer()
+crosshair = make_glyph("+", 64, 36)
+zombies_group.append(crosshair)
+
+# zombie pool (sprites or labels): created once, big enough for the busiest difficulty.
+# spawn/remove only change glyph / position / hidden, so a level never allocates any.
+ZOMBIE_POOL_SIZE = max(get_level_config(d, 1)["max_on_screen"] for d in ZOMBIE_LIFETIME_TABLE)
+
+zombie_labels = []                 # slot -> label / sprite
+zombie_label_allocs = 0   # how many zombie glyphs were ever created (should stay = pool size)
+for _ in range(ZOMBIE_POOL_SIZE):
+    z_lbl = make_glyph("Z")
+    z_lbl.hidden = True
+    zombies_group.append(z_lbl)
+    zombie_labels.append(z_lbl)
+    zombie_label_allocs += 1
+
+# hit index: packed column/row bitmaps of zombie hitboxes, keyed by pool slot
+hit_index = HitIndex(128, 64, ZOMBIE_POOL_SIZE)
+
+# zombie registry: one reusable __slots__ object per pool slot,
+# O(1) spawn / swap-remove, zombies.active is iterated without copying
+zombies = ZombieRegistry(zombie_labels, hit_index, sheet)
+
+state_label = label.Label(terminalio.FONT, text="N L1", x=0, y=54)
+info        = label.Label(terminalio.FONT, text="",   x=0, y=56)
+
+main_group.append(score_label)
+main_group.append(hp_label)
+main_group.append(timer_label)
+main_group.append(zombies_group)
+main_group.append(state_label)
+main_group.append(info)
+
+display.root_group = main_group
+
+
+# ========== 7. MAPPING & ZOMBIE MANAGEMENT ==========
+
+alpha = 0.2          # low-pass strength per 40 FPS frame
+
+# same time constant, applied to every FIFO sample instead of once per frame
+sample_alpha = 1 - (1 - alpha) ** (1 / (accel_stream.rate_hz * FRAME_PERIOD))
+
+MIN_X = -6.0
+MAX_X =  6.0
+MIN_Y = -6.0
+MAX_Y =  6.0
+
+SCREEN_X_MIN = 0
+SCREEN_X_MAX = 127
+SCREEN_Y_MIN = 18
+SCREEN_Y_MAX = 48
+
+# integer filter + mapping (no FPU on the ESP32-C3), within 1 px of the float version
+aim = AimFilter(sample_alpha, ACCEL_SCALE, (MIN_X, MAX_X), (MIN_Y, MAX_Y),
+                (SCREEN_X_MIN, SCREEN_X_MAX), (SCREEN_Y_MIN, SCREEN_Y_MAX))
+feed_aim = aim.feed     # AccelStream.drain(feed_aim, raw=True) callback, bound once
+
+
+last_spawn_time = 0
+
+# per-level allocation stats (printed when a level ends)
+level_spawn_count = 0
+level_alloc_start = 0
+
+
+def start_level_stats():
+    global level_spawn_count, level_alloc_start
+    gc.collect()
+    level_spawn_count = 0
+    level_alloc_start = gc.mem_alloc()
+    heap.level_start(current_level)
+
+
+def print_level_stats(level_index):
+    print("L{}: {} spawns, zombie {} allocated: {}, heap +{} bytes, low {} B free".format(
+        level_index, level_spawn_count, "sprites" if GAMEPLAY_SPRITES else "labels", zombie_label_allocs,
+        gc.mem_alloc() - level_alloc_start, heap.level_low.get(level_index, 0)))
+
+
+# 每局的随机数：xorshift32，纯整数运算。不用 random 模块：CircuitPython 的 random 和
+# CPython 的 Mersenne Twister 是两套算法，同一个 seed 在板子上和电脑上出的僵尸不一样，
+# 板子上录的 trace 就没法在电脑上回放。new_game() 每局 seed 一次，spawn 全部用它。
+rng_state = 1
+
+
+def rng_seed(seed):
+    global rng_state
+    rng_state = (seed & 0xFFFFFFFF) or 1   # xorshift 的状态不能是 0
+
+
+def rng_below(n):
+    """Next random integer in 0 .. n - 1."""
+    global rng_state
+    x = rng_state
+    x ^= (x << 13) & 0xFFFFFFFF
+    x ^= x >> 17
+    x ^= (x << 5) & 0xFFFFFFFF
+    rng_state = x
+    return x % n
+
+
+def spawn_zombie(level_cfg, level_index, now):
+    global level_spawn_count
+
+    # type: Z / S / T (r in percent)
+    r = rng_below(100)
+
+    if level_cfg["boss"]:
+        # boss level: 10% Z, 40% S, 50% T
+        if r < 10:
+            z_type = "Z"
+        elif r < 50:
+            z_type = "S"
+        else:
+            z_type = "T"
+    else:
+        if level_index == 1:
+            z_type = "Z"  # level 1: only Z
+        elif level_index <= 3:
+            # level 2–3: 80% Z, 10% S, 10% T
+            if r < 80:
+                z_type = "Z"
+            elif r < 90:
+                z_type = "S"
+            else:
+                z_type = "T"
+        else:
+            # level 4–9: 60% Z, 20% S, 20% T
+            if r < 60:
+                z_type = "Z"
+            elif r < 80:
+                z_type = "S"
+            else:
+                z_type = "T"
+
+    # 所有僵尸 1 血；glyph 就是类型字母 Z / S / T
+    zx = SCREEN_X_MIN + 5 + rng_below(SCREEN_X_MAX - SCREEN_X_MIN - 9)
+    zy = SCREEN_Y_MIN + 5 + rng_below(SCREEN_Y_MAX - SCREEN_Y_MIN - 9)
+
+    # pooled label + hit index are updated by the registry
+    # (returns None if the pool is full: cannot happen, max_on_screen <= ZOMBIE_POOL_SIZE)
+    if zombies.spawn(z_type, zx, zy, now, level_cfg["zombie_lifetime_ms"]) is not None:
+        level_spawn_count += 1
+
+
+def find_hit_zombie(px, py):
+    """
+    Return the zombie hit by crosshair (only Z is killable by shooting).
+    One lookup in hit_index; if hitboxes overlap, the lowest pool slot wins.
+    """
+    slot = hit_index.find(px, py)
+    if slot < 0:
+        return None
+    return zombies.by_slot(slot)
+
+
+def remove_zombie(z):
+    # O(1): hide the pooled label, clear its hitbox, swap-remove from zombies.active
+    zombies.remove(z)
+
+
+def update_zombies(now, shield_active, player_hp, level_cfg):
+    """
+    Update flashing / disappearing.
+    When a zombie lifetime ends:
+      - if shield is NOT active -> player takes damage
+      - then zombie is removed
+    now, spawn_time and lifetime are whole game ms (integer math only).
+    """
+    active = zombies.active
+    # walk backwards: swap-remove only moves zombies we have already visited
+    i = len(active) - 1
+    while i >= 0:
+        z = active[i]
+        i -= 1
+
+        age = now - z.spawn_time
+        lifetime = z.lifetime
+        lbl = z.label
+
+        if age >= lifetime:
+            if not shield_active:
+                player_hp -= 1
+            remove_zombie(z)
+            continue
+
+        warn_time = min(FLASH_WARNING_MS, lifetime)
+        if age >= lifetime - warn_time:
+            flash_phase = (age - (lifetime - warn_time)) * 6 // 1000   # 6 phases per second
+            lbl.hidden = (flash_phase % 2 == 1)
+        else:
+            lbl.hidden = False
+
+    return player_hp
+
+
+# ========== 8. EFFECTS & UI HELPERS ==========
+
+# effect step tables: (offset seconds, target, value), played by `effects`;
+# their sounds are note tables (music.Tune: MIDI note, rows of 10 ms, volume %)
+OFF = (0, 0, 0)
+
+MUZZLE_STEPS = [
+    (0.0,  "pixel", (255, 255, 255)),
+    (0.03, "pixel", OFF),
+]
+
+HIT_STEPS = []
+for _i in range(2):   # two short green flashes + buzz
+    _t = _i * 0.10
+    HIT_STEPS += [
+        (_t,        "pixel", (0, 255, 0)),
+        (_t,        "motor", True),
+        (_t + 0.05, "motor", False),
+        (_t + 0.05, "pixel", OFF),
+    ]
+HIT_STEPS.append((0.20, "pixel", OFF))   # keep the 50 ms gap after the last flash
+
+MISS_STEPS = [
+    (0.0, "pixel", (255, 0, 0)),
+    (0.1, "pixel", OFF),
+]
+
+DAMAGE_STEPS = [
+    (0.0,  "pixel", (255, 50, 0)),
+    (0.0,  "motor", True),
+    (0.15, "motor", False),
+    (0.15, "pixel", OFF),
+]
+
+# a shot: the muzzle flash, then the hit / miss flash (one effect, so the second
+# one does not cut the first off)
+MUZZLE_TIME = MUZZLE_STEPS[-1][0]
+SHOT_HIT_STEPS = MUZZLE_STEPS + [(t + MUZZLE_TIME, target, value) for t, target, value in HIT_STEPS]
+SHOT_MISS_STEPS = MUZZLE_STEPS + [(t + MUZZLE_TIME, target, value) for t, target, value in MISS_STEPS]
+
+
+HIT_SOUND = Tune(((86, 5, 40), (REST, 5, 0), (86, 5, 40)))     # D6 (~1200 Hz) twice
+S_HIT_SOUND = Tune(((81, 8, 40), (86, 5, 40), (REST, 5, 0), (86, 5, 40)))   # A5 beep + hit (tutorial S)
+MISS_SOUND = Tune(((62, 10, 30),))                               # D4 (~300 Hz)
+DAMAGE_SOUND = Tune(((55, 15, 40),))                             # G3 (~200 Hz)
+START_SOUND = Tune(((71, 8, 30), (78, 8, 30), (83, 15, 35)))     # B4, F#5, B5 (~500, 750, 1000 Hz)
+
+
+def hit_effect(sound=HIT_SOUND, steps=HIT_STEPS):
+    effects.play(steps, SFX)
+    music.play(sound, SFX)
+
+
+def miss_effect(steps=MISS_STEPS):
+    effects.play(steps, SFX)
+    music.play(MISS_SOUND, SFX)
+
+
+def damage_effect():
+    effects.play(DAMAGE_STEPS, ALERT)
+    music.play(DAMAGE_SOUND, ALERT)
+
+
+def game_start_sound():
+    music.play(START_SOUND, SFX)
+
+
+# last value shown on each HUD label: only touch label.text when it changes,
+# otherwise adafruit_display_text re-renders the label every frame
+hud_values = {"score": None, "hp": None, "timer": None, "state": None}
+
+
+def update_score_display(score_value):
+    if hud_values["score"] != score_value:
+        hud_values["score"] = score_value
+        score_label.text = f"S:{score_value}"
+
+
+def update_hp_display(hp):
+    if hud_values["hp"] != hp:
+        hud_values["hp"] = hp
+        hp_label.text = f"HP:{hp}"
+
+
+def update_timer_display(seconds):
+    if hud_values["timer"] != seconds:
+        hud_values["timer"] = seconds
+        timer_label.text = "T:{:2d}".format(seconds)
+
+
+def update_state_display(difficulty, level_index):
+    diff_char = difficulty[0]   # E / N / D
+    state = (diff_char, level_index)
+    if hud_values["state"] != state:
+        hud_values["state"] = state
+        state_label.text = f"{diff_char} L{level_index}"
+
+
+banner_screen = None   # (group, label), built once
+
+
+def show_level_banner(level_index, now):
+    """
+    Full-screen 'LEVEL X' banner in the center. Does not wait:
+    returns the game time (ms) it should come down (the logic task switches back to main_group).
+    """
+    global banner_screen
+    if banner_screen is None:
+        group = displayio.Group()
+        lbl = label.Label(terminalio.FONT, text="", x=0, y=32)
+        group.append(lbl)
+        banner_screen = (group, lbl)
+    group, lbl = banner_screen
+
+    text = f"LEVEL {level_index}"
+    lbl.text = text
+    # 简单水平居中估算：每个字符大约 6 像素宽
+    lbl.x = max(0, (128 - len(text) * 6) // 2)
+    display.root_group = group
+
+    return now + LEVEL_BANNER_MS
+
+
+# ========== 9. TUTORIAL (ONLY FIRST PLAY) ==========
+
+# text pages (cutscene scripts, text in story.bin [TUTORIAL]); the practice parts in
+# between are interactive
+TUTORIAL_LAYOUT = ((0, 8), (0, 22), (0, 34), (0, 46), (0, 58))
+TUTORIAL_1 = (("page", TUTORIAL, TUTORIAL_LAYOUT),)
+TUTORIAL_2 = (("page", TUTORIAL + 1, TUTORIAL_LAYOUT),)
+TUTORIAL_3 = (("page", TUTORIAL + 2, TUTORIAL_LAYOUT),)
+
+def show_tutorial(display_obj):
+    """
+    Intro tutorial shown once after power-on:
+      Part 1: Text -> practice shoot Z
+      Part 2: Text -> practice kill S by sound
+      Part 3: Text -> practice T + touch/shield
+    """
+    # --- Part 1-A: text only ---
+    scene.play(TUTORIAL_1, "Tutorial 1/3")
+
+    # --- Part 1-B: practice shooting Z on empty page ---
+    g1 = glyph_layer()
+    display_obj.root_group = g1
+
+    tut_z = make_glyph("Z", 64, 36)
+    g1.append(tut_z)
+
+    tut_cross = make_glyph("+", 64, 20)
+    g1.append(tut_cross)
+
+    hit_ok = False
+    aim.reset()
+    accel_stream.flush()
+
+    while not hit_ok:
+        accel_stream.drain(feed_aim, raw=True)
+
+        tut_cross.x = aim.px()
+        tut_cross.y = aim.py()
+
+        inp.tick()
+        if inp.pressed():
+            if in_hitbox(tut_cross.x, tut_cross.y, tut_z.x, tut_z.y):
+                hit_ok = True
+                hit_effect()
+            else:
+                miss_effect()
+
+        effects.update()
+        inp.idle(0.02)
+
+    effects.run_for(0.6)
+
+    # --- Part 2-A: text only for S ---
+    scene.play(TUTORIAL_2, "Tutorial 2/3")
+
+    # --- Part 2-B: practice S on clean page ---
+    g2 = glyph_layer()
+    display_obj.root_group = g2
+
+    s_demo = make_glyph("S", 64, 36)
+    g2.append(s_demo)
+
+    triggered = False
+
+    while not triggered:
+        inp.tick()
+        if inp.has(EDGE, SOUND):
+            triggered = True
+            hit_effect(S_HIT_SOUND)
+        effects.update()
+        inp.idle(TICK)
+
+    effects.run_for(0.6)
+
+    # --- Part 3-A: text only for T ---
+    scene.play(TUTORIAL_3, "Tutorial 3/3")
+
+    # --- Part 3-B: practice T on clean page ---
+    g3 = glyph_layer()
+    display_obj.root_group = g3
+
+    t_demo = make_glyph("T", 64, 36)
+    g3.append(t_demo)
+
+    HOLD_TIME = 0.5
+    inp.hold_time = HOLD_TIME
+    # the pad may already be held since the text page, whose HOLD went to the cutscene:
+    # a new screen re-arms it
+    inp.begin_screen()
+    unlocked = False
+
+    while not unlocked:
+        inp.tick()
+        if inp.has(HOLD, TOUCH):
+            unlocked = True
+            pixel[0] = (0, 150, 0)
+            pixel.show()
+            hit_effect()
+        effects.update()
+        inp.idle(0.02)
+
+    effects.run_for(0.6)
+
+    pixel[0] = (0, 0, 0)
+    pixel.show()
+    inp.end_screen("Tutorial")
+    display_obj.root_group = main_group
+
+
+# ========== 10. GAME TASKS (asyncio runtime) ==========
+
+# profiler phases: logic_step() is split into six, the other tasks are one phase each
+PHASES = ("timer", "zombies", "spawn", "sound", "shield", "shoot", "input", "accel", "render", "effects")
+PH_TIMER, PH_ZOMBIES, PH_SPAWN, PH_SOUND, PH_SHIELD, PH_SHOOT, PH_INPUT, PH_ACCEL, PH_RENDER, PH_EFFECTS = range(10)
+prof = PhaseProfiler(PHASES, ring=512, on=PROFILE_PHASES)
+# The game runs as separate periodic tasks instead of one blocking loop:
+#   input   100 Hz  button / touch / sound events -> pending_* counters
+#   aim      40 Hz  drain the ADXL345 FIFO through the filter -> px, py
+#   logic    40 Hz  level timer, zombies, shooting, HUD text (game time, see logic_task)
+#   render   40 Hz  display.refresh()
+#   effects 200 Hz  NeoPixel / motor / buzzer steps
+# No task sleeps; the level banner is a state of the logic task.
+
+pending_shots = 0      # BTN presses not handled by the logic task yet
+pending_sounds = 0     # sound edges (outside buzzer activity) not handled yet
+shield_active = False
+px = 64
+py = 36
+
+game_score = 0
+player_hp = MAX_HP
+current_level = 1
+level_cfg = None
+start_time = 0            # game ms when this level started
+last_spawn_time = 0
+banner_until = 0         # != 0 while the LEVEL banner is up
+info_clear_time = 0      # when to clear "SHIELD UP!"
+fired_any_shot = False
+hp_reached_zero = False
+cleared_all_levels = False   # did player clear all 10 levels?
+
+game_seed = 0          # rng_seed() of this game
+game_t0_ns = 0         # monotonic_ns when the game started; logic runs on whole ms since then
+trace_out = None       # TraceWriter while recording
+trace_in = None        # TraceReader.frames() while replaying through the runtime
+
+
+def input_step(now):
+    global pending_shots, pending_sounds, shield_active
+    prof.begin()
+    inp.tick()
+    for kind, source, _, _ in inp.events:
+        if kind == PRESS and source == BTN:
+            pending_shots += 1
+        elif kind == EDGE and source == SOUND:
+            pending_sounds += 1   # 蜂鸣器自己的声音已经被 sound_mask 去掉了
+    # shield via touch sensor
+    shield_active = inp.is_down(TOUCH)
+    prof.lap(PH_INPUT)
+
+
+def aim_step(now):
+    global px, py
+    prof.begin()
+    # ADXL aiming: every sample buffered since the last frame (integer pipeline)
+    accel_stream.drain(feed_aim, raw=True)
+
+    px = aim.px()
+    py = aim.py()
+    prof.lap(PH_ACCEL)
+
+
+def start_level(now):
+    """Banner is over: back to the game screen with a fresh horde and a full 10 s."""
+    global banner_until, start_time, last_spawn_time, pending_shots, pending_sounds
+    banner_until = 0
+    display.root_group = main_group
+
+    # 清空当前僵尸，按新配置刷新（标签回到池里，不重新分配）
+    zombies.clear()
+    start_level_stats()
+    for _ in range(level_cfg["max_on_screen"]):
+        spawn_zombie(level_cfg, current_level, now)
+    last_spawn_time = now
+    start_time = now
+
+    # banner 期间的按键 / 声音不算
+    pending_shots = 0
+    pending_sounds = 0
+
+    if current_level == 1:
+        game_start_sound()
+
+
+def logic_step(now):
+    """One logic frame; now is the game clock in whole ms (see logic_task)."""
+    global game_score, player_hp, current_level, level_cfg, banner_until, last_spawn_time
+    global info_clear_time, fired_any_shot, hp_reached_zero, cleared_all_levels
+    global pending_shots, pending_sounds
+
+    if banner_until:
+        if now < banner_until:
+            return
+        start_level(now)
+
+    prof.begin()
+    elapsed = now - start_time
+    remaining = GAME_DURATION_MS - elapsed
+
+    # 每关 10 秒：时间到了，如果没死就进下一关
+    if remaining <= 0:
+        print_level_stats(current_level)
+        if current_level < MAX_LEVEL:
+            current_level += 1
+            update_state_display(current_difficulty, current_level)
+            level_cfg = get_level_config(current_difficulty, current_level)
+
+            # 显示 LEVEL X banner（不阻塞，其他任务照常运行）
+            banner_until = show_level_banner(current_level, now)
+        else:
+            # 第 10 关也坚持完 10 秒：通关
+            cleared_all_levels = True
+            update_timer_display(0)
+            game_runtime.stop()
+        prof.lap(PH_TIMER)
+        return
+
+    update_timer_display(remaining // 1000)
+
+    can_shoot = not shield_active
+    crosshair.x = px
+    crosshair.y = py
+    prof.lap(PH_TIMER)
+
+    # update zombies: lifetime / flashing / disappearing damage
+    old_hp = player_hp
+    player_hp = update_zombies(now, shield_active, player_hp, level_cfg)
+    if player_hp < old_hp:
+        update_hp_display(player_hp)
+        damage_effect()
+        if player_hp <= 0:
+            hp_reached_zero = True
+            game_runtime.stop()
+            return
+    prof.lap(PH_ZOMBIES)
+
+    # keep zombie count
+    if len(zombies) < level_cfg["max_on_screen"]:
+        if now - last_spawn_time >= level_cfg["spawn_interval_ms"]:
+            spawn_zombie(level_cfg, current_level, now)
+            last_spawn_time = now
+    prof.lap(PH_SPAWN)
+
+    # sound edges since last frame (quiet=1 -> sound=0)
+    if pending_sounds:
+        pending_sounds = 0
+        # player made a sound: kill one S zombie on screen
+        killed_any_S = False
+        for z in zombies.active:
+            if z.type == "S":
+                remove_zombie(z)
+                game_score += 1
+                killed_any_S = True
+                break
+
+        if killed_any_S:
+            update_score_display(game_score)
+            hit_effect()
+    prof.lap(PH_SOUND)
+
+    # if shield is up: clear ONE T zombie only
+    if shield_active:
+        killed_any_T = False
+        for z in zombies.active:  # 遍历当前所有僵尸（删一个就 break，不用复制列表）
+            if z.type == "T":
+                remove_zombie(z)  # 杀掉这个 T 僵尸
+                game_score += 1
+                killed_any_T = True
+                break             # ✅ 只杀第一个，马上停
+
+        if killed_any_T:
+            update_score_display(game_score)
+            hit_effect()
+    prof.lap(PH_SHIELD)
+
+    # shooting: one queued press per frame, the rest stay queued
+    if pending_shots:
+        pending_shots -= 1
+        if can_shoot:
+            fired_any_shot = True
+            target = find_hit_zombie(px, py)
+            if target is not None and target.type == "Z":
+                # 所有僵尸 1HP，打中就死
+                remove_zombie(target)
+                game_score += 1
+                update_score_display(game_score)
+                hit_effect(steps=SHOT_HIT_STEPS)
+            else:
+                # shot S or T or empty → miss
+                miss_effect(SHOT_MISS_STEPS)
+        else:
+            info.text = "SHIELD UP!"
+            info_clear_time = now + SHIELD_INFO_MS
+
+    if info_clear_time and now >= info_clear_time:
+        info.text = ""
+        info_clear_time = 0
+    prof.lap(PH_SHOOT)
+
+
+def play_frame(frame):
+    """One logic frame from a trace: restore the inputs logic_step() saw, then run it."""
+    global pending_shots, pending_sounds, shield_active, px, py
+    t_ms, pending_shots, pending_sounds, shield_active, px, py = frame
+    logic_step(t_ms)
+
+
+def logic_task(now):
+    """
+    logic_step() on the game clock: whole ms since the game started (integers, so a
+    recorded game and its replay do exactly the same math). Records / replays the inputs.
+    """
+    if trace_in is not None:
+        try:
+            frame = next(trace_in)
+        except StopIteration:
+            # trace ended before the game did
+            game_runtime.stop()
+            return
+        play_frame(frame)
+        return
+
+    t_ms = (time.monotonic_ns() - game_t0_ns) // 1000000
+    if trace_out is not None:
+        trace_out.frame(t_ms, pending_shots, pending_sounds, shield_active, px, py)
+    logic_step(t_ms)
+
+
+def render_step(now):
+    prof.begin()
+    display.refresh()
+    heap.sample()
+    prof.lap(PH_RENDER)
+
+
+def effects_step(now):
+    # advance NeoPixel / motor effects and the music engine (never blocks); idle runs are not profiled
+    if effects.busy():
+        prof.begin()
+        effects.update(now)
+        prof.lap(PH_EFFECTS)
+
+
+game_runtime = Runtime()
+game_runtime.add("input", INPUT_PERIOD, input_step)
+game_runtime.add("aim", FRAME_PERIOD, aim_step)
+game_runtime.add("logic", FRAME_PERIOD, logic_task)
+game_runtime.add("render", FRAME_PERIOD, render_step)
+game_runtime.add("effects", EFFECTS_PERIOD, effects_step)
+
+
+# ========== 11. MAIN GAME LOOP ==========
+
+current_difficulty = "NORMAL"
+
+
+def new_game(seed):
+    """Reset score / HP / level / HUD for current_difficulty, seed the RNG, put up LEVEL 1."""
+    global game_score, player_hp, current_level, level_cfg, banner_until
+    global info_clear_time, fired_any_shot, hp_reached_zero, cleared_all_levels
+    global pending_shots, pending_sounds, game_seed, game_t0_ns
+
+    # 每局一个 seed：spawn_zombie() 的随机数可以按 trace 复现（板子上录的也能在电脑上放）
+    game_seed = seed
+    rng_seed(seed)
+
+    game_score = 0
+    update_score_display(game_score)
+    update_timer_display(int(GAME_DURATION))
+    info.text = ""
+    info_clear_time = 0
+
+    player_hp = MAX_HP
+    update_hp_display(player_hp)
+    cleared_all_levels = False
+    hp_reached_zero = False
+    fired_any_shot = False
+
+    current_level = 1
+    update_state_display(current_difficulty, current_level)
+    level_cfg = get_level_config(current_difficulty, current_level)
+
+    aim.reset()
+    prof.reset()
+
+    # LEVEL 1 banner at game time 0; zombies, timer and start sound follow when it comes down
+    banner_until = show_level_banner(current_level, 0)
+
+    print("Game started; difficulty:", current_difficulty)
+
+    # we refresh the display ourselves from the render task
+    display.auto_refresh = False
+    inp.begin_screen()
+    accel_stream.flush()
+    accel_stream.reset_stats()
+    pending_shots = 0
+    pending_sounds = 0
+    game_t0_ns = time.monotonic_ns()
+
+
+def end_game(report=True):
+    """Leave the game screen; returns the result dict (difficulty, score, hp, level, cleared, shots)."""
+    # let the last effect finish before leaving the game screen
+    effects.finish()
+    info.text = ""
+    display.auto_refresh = True
+
+    if hp_reached_zero:
+        print_level_stats(current_level)
+    # 游戏画面由 Runtime 调度，不走 inp.idle()：CPU 占用看 game_runtime.report()
+    inp.end_screen("Game", cpu=False)
+    heap.game_end()
+    if report:
+        print(game_runtime.report())
+        print(accel_stream.report())
+        print(inp.sound_report())
+        print(lazy.report())
+        print(heap.report())
+        if prof.on:
+            print(prof.report())
+
+    return {
+        "difficulty": current_difficulty, "score": game_score, "hp": player_hp,
+        "level": current_level, "cleared": cleared_all_levels, "shots": fired_any_shot,
+    }
+
+
+def replay_trace(path=TRACE_FILE, fast=True, clock_ns=None):
+    """
+    Play a recorded game (RECORD_TRACE) again through the real logic_step().
+    - fast=True: frame after frame with no pacing, no display refresh and no effects
+    - fast=False: through the normal task runtime (40 Hz, display + effects)
+    - clock_ns: timer for the speed report and the phase profiler (default time.monotonic_ns)
+    Prints replay speed and logic time per frame, and whether score / HP / level match
+    the recording (plus the phase profile if prof.on). Returns the result dict plus "match" (None if the trace has no result).
+    """
+    global current_difficulty, trace_in
+    if clock_ns is None:
+        clock_ns = time.monotonic_ns
+    reader = TraceReader(path)
+    frames_in = reader.frames()
+    saved_clock = prof.clock_ns
+    prof.clock_ns = clock_ns
+    saved_difficulty = current_difficulty
+    current_difficulty = reader.difficulty
+    new_game(reader.seed)
+
+    frames = 0
+    logic_max_ns = 0
+    t0 = clock_ns()
+    try:
+        if fast:
+            effects.muted = True
+            music.muted = True
+            game_runtime.running = True    # logic_step() calls stop() at game over
+            for frame in frames_in:
+                f0 = clock_ns()
+                play_frame(frame)
+                f_ns = clock_ns() - f0
+                if f_ns > logic_max_ns:
+                    logic_max_ns = f_ns
+                frames += 1
+                if not game_runtime.running:
+                    break
+            game_runtime.running = False
+            display.refresh()
+        else:
+            trace_in = frames_in
+            game_runtime.run()
+        wall_ns = clock_ns() - t0
+        # read on to the end marker: the recorded result follows the last frame
+        for _ in frames_in:
+            pass
+    finally:
+        trace_in = None
+        effects.muted = False
+        music.muted = False
+        prof.clock_ns = saved_clock
+        reader.close()
+        current_difficulty = saved_difficulty
+
+    result = end_game(report=not fast)
+    if fast and prof.on:
+        print(prof.report())
+    result["difficulty"] = reader.difficulty
+    played = reader.duration_ms / 1000
+    wall = wall_ns / 1000000000
+    if fast and frames and wall_ns:
+        print("Replay: {} frames ({:.1f} s of play) in {:.2f} s, {:.0f}x, logic avg {} us max {} us".format(
+            frames, played, wall, played / wall if wall > 0 else 0,
+            wall_ns // frames // 1000, logic_max_ns // 1000))
+    else:
+        print("Replay: {:.1f} s of play in {:.1f} s".format(played, wall))
+
+    recorded = reader.result
+    if recorded is None:
+        result["match"] = None
+        print("Replay: trace has no recorded result (cut short)")
+    else:
+        result["match"] = all(result[k] == recorded[k] for k in recorded)
+        print("Replay: score {} hp {} level {} -> {}".format(
+            result["score"], result["hp"], result["level"],
+            "matches recording" if result["match"] else "MISMATCH, recorded {}".format(recorded)))
+    return result
+
+
+# screen setup done while the boot melody plays, one job per title frame
+BOOT_SETUP = (
+    lambda: lazy.load("menu"),
+    lambda: lazy.load("menu").build_screens(),
+    prebuild_leaderboard_screen,
+    gc.collect,
+)
+
+
+def boot_skip_reason():
+    """Why the boot animation is skipped: BOOT_SKIP_FILE, "auto-reload" or None."""
+    try:
+        os.stat(BOOT_SKIP_FILE)
+        return BOOT_SKIP_FILE
+    except OSError:
+        pass
+    if BOOT_SKIP_ON_RELOAD and supervisor is not None:
+        try:
+            if supervisor.runtime.run_reason == supervisor.RunReason.AUTO_RELOAD:
+                return "auto-reload"
+        except AttributeError:
+            pass
+    return None
+
+
+def print_boot_report(boot_ns, skipped):
+    """
+    Time to first frame / interactive menu + free heap once the menu is loaded:
+      Boot (.mpy): power-on -> code.py .. ms, imports + init .. ms, first frame .. ms, menu .. ms after power-on (skipped: button); mem_free .. B
+    .py / .mpy: whether this file was compiled on the board or by tools/build_mpy.py.
+    The menu time includes reading the story unless it was skipped.
+    """
+    menu_ns = time.monotonic_ns()
+    gc.collect()
+    first = boot_ns[1] if len(boot_ns) > 1 else menu_ns
+    print("Boot ({}): power-on -> code.py {:.0f} ms, imports + init {:.0f} ms, first frame {:.0f} ms, menu {:.0f} ms after power-on ({}); mem_free {} B".format(
+        lazy.source(globals().get("__file__", "")), BOOT_IMPORT_NS / 1000000,
+        (boot_ns[0] - BOOT_IMPORT_NS) / 1000000, first / 1000000, menu_ns / 1000000,
+        "skipped: " + skipped if skipped else "after the story", gc.mem_free()))
+    print(lazy.report())
+    print(texts.report())
+
+
+def main(games=None, record=RECORD_TRACE, difficulty=None):
+    """
+    Boot animation, then menu -> game -> end screens, forever
+    (or until `games` games have been played; the host simulator uses that).
+    - record: write each game's input trace to TRACE_FILE
+    - difficulty: start on this difficulty instead of the last one chosen in SETTINGS
+    Returns one result dict per game: difficulty, score, hp, level, cleared, shots.
+    """
+    global tutorial_shown, current_difficulty, trace_out
+
+    if difficulty is not None:
+        current_difficulty = difficulty
+    results = []
+
+    boot_ns = [time.monotonic_ns()]     # game import + hardware init done; + first frame
+    skipped = boot_skip_reason()
+    if skipped is None:
+        skipped = ui.show_boot_animation(scene, setup=BOOT_SETUP,
+                                         on_first_frame=lambda: boot_ns.append(time.monotonic_ns()))
+    else:
+        for job in BOOT_SETUP:
+            job()
+    menu = lazy.load("menu")
+    print_boot_report(boot_ns, skipped)
+
+    while games is None or len(results) < games:
+        # --- 11.1 Menu loop ---
+        while True:
+            choice = menu.main_menu(display, inp, current_difficulty)
+            print("Menu selected:", choice, "Current diff:", current_difficulty)
+
+            if choice == "PLAY":
+                break
+
+            elif choice == "SCORES":
+                if inp.is_down(TOUCH):
+                    show_heap_screen(display)
+                else:
+                    show_leaderboard(display, current_difficulty)
+
+            elif choice == "SETTINGS":
+                if inp.is_down(TOUCH):
+                    prof.on = not prof.on
+                    print("Phase profiler:", "on" if prof.on else "off")
+                else:
+                    current_difficulty = menu.difficulty_menu(display, inp)
+                    print("Difficulty selected:", current_difficulty)
+
+        # show tutorial only on first PLAY after power-on
+        if not tutorial_shown:
+            show_tutorial(display)
+            tutorial_shown = True
+
+        # optional fingerprint unlock
+        if FINGERPRINT_UNLOCK_ENABLED:
+            fingerprint_unlock()
+            display.root_group = main_group
+
+        # --- 11.2 Start a game ---
+        new_game(int.from_bytes(os.urandom(4), "little"))
+        if record:
+            trace_out = TraceWriter(TRACE_FILE, game_seed, current_difficulty)
+
+        # --- 11.3 Run the game tasks until game over / all levels cleared ---
+        game_runtime.run()
+        result = end_game()
+        results.append(result)
+
+        if trace_out is not None:
+            trace_out.close(game_score, player_hp, current_level, cleared_all_levels)
+            print("Trace:", TRACE_FILE, trace_out.frames, "frames, seed", game_seed)
+            trace_out = None
+
+        # --- 11.4 End of game handling ---
+
+        # cleared all 10 levels → boss easter egg
+        if cleared_all_levels:
+            lazy.load("easter2").show_boss_easter(scene)
+            lazy.unload("easter2")
+            display.root_group = main_group
+            save_high_score(game_score, current_difficulty)
+            show_leaderboard(display, current_difficulty)
+            display.root_group = main_group
+            continue
+
+        # no-shot easter egg
+        if not fired_any_shot:
+            print("Easter egg: no shot fired this round!")
+            lazy.load("easter").show_no_shot(scene)
+            lazy.unload("easter")
+            display.root_group = main_group
+            continue
+
+        # normal game over
+        show_game_over(display, game_score, hp_reached_zero)
+        save_high_score(game_score, current_difficulty)
+        show_leaderboard(display, current_difficulty)
+        display.root_group = main_group
+
+    return results
@@ -0,0 +1,175 @@
+# heapwatch.py
+#
+# 内存观测：长时间玩下去会不会 MemoryError？
+#   每个画面进 / 出时（InputManager.begin_screen / end_screen）记下 mem_free / mem_alloc，
+#   出来时比进去多占的字节 = 这个画面留下来的东西（缓存的 Group / Label，或者泄漏）
+#   只有 collect = True（分析内存的时候）才先 gc.collect()：平时每次换画面都 collect
+#   会卡一下，而且把碎片也藏起来了
+#   关卡进行中隔几帧读一次 mem_free（不 collect），记最低水位
+#   每局结束：最大可分配块（二分法试 bytearray）、碎片率、比上一局多占了多少
+import gc
+
+_MAX_GAMES = 8      # 记最近几局结束时的 mem_alloc
+
+
+def _k(n):
+    return "{:.1f}K".format(n / 1024)
+
+
+class HeapMonitor:
+    """
+    HeapMonitor(sample_every=8, collect=False)
+
+    Heap watermarks per screen, per level and per game.
+    - enter() / leave(name): called by InputManager.begin_screen() / end_screen(name);
+      read mem_free / mem_alloc. A screen that calls begin_screen() once per page counts
+      from the first call.
+    - collect: True for a heap profiling run: enter() / leave() gc.collect() first, so the
+      numbers are live data, not garbage (costs a collect on every screen change).
+    - level_start(level): start the low-water mark of a level (right after a gc.collect())
+    - sample(): mem_free() on every sample_every-th call (no collect), keeps the low-water mark
+    - largest_block(): biggest bytearray that can be allocated right now (binary search)
+    - measure(): collect, then free heap + largest block right now
+    - game_end(): measure(), plus the growth since the last game
+    - report(): two lines for the serial console; lines(): short rows for the debug screen
+    """
+
+    def __init__(self, sample_every=8, collect=False):
+        self.sample_every = sample_every
+        self.collect = collect
+        self._count = 0
+        self._inside = False
+        self._free_in = 0
+        self._alloc_in = 0
+
+        # name -> [visits, free when entered, free when left, bytes kept by the last visit]
+        self.screens = {}
+
+        self.low = gc.mem_free()        # lowest mem_free seen anywhere
+        self.low_where = "boot"
+        self.level = 0
+        self.level_low = {}             # level -> lowest mem_free while it was played
+
+        self.games = []                 # mem_alloc after each game (last _MAX_GAMES)
+        self.largest = 0
+        self.free = self.low
+
+    def _note(self, free, where):
+        if free < self.low:
+            self.low = free
+            self.low_where = where
+
+    # ---------- screens ----------
+
+    def enter(self):
+        if self._inside:
+            return
+        self._inside = True
+        if self.collect:
+            gc.collect()
+        self._free_in = gc.mem_free()
+        self._alloc_in = gc.mem_alloc()
+
+    def leave(self, name):
+        if not self._inside:
+            return
+        self._inside = False
+        if self.collect:
+            gc.collect()
+        free = gc.mem_free()
+        entry = self.screens.get(name)
+        if entry is None:
+            entry = [0, 0, 0, 0]
+            self.screens[name] = entry
+        entry[0] += 1
+        entry[1] = self._free_in
+        entry[2] = free
+        entry[3] = gc.mem_alloc() - self._alloc_in
+        self._note(free, name)
+
+    # ---------- levels ----------
+
+    def level_start(self, level):
+        self.level = level
+        free = gc.mem_free()
+        low = self.level_low.get(level)
+        if low is None or free < low:
+            self.level_low[level] = free
+        self._note(free, "L{}".format(level))
+
+    def sample(self):
+        self._count += 1
+        if self._count < self.sample_every:
+            return
+        self._count = 0
+        free = gc.mem_free()
+        if free < self.level_low.get(self.level, free + 1):
+            self.level_low[self.level] = free
+            self._note(free, "L{}".format(self.level))
+
+    # ---------- games ----------
+
+    def largest_block(self, step=256):
+        """Largest single allocation that succeeds now (a failed try runs the gc by itself)."""
+        gc.collect()
+        lo = 0
+        hi = gc.mem_free()
+        while hi - lo > step:
+            mid = (lo + hi) // 2
+            try:
+                block = bytearray(mid)
+                block = None
+                lo = mid
+            except MemoryError:
+                hi = mid
+        gc.collect()
+        return lo
+
+    def measure(self):
+        """Update free / largest / fragmentation now (debug screen, end of a game)."""
+        self.largest = self.largest_block()
+        self.free = gc.mem_free()
+
+    def game_end(self):
+        self.measure()
+        self.games.append(gc.mem_alloc())
+        if len(self.games) > _MAX_GAMES:
+            self.games.pop(0)
+
+    def growth(self):
+        """Bytes still allocated after this game compared with the previous one."""
+        if len(self.games) < 2:
+            return 0
+        return self.games[-1] - self.games[-2]
+
+    def fragmentation(self):
+        """Share of the free heap that is not in the largest block (0 .. 100 %)."""
+        if self.free <= 0:
+            return 0
+        return max(0, 100 - 100 * self.largest // self.free)
+
+    def report(self):
+        """
+        Heap: free 58112 B, low 40960 B (L3), largest block 30720 B (frag 47%), +128 B since last game
+        Heap screens (free in>out kept): Main menu 52112>52000 +112, ...
+        """
+        head = "Heap: free {} B, low {} B ({}), largest block {} B (frag {}%), {:+d} B since last game".format(
+            self.free, self.low, self.low_where, self.largest, self.fragmentation(), self.growth())
+        parts = []
+        for name, (visits, free_in, free_out, kept) in self.screens.items():
+            parts.append("{} {}>{} {:+d}".format(name, free_in, free_out, kept))
+        note = "" if self.collect else ", no collect"
+        return head + "\nHeap screens (free in>out kept{}): ".format(note) + ", ".join(parts)
+
+    def lines(self):
+        """Rows of at most 21 characters (128 px OLED, terminalio font)."""
+        rows = [
+            "free {} lo {}".format(_k(self.free), _k(self.low)),
+            "big {} frag {}%".format(_k(self.largest), self.fragmentation()),
+            "games {} {:+d}B".format(len(self.games), self.growth()),
+        ]
+        for level in sorted(self.level_low):
+            rows.append("L{} low {}".format(level, _k(self.level_low[level])))
+        for name, (visits, free_in, free_out, kept) in self.screens.items():
+            rows.append("{:<10} {} {:+d}".format(name[:10], _k(free_out), kept))
+        return rows
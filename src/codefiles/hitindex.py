@@ -0,0 +1,109 @@
+# hitindex.py
+import array
+
+# zombie hitbox: crosshair hits when |dx| <= HIT_HALF_W and |dy| <= HIT_HALF_H
+HIT_HALF_W = 6
+HIT_HALF_H = 8
+
+
+def _lowest_bit_table():
+    # index of the lowest set bit for every byte value (0 -> 255 = none)
+    table = bytearray(256)
+    table[0] = 255
+    for i in range(1, 256):
+        n = 0
+        while not (i >> n) & 1:
+            n += 1
+        table[i] = n
+    return bytes(table)
+
+
+_LOWEST_BIT = _lowest_bit_table()
+
+
+def in_hitbox(px, py, zx, zy):
+    """Plain box test for a single target (tutorial)."""
+    return abs(px - zx) <= HIT_HALF_W and abs(py - zy) <= HIT_HALF_H
+
+
+class HitIndex:
+    """
+    HitIndex(width=128, height=64, slots=8)
+
+    Constant-time hit testing for up to `slots` (<= 32) zombies on a width x height screen.
+
+    The hitbox test is separable, so the index is two packed bitmaps:
+      cols[x]: bit i is set if slot i's hitbox covers column x
+      rows[y]: bit i is set if slot i's hitbox covers row y
+    A shot at (px, py) hits slot i exactly when bit i is set in cols[px] & rows[py]:
+    one AND, whatever the number of zombies.
+
+    - add(slot, zx, zy): mark a zombie's hitbox (call on spawn)
+    - remove(slot): clear it again (call on remove)
+    - find(px, py): lowest hit slot, or -1
+    """
+
+    def __init__(self, width=128, height=64, slots=8):
+        if slots <= 8:
+            typecode = "B"
+        elif slots <= 16:
+            typecode = "H"
+        elif slots <= 32:
+            typecode = "L"
+        else:
+            raise ValueError("HitIndex supports at most 32 slots")
+        self.width = width
+        self.height = height
+        self.slots = slots
+        self._cols = array.array(typecode, [0] * width)
+        self._rows = array.array(typecode, [0] * height)
+        # (x0, x1, y0, y1) of every marked slot, so remove() knows what to clear
+        self._boxes = [None] * slots
+
+    def add(self, slot, zx, zy):
+        if self._boxes[slot] is not None:
+            self.remove(slot)
+        x0 = max(0, zx - HIT_HALF_W)
+        x1 = min(self.width - 1, zx + HIT_HALF_W)
+        y0 = max(0, zy - HIT_HALF_H)
+        y1 = min(self.height - 1, zy + HIT_HALF_H)
+        bit = 1 << slot
+        cols = self._cols
+        rows = self._rows
+        for x in range(x0, x1 + 1):
+            cols[x] |= bit
+        for y in range(y0, y1 + 1):
+            rows[y] |= bit
+        self._boxes[slot] = (x0, x1, y0, y1)
+
+    def remove(self, slot):
+        box = self._boxes[slot]
+        if box is None:
+            return
+        x0, x1, y0, y1 = box
+        mask = ~(1 << slot)
+        cols = self._cols
+        rows = self._rows
+        for x in range(x0, x1 + 1):
+            cols[x] &= mask
+        for y in range(y0, y1 + 1):
+            rows[y] &= mask
+        self._boxes[slot] = None
+
+    def clear(self):
+        for slot in range(self.slots):
+            self.remove(slot)
+
+    def find(self, px, py):
+        if px < 0 or py < 0 or px >= self.width or py >= self.height:
+            return -1
+        hits = self._cols[px] & self._rows[py]
+        if not hits:
+            return -1
+        base = 0
+        while True:
+            low = _LOWEST_BIT[hits & 0xFF]
+            if low != 255:
+                return base + low
+            hits >>= 8
+            base += 8
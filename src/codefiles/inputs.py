@@ -0,0 +1,338 @@
+# inputs.py
+import time
+import digitalio
+
+try:
+    import keypad
+except ImportError:
+    keypad = None
+
+try:
+    from supervisor import ticks_ms
+except ImportError:
+    ticks_ms = None
+
+_TICKS_MASK = (1 << 29) - 1   # supervisor.ticks_ms() / keypad timestamps wrap at 2**29
+
+# event kinds
+PRESS = "press"              # debounced press
+RELEASE = "release"          # debounced release, value = how long it was held (s)
+LONG_PRESS = "long_press"    # still down after long_press_time (once per press)
+HOLD = "hold"                # still down after hold_time (once per press)
+EDGE = "edge"                # sound: quiet -> loud, t = when it happened (latched)
+TURN = "turn"                # encoder moved, value = detents
+
+# sources
+BTN = "BTN"
+TOUCH = "TOUCH"
+SOUND = "SOUND"
+ENC = "ENC"
+
+TICK = 0.01   # default screen tick (s)
+
+
+class _PinChannel:
+    """One digital input with software debounce (same rule as the old update_button())."""
+
+    def __init__(self, pin, pull, value_when_pressed, debounce):
+        self._io = digitalio.DigitalInOut(pin)
+        self._io.switch_to_input(pull=pull)
+        self._value_when_pressed = value_when_pressed
+        self._debounce = debounce
+        self.down = self.raw()
+        self._last_raw = self.down
+        self._last_change = time.monotonic()
+
+    def raw(self):
+        return self._io.value == self._value_when_pressed
+
+    def sample(self, now):
+        """Return True / False on a debounced press / release, otherwise None."""
+        raw = self.raw()
+        if raw != self._last_raw:
+            self._last_raw = raw
+            self._last_change = now
+        if raw != self.down and (now - self._last_change) > self._debounce:
+            self.down = raw
+            return raw
+        return None
+
+    def flush(self, now):
+        """Forget a change still being debounced; down = the pin right now."""
+        self.down = self._last_raw = self.raw()
+        self._last_change = now
+
+
+class _KeyChannel:
+    """Trigger button scanned and debounced in the background by keypad.Keys."""
+
+    def __init__(self, pin, debounce):
+        self._keys = keypad.Keys((pin,), value_when_pressed=False, pull=True, interval=debounce)
+        self._event = keypad.Event()
+        self.down = False
+
+    def sample(self, now):
+        # one press/release per tick at most; the rest stays queued in keypad
+        if self._keys.events.get_into(self._event):
+            self.down = self._event.pressed
+            return self.down
+        return None
+
+    def flush(self, now):
+        """
+        Drop presses still queued in keypad (made while a screen was blocked, e.g.
+        effects.run_for()); the last one leaves down = the button's real level.
+        """
+        queue = self._keys.events
+        while queue.get_into(self._event):
+            self.down = self._event.pressed
+        queue.overflowed = False
+
+
+class _SoundKeys:
+    """
+    Sound sensor scanned by keypad.Keys in the background every `scan` seconds:
+    every quiet -> loud edge is queued with its timestamp, also between two ticks
+    (and while a screen is busy), so a short clap is never missed.
+    """
+
+    def __init__(self, pin, scan):
+        self._keys = keypad.Keys((pin,), value_when_pressed=False, pull=True, interval=scan)
+        self._event = keypad.Event()
+        self.loud = False
+        self.overflows = 0
+
+    def edges(self, now, out):
+        """Append the time of every edge since the last call to `out`."""
+        queue = self._keys.events
+        ev = self._event
+        while queue.get_into(ev):
+            self.loud = ev.pressed
+            if ev.pressed:
+                if ticks_ms is not None:
+                    age = (ticks_ms() - ev.timestamp) & _TICKS_MASK
+                    out.append(now - age / 1000)
+                else:
+                    out.append(now)
+        if queue.overflowed:
+            queue.overflowed = False
+            self.overflows += 1
+
+
+class _SoundPin:
+    """Fallback without keypad: the level is read once per tick (short claps can fall between)."""
+
+    def __init__(self, pin):
+        self._io = digitalio.DigitalInOut(pin)
+        self._io.switch_to_input(pull=digitalio.Pull.UP)
+        self.loud = not self._io.value
+        self.overflows = 0
+
+    def edges(self, now, out):
+        loud = not self._io.value
+        if loud and not self.loud:
+            out.append(now)
+        self.loud = loud
+
+
+class InputManager:
+    """
+    InputManager(btn_pin, touch_pin, sound_pin, encoder, *, debounce=0.02,
+                 long_press_time=0.6, hold_time=0.5, use_keypad=True,
+                 sound_scan=0.001, sound_refractory=0.05, sound_mask=None, heap=None)
+
+    Samples the trigger button, touch pad, sound sensor and rotary encoder once per tick()
+    and publishes timestamped events for that tick:
+        inp.tick()
+        for kind, source, t, value in inp.events:
+            ...
+    - kinds: PRESS, RELEASE, LONG_PRESS, HOLD, EDGE (sound), TURN (encoder)
+    - is_down(source): debounced level (shield uses this every frame)
+    - has(kind, source) / pressed(source): was there such an event this tick
+    - idle(period): sleep for the rest of the tick instead of spinning
+    - wait_press(source): block (tick + idle) until a press
+    - begin_screen() / end_screen(name, cpu=True): drop stale events, print CPU busy % of a screen
+    - heap: optional heapwatch.HeapMonitor, told when a screen begins / ends
+    The trigger button and the sound sensor are scanned by keypad.Keys when the board has
+    it (use_keypad=True). Sound:
+    - every edge since the last tick becomes an EDGE event, t = time of the edge
+    - sound_refractory: edges closer than this to the last clap are the same clap (chatter)
+    - sound_mask(t): return True to drop an edge (music.masked: the buzzer itself)
+    - sound_claps / sound_merged / sound_masked: counters since begin_screen()
+    """
+
+    def __init__(self, btn_pin, touch_pin, sound_pin, encoder, *, debounce=0.02,
+                 long_press_time=0.6, hold_time=0.5, use_keypad=True,
+                 sound_scan=0.001, sound_refractory=0.05, sound_mask=None, heap=None):
+        if use_keypad and keypad is not None:
+            btn = _KeyChannel(btn_pin, debounce)
+            sound = _SoundKeys(sound_pin, sound_scan)
+        else:
+            btn = _PinChannel(btn_pin, digitalio.Pull.UP, False, debounce)
+            sound = _SoundPin(sound_pin)
+        touch = _PinChannel(touch_pin, digitalio.Pull.DOWN, True, debounce)
+        self._channels = ((BTN, btn), (TOUCH, touch))
+
+        # sound: quiet = 1, loud = 0; edges are latched, chatter within a clap is merged
+        self._sound = sound
+        self._sound_edges = []
+        self._last_clap = -1.0
+        self.sound_refractory = sound_refractory
+        self.sound_mask = sound_mask
+        self.sound_claps = 0
+        self.sound_merged = 0
+        self.sound_masked = 0
+
+        self.encoder = encoder
+        self.heap = heap
+
+        self.long_press_time = long_press_time
+        self.hold_time = hold_time
+
+        now = time.monotonic()
+        self._down_since = {BTN: now, TOUCH: now}
+        self._long_sent = {BTN: True, TOUCH: True}   # no LONG/HOLD for a press held at boot
+        self._hold_sent = {BTN: True, TOUCH: True}
+        self._pressed_here = {BTN: False, TOUCH: False}
+
+        self.events = []
+        self.now = now
+
+        # CPU usage of the current screen
+        self._busy = 0.0
+        self._idle = 0.0
+        self._wake = now
+
+    # ---------- sampling ----------
+
+    def tick(self):
+        now = time.monotonic()
+        self.now = now
+        events = self.events
+        events.clear()
+
+        for source, ch in self._channels:
+            change = ch.sample(now)
+            if change is True:
+                self._down_since[source] = now
+                self._long_sent[source] = False
+                self._hold_sent[source] = False
+                self._pressed_here[source] = True
+                events.append((PRESS, source, now, None))
+            elif change is False:
+                held = now - self._down_since[source]
+                # a release only counts if this screen saw the press
+                if self._pressed_here[source]:
+                    events.append((RELEASE, source, now, held))
+                self._pressed_here[source] = False
+            elif ch.down:
+                held = now - self._down_since[source]
+                if not self._hold_sent[source] and held >= self.hold_time:
+                    self._hold_sent[source] = True
+                    events.append((HOLD, source, now, held))
+                if not self._long_sent[source] and held >= self.long_press_time:
+                    self._long_sent[source] = True
+                    events.append((LONG_PRESS, source, now, held))
+
+        edges = self._sound_edges
+        edges.clear()
+        self._sound.edges(now, edges)
+        for t in edges:
+            if self.sound_mask is not None and self.sound_mask(t):
+                self.sound_masked += 1
+            elif t - self._last_clap < self.sound_refractory:
+                self.sound_merged += 1
+            else:
+                self._last_clap = t
+                self.sound_claps += 1
+                events.append((EDGE, SOUND, t, None))
+
+        if self.encoder is not None:
+            self.encoder.update()
+            delta = self.encoder.get_delta()
+            if delta:
+                events.append((TURN, ENC, now, delta))
+
+    def is_down(self, source):
+        for src, ch in self._channels:
+            if src == source:
+                return ch.down
+        return self._sound.loud   # SOUND: currently loud
+
+    def has(self, kind, source):
+        """True if this tick has a `kind` event from `source`."""
+        for k, src, _, _ in self.events:
+            if k == kind and src == source:
+                return True
+        return False
+
+    def pressed(self, source=BTN):
+        return self.has(PRESS, source)
+
+    # ---------- pacing / screens ----------
+
+    def idle(self, period=TICK):
+        """Sleep until the next tick; busy time before it counts as CPU use."""
+        now = time.monotonic()
+        self._busy += now - self._wake
+        time.sleep(period)
+        self._wake = time.monotonic()
+        self._idle += self._wake - now
+
+    def wait_press(self, source=BTN, period=TICK):
+        while True:
+            self.tick()
+            if self.pressed(source):
+                return self.now
+            self.idle(period)
+
+    def begin_screen(self):
+        """
+        New screen: forget events and presses that belong to the previous one.
+        A press still held from the last screen gives no RELEASE / LONG_PRESS here,
+        but HOLD is re-armed (touch pad held across screens still unlocks after hold_time).
+        """
+        self.events.clear()
+        now = time.monotonic()
+        for source, ch in self._channels:
+            # presses from the previous screen (still queued in keypad) do not count here
+            ch.flush(now)
+            self._pressed_here[source] = False
+            self._long_sent[source] = True
+            self._hold_sent[source] = not ch.down
+            self._down_since[source] = now
+        # claps from the previous screen (still queued in keypad) do not count here
+        self._sound_edges.clear()
+        self._sound.edges(now, self._sound_edges)
+        self.sound_claps = 0
+        self.sound_merged = 0
+        self.sound_masked = 0
+        if self.heap is not None:
+            self.heap.enter()
+        self._busy = 0.0
+        self._idle = 0.0
+        self._wake = time.monotonic()
+
+    def cpu_busy(self):
+        total = self._busy + self._idle
+        if total <= 0:
+            return 0.0
+        return 100.0 * self._busy / total
+
+    def sound_report(self):
+        return "Sound: {} claps, {} merged (chatter), {} masked (buzzer), {} queue overflows".format(
+            self.sound_claps, self.sound_merged, self.sound_masked, self._sound.overflows)
+
+    def end_screen(self, name, cpu=True):
+        """
+        Screen done: print its CPU busy share (from idle()) and its heap watermarks.
+        cpu=False: the screen was not paced by idle() (the game runs on Runtime, whose
+        report has the real figure), so there is no busy share to print.
+        """
+        now = time.monotonic()
+        self._busy += now - self._wake
+        self._wake = now
+        if cpu:
+            print("{}: CPU busy {:.1f}%".format(name, self.cpu_busy()))
+        if self.heap is not None:
+            self.heap.leave(name)
@@ -0,0 +1,50 @@
+# lazy.py
+#
+# 少用的画面模块（彩蛋、输入名字）不在开机时 import：
+#   load(name)   用到时才 import（已经在内存里就直接返回），记下 import 花了多少 ms
+#   unload(name) 用完从 sys.modules 删掉，gc 回收它的函数和剧情文字，下次 load() 重新 import
+# 调用的地方不要把模块存成全局变量（lazy.load("easter").show_no_shot(...)），
+# 否则 unload() 之后模块还被引用着，内存收不回来。
+# 源码 .py 每次 import 都要在板子上编译；mpy-cross 预编译成 .mpy 后 import 快很多
+# （tools/build_mpy.py）。
+import gc
+import sys
+import time
+
+import_ms = {}      # module name -> ms the last import took
+freed = {}          # module name -> bytes the last unload gave back
+
+
+def load(name):
+    mod = sys.modules.get(name)
+    if mod is None:
+        t0 = time.monotonic_ns()
+        mod = __import__(name)
+        import_ms[name] = (time.monotonic_ns() - t0) / 1000000
+    return mod
+
+
+def unload(name):
+    if name not in sys.modules:
+        return 0
+    gc.collect()
+    before = gc.mem_free()
+    del sys.modules[name]
+    gc.collect()
+    freed[name] = gc.mem_free() - before
+    return freed[name]
+
+
+def source(path):
+    """'.mpy' or '.py' for a module's __file__: compiled on the host or on the board."""
+    return ".mpy" if path.endswith(".mpy") else ".py"
+
+
+def report():
+    parts = []
+    for name in import_ms:
+        part = "{} {:.1f} ms".format(name, import_ms[name])
+        if name in freed:
+            part += " (unload freed {} B)".format(freed[name])
+        parts.append(part)
+    return "Lazy imports: " + (", ".join(parts) if parts else "none")
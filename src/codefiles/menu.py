@@ -2,6 +2,8 @@ import time
 import displayio
 import terminalio
 from adafruit_display_text import label
+from pacer import TickTimer
+from inputs import PRESS, TURN, BTN, TICK
 
 # 主菜单选项
 MENU_OPTIONS = ["PLAY", "SCORES", "SETTINGS"]
@@ -12,49 +14,70 @@ DIFFICULTY_OPTIONS = ["EASY", "NORMAL", "DIFFICULT"]
 # 旋钮累积阈值：累积到 ±2 才真正移动一格菜单
 STEP_THRESHOLD = 2
 
+# 菜单画面只建一次（Group + Label 常驻），之后每一格只改变化了的 label.text
+_main_screen = None        # (group, [item labels])
+_difficulty_screen = None
+
+
+def _build_screen(title_text, title_x, item_count, item_x):
+    group = displayio.Group()
+    group.append(label.Label(terminalio.FONT, text=title_text, x=title_x, y=10))
+
+    items = []
+    start_y = 28
+    for i in range(item_count):
+        item = label.Label(terminalio.FONT, text="", x=item_x, y=start_y + i * 12)
+        group.append(item)
+        items.append(item)
+    return group, items
+
+
+def _set_items(items, texts, selected):
+    """只改文字有变化的选项（通常只有光标 "> " 移走和移到的两行）"""
+    for i, txt in enumerate(texts):
+        prefix = "> " if i == selected else "  "
+        new_text = prefix + txt
+        if items[i].text != new_text:
+            items[i].text = new_text
+
+
+def build_screens():
+    """两个菜单画面提前建好（开机时在标题动画的空闲帧里做）"""
+    global _main_screen, _difficulty_screen
+    if _main_screen is None:
+        _main_screen = _build_screen("ZOMBIE SHOOTER", 5, len(MENU_OPTIONS), 5)
+    if _difficulty_screen is None:
+        _difficulty_screen = _build_screen("SELECT LEVEL", 20, len(DIFFICULTY_OPTIONS), 30)
+
 
 # ========== 主菜单绘制 ==========
 
 def draw_menu(display, selected, current_difficulty):
     """绘制主菜单界面，并在 SETTINGS 后显示当前难度"""
-    group = displayio.Group()
-    display.root_group = group
-
-    # 标题
-    title = label.Label(
-        terminalio.FONT,
-        text="ZOMBIE SHOOTER",
-        x=5,
-        y=10
-    )
-    group.append(title)
-
-    # 菜单选项列表
-    start_y = 28
-    for i, txt in enumerate(MENU_OPTIONS):
+    global _main_screen
+    if _main_screen is None:
+        _main_screen = _build_screen("ZOMBIE SHOOTER", 5, len(MENU_OPTIONS), 5)
+    group, items = _main_screen
+
+    texts = []
+    for txt in MENU_OPTIONS:
         # SETTINGS 后面加上当前难度
         if txt == "SETTINGS":
-            txt_to_show = "SETTINGS(" + current_difficulty + ")"
+            texts.append("SETTINGS(" + current_difficulty + ")")
         else:
-            txt_to_show = txt
-
-        prefix = "> " if i == selected else "  "
-        item = label.Label(
-            terminalio.FONT,
-            text=prefix + txt_to_show,
-            x=5,
-            y=start_y + i * 12
-        )
-        group.append(item)
+            texts.append(txt)
+    _set_items(items, texts, selected)
 
+    if display.root_group is not group:
+        display.root_group = group
     return group
 
 
-def main_menu(display, encoder, btn, current_difficulty):
+def main_menu(display, inp, current_difficulty):
     """
-    主菜单逻辑：
-    - 旋钮：用 get_delta() + 累积，避免抖动来回跳
-    - 按按钮：确认选择
+    主菜单逻辑（inp: inputs.InputManager）：
+    - 旋钮：TURN 事件 + 累积，避免抖动来回跳
+    - 按按钮：PRESS 事件确认选择
     """
     selected = 0
 
@@ -63,70 +86,57 @@ def main_menu(display, encoder, btn, current_difficulty):
 
     # 先画一次菜单
     draw_menu(display, selected, current_difficulty)
+    timer = TickTimer()
+    inp.begin_screen()
 
     while True:
-        # 更新旋钮内部状态
-        encoder.update()
-        delta = encoder.get_delta()  # 这段时间的净变化（可能是 -3, -2, -1, 0, 1,...）
-
-        if delta != 0:
-            accum += delta
-
-            # 顺时针：累积到正方向阈值
-            if accum >= STEP_THRESHOLD:
-                selected = (selected + 1) % len(MENU_OPTIONS)
-                accum = 0
-                draw_menu(display, selected, current_difficulty)
-
-            # 逆时针：累积到负方向阈值
-            elif accum <= -STEP_THRESHOLD:
-                selected = (selected - 1) % len(MENU_OPTIONS)
-                accum = 0
-                draw_menu(display, selected, current_difficulty)
-
-        # 按钮确认
-        if not btn.value:
-            time.sleep(0.15)  # 简单去抖
-            if not btn.value:
-                while not btn.value:
-                    time.sleep(0.01)
+        inp.tick()
+        for kind, source, _, value in inp.events:
+            if kind == TURN:
+                accum += value  # 这段时间的净变化（可能是 -3, -2, -1, 0, 1,...）
+
+                # 顺时针：累积到正方向阈值
+                if accum >= STEP_THRESHOLD:
+                    selected = (selected + 1) % len(MENU_OPTIONS)
+                    accum = 0
+                    t0 = time.monotonic_ns()
+                    draw_menu(display, selected, current_difficulty)
+                    timer.add(t0)
+
+                # 逆时针：累积到负方向阈值
+                elif accum <= -STEP_THRESHOLD:
+                    selected = (selected - 1) % len(MENU_OPTIONS)
+                    accum = 0
+                    t0 = time.monotonic_ns()
+                    draw_menu(display, selected, current_difficulty)
+                    timer.add(t0)
+
+            # 按钮确认（去抖已经在 InputManager 里做了）
+            elif kind == PRESS and source == BTN:
+                timer.report("Main menu")
+                inp.end_screen("Main menu")
                 return MENU_OPTIONS[selected]
 
-        time.sleep(0.01)
+        inp.idle(TICK)
 
 
 # ========== 难度菜单绘制 ==========
 
 def draw_difficulty_menu(display, selected):
     """绘制难度选择菜单"""
-    group = displayio.Group()
-    display.root_group = group
-
-    # 标题
-    title = label.Label(
-        terminalio.FONT,
-        text="SELECT LEVEL",
-        x=20,
-        y=10
-    )
-    group.append(title)
-
-    # 难度选项
-    start_y = 28
-    for i, txt in enumerate(DIFFICULTY_OPTIONS):
-        prefix = "> " if i == selected else "  "
-        item = label.Label(
-            terminalio.FONT,
-            text=prefix + txt,
-            x=30,
-            y=start_y + i * 12
-        )
-        group.append(item)
+    global _difficulty_screen
+    if _difficulty_screen is None:
+        _difficulty_screen = _build_screen("SELECT LEVEL", 20, len(DIFFICULTY_OPTIONS), 30)
+    group, items = _difficulty_screen
 
+    _set_items(items, DIFFICULTY_OPTIONS, selected)
+
+    if display.root_group is not group:
+        display.root_group = group
     return group
 
 
-def difficulty_menu(display, encoder, btn):
+def difficulty_menu(display, inp):
     """
     难度菜单逻辑：
     - 一样用累积的方式来防抖
@@ -136,31 +146,32 @@ def difficulty_menu(display, encoder, btn):
     accum = 0
 
     draw_difficulty_menu(display, selected)
+    timer = TickTimer()
+    inp.begin_screen()
 
     while True:
-        encoder.update()
-        delta = encoder.get_delta()
-
-        if delta != 0:
-            accum += delta
-
-            if accum >= STEP_THRESHOLD:
-                selected = (selected + 1) % len(DIFFICULTY_OPTIONS)
-                accum = 0
-                draw_difficulty_menu(display, selected)
-            elif accum <= -STEP_THRESHOLD:
-                selected = (selected - 1) % len(DIFFICULTY_OPTIONS)
-                accum = 0
-                draw_difficulty_menu(display, selected)
-
-        # 按钮确认
-        if not btn.value:
-            time.sleep(0.15)
-            if not btn.value:
-                while not btn.value:
-                    time.sleep(0.01)
+        inp.tick()
+        for kind, source, _, value in inp.events:
+            if kind == TURN:
+                accum += value
+
+                if accum >= STEP_THRESHOLD:
+                    selected = (selected + 1) % len(DIFFICULTY_OPTIONS)
+                    accum = 0
+                    t0 = time.monotonic_ns()
+                    draw_difficulty_menu(display, selected)
+                    timer.add(t0)
+                elif accum <= -STEP_THRESHOLD:
+                    selected = (selected - 1) % len(DIFFICULTY_OPTIONS)
+                    accum = 0
+                    t0 = time.monotonic_ns()
+                    draw_difficulty_menu(display, selected)
+                    timer.add(t0)
+
+            # 按钮确认
+            elif kind == PRESS and source == BTN:
+                timer.report("Difficulty menu")
+                inp.end_screen("Difficulty menu")
                 return DIFFICULTY_OPTIONS[selected]
 
-        time.sleep(0.01)
-
-
+        inp.idle(TICK)
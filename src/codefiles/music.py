@@ -0,0 +1,258 @@
+# music.py
+#
+# 蜂鸣器的 tracker 风格音乐引擎：
+#   旋律 / 音效都是紧凑的音符表（Tune：每行 3 字节 note, length, volume），
+#   update(now) 按时间戳一行一行往前推，从不 sleep，只在频率 / 占空比变了的时候写 PWM
+#   - 休止符（REST）、每个音符的音量包络（envelope）
+#   - 两个声部：背景音乐（MUSIC）和音效（SFX / ALERT）。音效直接盖过音乐，
+#     音乐的时间照走，音效结束后接着听到；优先级低的音效抢不到正在响的高优先级音效
+#   - masked(t)：蜂鸣器在 t 前后是不是真的在响（按实际开 / 关 PWM 的时刻，休止符不算），
+#     InputManager 的 sound_mask 用它丢掉蜂鸣器自己触发的声音边沿
+import time
+
+MUSIC = 0     # background music: any sound effect pre-empts it, it resumes afterwards
+SFX = 1       # game sounds (hits, beeps, cutscene noises)
+ALERT = 2     # damage: an ordinary SFX does not cut it off
+
+REST = 0
+
+# MIDI notes 108..119 (C8..B8) in Hz; lower octaves are right shifts (no floats, no FPU)
+_TOP_OCTAVE = (4186, 4435, 4699, 4978, 5274, 5588, 5920, 6272, 6645, 7040, 7459, 7902)
+
+# tone windows remembered for masked(): sound edges are latched and checked
+# up to a frame later, so the last few tones matter, not only the current one
+_TONE_WINDOWS = 4
+
+# volume envelopes (% of the note's volume per row, last one held)
+PLUCK = (100, 85, 70, 60, 55, 50)
+
+
+def note_freq(note):
+    """MIDI note number (12..119) -> Hz, 69 = A4 = 440 Hz."""
+    return _TOP_OCTAVE[note % 12] >> (9 - note // 12)
+
+
+class Tune:
+    """
+    Tune(rows, row_ms=10, envelope=None, loop=False)
+
+    A note table, packed 3 bytes per row.
+    - rows: ((note, length, volume), ...)
+        note    MIDI number (69 = A4 = 440 Hz) or REST
+        length  in rows of row_ms (1..255)
+        volume  % of full PWM duty (0..100)
+    - envelope: % of the volume for each row of a note, from its first row;
+      the last value is held (None = flat)
+    - loop: start over at the end (background music)
+    """
+
+    def __init__(self, rows, row_ms=10, envelope=None, loop=False):
+        data = bytearray()
+        for note, length, volume in rows:
+            data += bytes((note, length, volume))
+        self.data = bytes(data)
+        self.row = row_ms / 1000
+        self.envelope = bytes(envelope) if envelope else None
+        self.loop = loop
+
+    def duration(self):
+        """Seconds for one pass through the table."""
+        return sum(self.data[i + 1] for i in range(0, len(self.data), 3)) * self.row
+
+
+class _Voice:
+    # one tune being played: where it is in the table and when its next row starts
+
+    def __init__(self):
+        self.active = False
+        self.tune = None      # None while playing a beep()
+        self.priority = MUSIC
+        self.pos = 0          # offset of the current note in tune.data
+        self.row = 0          # row within the current note
+        self.next_at = 0.0    # when the next row starts (beep: when it ends)
+        self.freq = 0         # Hz, 0 = rest
+        self.volume = 0
+        self.duty = 0
+
+    def start(self, tune, priority, now):
+        self.active = True
+        self.tune = tune
+        self.priority = priority
+        self.pos = 0
+        self.row = 0
+        self.next_at = now + tune.row
+        self._note()
+
+    def tone(self, freq, seconds, volume, priority, now):
+        self.active = True
+        self.tune = None
+        self.priority = priority
+        self.next_at = now + seconds
+        self.freq = int(freq)
+        self.volume = volume
+        self.duty = 655 * volume
+
+    def _note(self):
+        data = self.tune.data
+        note = data[self.pos]
+        self.freq = note_freq(note) if note else 0
+        self.volume = data[self.pos + 2]
+        self._level()
+
+    def _level(self):
+        if not self.freq:
+            self.duty = 0
+            return
+        env = self.tune.envelope
+        level = 100
+        if env is not None:
+            level = env[self.row] if self.row < len(env) else env[-1]
+        self.duty = 65535 * self.volume * level // 10000
+
+    def step(self, now):
+        """Advance to `now`, row by row (catches up after a slow frame)."""
+        tune = self.tune
+        if tune is None:
+            if now >= self.next_at:
+                self.active = False
+            return
+        data = tune.data
+        while now >= self.next_at:
+            self.next_at += tune.row
+            self.row += 1
+            if self.row >= data[self.pos + 1]:
+                self.row = 0
+                self.pos += 3
+                if self.pos >= len(data):
+                    if not tune.loop:
+                        self.active = False
+                        return
+                    self.pos = 0
+                self._note()
+            elif tune.envelope is not None:
+                self._level()
+
+
+class Music:
+    """
+    Music(buzzer, *, mask_before=0.005, mask_after=0.03)
+
+    Non-blocking tracker-style player for the piezo buzzer (pwmio.PWMOut).
+    - play(tune, priority=SFX): start a Tune. MUSIC replaces the background tune;
+      a sound effect replaces one of the same or lower priority and is dropped
+      (returns False, counted in .dropped) while a higher one plays.
+      Effects pre-empt the music, which keeps its time and is heard again after them.
+    - beep(freq, ms, volume, priority=SFX): one tone of any frequency (volume in %).
+    - update(now): step function, call every frame / effects tick; only writes the
+      PWM when the frequency or duty changes. Never sleeps.
+    - Playback state: sounding, freq, priority (of what is heard, -1 = silent),
+      busy() (anything playing), pending() (a tune that will end by itself).
+    - masked(t): True if the buzzer was on around time t (widened by mask_before /
+      mask_after for timestamp jitter and the sensor's tail). Rests are not masked.
+    - finish(): play out what is pending (blocking); stop(): silence, music too.
+    - muted: play() / beep() do nothing (fast-forward replay: nothing calls update()).
+    """
+
+    def __init__(self, buzzer, *, mask_before=0.005, mask_after=0.03):
+        self._buzzer = buzzer
+        self.mask_before = mask_before
+        self.mask_after = mask_after
+        self._music = _Voice()
+        self._sfx = _Voice()
+
+        self.sounding = False
+        self.freq = 0
+        self.priority = -1
+        self._duty = 0
+        self.dropped = 0
+        self.muted = False
+
+        # [start, end] of the last tones, end = None while still sounding (ring buffer)
+        self._tones = [[-1.0, -1.0] for _ in range(_TONE_WINDOWS)]
+        self._tone_i = 0
+
+    def play(self, tune, priority=SFX):
+        if self.muted:
+            return False
+        now = time.monotonic()
+        if priority == MUSIC:
+            self._music.start(tune, MUSIC, now)
+        else:
+            if not self._claim(priority):
+                return False
+            self._sfx.start(tune, priority, now)
+        self._apply(now)
+        return True
+
+    def beep(self, freq, ms, volume, priority=SFX):
+        if self.muted or not self._claim(priority):
+            return False
+        now = time.monotonic()
+        self._sfx.tone(freq, ms / 1000, volume, priority, now)
+        self._apply(now)
+        return True
+
+    def _claim(self, priority):
+        if self._sfx.active and self._sfx.priority > priority:
+            self.dropped += 1
+            return False
+        return True
+
+    def busy(self):
+        return self._sfx.active or self._music.active
+
+    def pending(self):
+        return self._sfx.active or (self._music.active and not self._music.tune.loop)
+
+    def update(self, now=None):
+        """Advance both voices to `now` and put the one that is heard on the buzzer."""
+        if now is None:
+            now = time.monotonic()
+        if self._sfx.active:
+            self._sfx.step(now)
+        if self._music.active:
+            self._music.step(now)
+        self._apply(now)
+
+    def _apply(self, now):
+        voice = self._sfx if self._sfx.active else self._music
+        duty = voice.duty if voice.active else 0
+        if duty:
+            if voice.freq != self.freq:
+                self._buzzer.frequency = voice.freq
+                self.freq = voice.freq
+            if duty != self._duty:
+                self._buzzer.duty_cycle = duty
+                self._duty = duty
+            self.priority = voice.priority
+            if not self.sounding:
+                # 新的一段蜂鸣：占用下一个窗口
+                self._tone_i = (self._tone_i + 1) % _TONE_WINDOWS
+                window = self._tones[self._tone_i]
+                window[0] = now
+                window[1] = None
+                self.sounding = True
+        elif self.sounding:
+            self._buzzer.duty_cycle = 0
+            self._duty = 0
+            self.priority = -1
+            self._tones[self._tone_i][1] = now
+            self.sounding = False
+
+    def masked(self, t):
+        """Was the buzzer sounding around time t (InputManager sound_mask)?"""
+        for start, end in self._tones:
+            if t >= start - self.mask_before and (end is None or t <= end + self.mask_after):
+                return True
+        return False
+
+    def finish(self):
+        """Play out every tune that ends by itself (blocking)."""
+        while self.pending():
+            self.update()
+            time.sleep(0.005)
+
+    def stop(self):
+        self._sfx.active = False
+        self._music.active = False
+        self._apply(time.monotonic())
@@ -0,0 +1,29 @@
+# pacer.py
+import time
+
+
+class TickTimer:
+    """
+    TickTimer()
+
+    Measures how long each UI redraw takes (microseconds).
+    - add(start_ns): call after a redraw, with time.monotonic_ns() taken before it
+    - report(name): print avg / max redraw time
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total_us = 0
+        self.max_us = 0
+
+    def add(self, start_ns):
+        us = (time.monotonic_ns() - start_ns) // 1000
+        self.count += 1
+        self.total_us += us
+        if us > self.max_us:
+            self.max_us = us
+
+    def report(self, name):
+        if self.count:
+            print("{} redraw: avg {} us, max {} us over {} ticks".format(
+                name, self.total_us // self.count, self.max_us, self.count))
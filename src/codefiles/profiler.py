@@ -0,0 +1,123 @@
+# profiler.py
+#
+# 按阶段计时：游戏卡一下的时候，到底是哪一段慢？
+#   begin() 记下起点，lap(phase) 把从上一个 begin() / lap() 到现在的时间记到这个阶段上
+#   每个阶段：次数、min / avg / max（整数 us）、直方图；另外一个定长环形缓冲区存最近的原始样本
+#   全部用预先分配好的 array，开着的时候也不往堆上加东西（monotonic_ns 的临时大整数除外）
+#   关掉（on = False）时 begin() / lap() 第一行就 return
+import array
+import time
+
+# histogram bin upper edges (us); the last bin is everything above
+HIST_EDGES_US = (50, 100, 200, 500, 1000, 2000, 5000, 10000)
+_BINS = len(HIST_EDGES_US) + 1
+_US_MAX = 65535
+
+
+class PhaseProfiler:
+    """
+    PhaseProfiler(phases, ring=256, on=False, clock_ns=time.monotonic_ns)
+
+    Per-phase timing for the game tasks, switchable at runtime.
+    - phases: tuple of phase names; lap() takes the index
+    - on: switch it on / off at any time (off: begin() / lap() return at once)
+    - begin(): start timing (top of a task step)
+    - lap(phase): charge the time since begin() / the last lap() to `phase`
+    - reset(): clear stats and ring (new game)
+    - report(): per-phase count, min / avg / max, histogram, plus the slowest
+      recent samples from the ring buffer
+    - clock_ns: timer (the host replay passes time.perf_counter_ns)
+    Times are whole microseconds; a sample above 65.5 ms is stored as 65535.
+    """
+
+    def __init__(self, phases, ring=256, on=False, clock_ns=time.monotonic_ns):
+        self.phases = phases
+        self.on = on
+        self.clock_ns = clock_ns
+        n = len(phases)
+        self._count = array.array("L", [0] * n)
+        self._sum = array.array("L", [0] * n)
+        self._min = array.array("H", [_US_MAX] * n)
+        self._max = array.array("H", [0] * n)
+        self._hist = array.array("L", [0] * (n * _BINS))
+        # ring: phase index + duration of the last `ring` samples
+        self._ring_phase = bytearray(ring)
+        self._ring_us = array.array("H", [0] * ring)
+        self._ring_i = 0
+        self._ring_n = 0
+        self._t = 0
+
+    def reset(self):
+        for i in range(len(self.phases)):
+            self._count[i] = 0
+            self._sum[i] = 0
+            self._min[i] = _US_MAX
+            self._max[i] = 0
+        for i in range(len(self._hist)):
+            self._hist[i] = 0
+        self._ring_i = 0
+        self._ring_n = 0
+
+    def begin(self):
+        if not self.on:
+            return
+        self._t = self.clock_ns()
+
+    def lap(self, phase):
+        if not self.on:
+            return
+        now = self.clock_ns()
+        us = (now - self._t) // 1000
+        self._t = now
+        if us > _US_MAX:
+            us = _US_MAX
+
+        self._count[phase] += 1
+        self._sum[phase] += us
+        if us < self._min[phase]:
+            self._min[phase] = us
+        if us > self._max[phase]:
+            self._max[phase] = us
+        b = 0
+        for edge in HIST_EDGES_US:
+            if us < edge:
+                break
+            b += 1
+        self._hist[phase * _BINS + b] += 1
+
+        i = self._ring_i
+        self._ring_phase[i] = phase
+        self._ring_us[i] = us
+        i += 1
+        self._ring_i = 0 if i == len(self._ring_us) else i
+        if self._ring_n < len(self._ring_us):
+            self._ring_n += 1
+
+    def slowest(self, n=5):
+        """(us, phase name, samples ago) of the n slowest samples still in the ring."""
+        size = len(self._ring_us)
+        found = []
+        for k in range(self._ring_n):
+            i = (self._ring_i - 1 - k) % size
+            found.append((self._ring_us[i], self.phases[self._ring_phase[i]], k))
+        found.sort(reverse=True)
+        return found[:n]
+
+    def report(self):
+        """
+        Phase profile (us): count min avg max | <50 <100 <200 <500 <1m <2m <5m <10m >=10m
+          zombies    4480    21   35  410 | 4100 350 25 5 0 0 0 0 0
+        Slowest recent: render 3200 us (12 samples ago), ...
+        """
+        lines = ["Phase profile (us): count min avg max | <50 <100 <200 <500 <1m <2m <5m <10m >=10m"]
+        for p, name in enumerate(self.phases):
+            count = self._count[p]
+            if not count:
+                continue
+            hist = " ".join(str(self._hist[p * _BINS + b]) for b in range(_BINS))
+            lines.append("  {:<8} {:6d} {:5d} {:5d} {:5d} | {}".format(
+                name, count, self._min[p], self._sum[p] // count, self._max[p], hist))
+        worst = ", ".join("{} {} us ({} samples ago)".format(name, us, ago)
+                          for us, name, ago in self.slowest())
+        lines.append("Slowest recent: " + (worst if worst else "none"))
+        return "\n".join(lines)
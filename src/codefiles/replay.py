@@ -0,0 +1,118 @@
+# replay.py
+#
+# 一局游戏的输入录制 / 回放
+#   trace 文件 = 头（magic, RNG seed, 难度）+ 每个逻辑帧 6 字节 + 结尾（最终 score / hp / level）
+#   每帧记录的是 logic_step() 开始时看到的全部输入：
+#     dt_ms   距上一帧的毫秒数（游戏时间以整毫秒计，录制和回放算出来的浮点数完全一样）
+#     shots   还没处理的按键数
+#     flags   bit0 = 护盾（触摸），bit1..7 = 还没处理的声音次数
+#     px, py  准星位置
+#   seed 相同 + 每帧输入相同 -> spawn_zombie() 的随机数、分数、HP 完全一样。
+import struct
+
+MAGIC = b"ZRT2"          # 2: spawns use game.py's xorshift32 instead of random (ZRT1 traces do not replay)
+_HEADER = "<4sIB"      # magic, seed, len(difficulty)；后面跟难度字符串
+_FRAME = "<HBBBB"      # dt_ms, shots, flags, px, py
+FRAME_SIZE = 6
+_END = 0xFFFF          # dt_ms == 0xFFFF: 结尾标记，后面跟 _RESULT
+_RESULT = "<hhB?"      # score, hp, level, cleared
+
+
+class TraceWriter:
+    """
+    TraceWriter(path, seed, difficulty, buffer_frames=128)
+
+    Writes one game's per-frame input trace to flash.
+    - frame(t_ms, shots, sounds, shield, px, py): one logic frame
+      (t_ms: game time in whole ms since the game started)
+    - close(score, hp, level, cleared): flush, then write the end marker and the result
+    Frames are packed into a preallocated buffer; the file is written once the
+    buffer is full (128 frames = 3.2 s of play, 768 bytes), not every frame.
+    """
+
+    def __init__(self, path, seed, difficulty, buffer_frames=128):
+        self.path = path
+        self.frames = 0
+        self._file = open(path, "wb")
+        name = difficulty.encode()
+        self._file.write(struct.pack(_HEADER, MAGIC, seed, len(name)))
+        self._file.write(name)
+        self._buf = bytearray(buffer_frames * FRAME_SIZE)
+        self._used = 0
+        self._last_ms = 0
+
+    def frame(self, t_ms, shots, sounds, shield, px, py):
+        dt = t_ms - self._last_ms
+        if dt >= _END:
+            dt = _END - 1       # 不会发生（一帧 25 ms），防止写出结尾标记
+        self._last_ms += dt
+        flags = (min(sounds, 127) << 1) | (1 if shield else 0)
+        struct.pack_into(_FRAME, self._buf, self._used, dt, min(shots, 255), flags, px, py)
+        self._used += FRAME_SIZE
+        self.frames += 1
+        if self._used == len(self._buf):
+            self._flush()
+
+    def _flush(self):
+        if self._used:
+            self._file.write(memoryview(self._buf)[:self._used])
+            self._used = 0
+
+    def close(self, score, hp, level, cleared):
+        self._flush()
+        self._file.write(struct.pack(_FRAME, _END, 0, 0, 0, 0))
+        self._file.write(struct.pack(_RESULT, score, hp, level, cleared))
+        self._file.close()
+
+
+class TraceReader:
+    """
+    TraceReader(path, buffer_frames=64)
+
+    Reads a trace written by TraceWriter, a buffer at a time (the whole trace is never in RAM).
+    - seed, difficulty: from the header
+    - frames(): yields (t_ms, shots, sounds, shield, px, py) per logic frame
+    - result: the recorded {"score", "hp", "level", "cleared"} once frames() has
+      reached the end marker (None for a trace cut short, e.g. power lost mid-game)
+    - duration_ms: game time covered by the frames read so far
+    """
+
+    def __init__(self, path, buffer_frames=64):
+        self._file = open(path, "rb")
+        magic, self.seed, name_len = struct.unpack(_HEADER, self._file.read(struct.calcsize(_HEADER)))
+        if magic != MAGIC:
+            self._file.close()
+            raise ValueError("not a game trace: " + path)
+        self.difficulty = self._file.read(name_len).decode()
+        self._buf = bytearray(buffer_frames * FRAME_SIZE)
+        self.result = None
+        self.duration_ms = 0
+
+    def frames(self):
+        f = self._file
+        buf = self._buf
+        t_ms = 0
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                return
+            for off in range(0, n - n % FRAME_SIZE, FRAME_SIZE):
+                dt, shots, flags, px, py = struct.unpack_from(_FRAME, buf, off)
+                if dt == _END:
+                    self._read_result(buf, off + FRAME_SIZE, n)
+                    return
+                t_ms += dt
+                self.duration_ms = t_ms
+                yield t_ms, shots, flags >> 1, bool(flags & 1), px, py
+
+    def _read_result(self, buf, off, n):
+        size = struct.calcsize(_RESULT)
+        data = bytes(buf[off:n])
+        if len(data) < size:
+            data += self._file.read(size - len(data))
+        if len(data) >= size:
+            score, hp, level, cleared = struct.unpack_from(_RESULT, data)
+            self.result = {"score": score, "hp": hp, "level": level, "cleared": cleared}
+
+    def close(self):
+        self._file.close()
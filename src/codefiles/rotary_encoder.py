@@ -1,92 +1,196 @@
 import time
 import digitalio
 
+try:
+    import rotaryio
+except ImportError:
+    rotaryio = None
+
+try:
+    import keypad
+except ImportError:
+    keypad = None
+
+try:
+    from supervisor import ticks_ms
+except ImportError:
+    ticks_ms = None
+
+_TICKS_MASK = (1 << 29) - 1   # supervisor.ticks_ms() / keypad timestamps wrap at 2**29
+
+
 class RotaryEncoder:
     """
-    RotaryEncoder(pin_a, pin_b, *, pull=digitalio.Pull.UP, debounce_ms=3, pulses_per_detent=4)
+    RotaryEncoder(pin_a, pin_b, *, pull=digitalio.Pull.UP, debounce_ms=3, pulses_per_detent=4,
+                  backend="auto", max_events=16)
 
     - pin_a, pin_b: board pin objects (e.g. board.D1, board.D0)
-    - debounce_ms: stable time (ms) before accepting a new state 
+    - debounce_ms: stable time (ms) before accepting a new state (poll backend only)
     - pulses_per_detent: number of encoder edges per visible detent. Set to 1 if you want
       raw edges, or to 4 for many encoders so 1 detent == 1 step.
+    - backend:
+        "rotaryio" - hardware / interrupt quadrature counter (boards that have rotaryio)
+        "keypad"   - keypad.Keys scans A/B in the background and latches every edge
+                     with a timestamp, so nothing is lost between update() calls
+        "poll"     - original decoder, samples A/B only when update() is called
+        "auto"     - first one of the above that this board supports
+    - max_events: size of the event queue drained by get_delta() / get_events().
+      When it is full, new movement is merged into the newest event (no steps are lost).
+    Event timestamps are time.monotonic() in ms on every backend (the same clock as the
+    InputManager events); keypad edge times are converted from supervisor.ticks_ms().
     """
 
-    # Quadrature Table
+    # Quadrature Table: (prev_q << 2) | curr_q -> step
+    # forward 00 -> 01 -> 11 -> 10 -> 00, backward the other way
     _TRANSITIONS = {
-        0b0001:  1,  
-        0b0011:  1,  
-        0b0111:  1,  
-        0b0100: -1,  
-        0b1110:  1,  
-        0b1101: -1,  
-        0b1000:  1,  
-        0b1011: -1,  
+        0b0001:  1,
+        0b0010: -1,
+        0b0111:  1,
+        0b0100: -1,
+        0b1110:  1,
+        0b1101: -1,
+        0b1000:  1,
+        0b1011: -1,
         }
 
-    def __init__(self, pin_a, pin_b, *, pull=digitalio.Pull.UP, debounce_ms=3, pulses_per_detent=3):
+    def __init__(self, pin_a, pin_b, *, pull=digitalio.Pull.UP, debounce_ms=3, pulses_per_detent=3,
+                 backend="auto", max_events=16):
+        if backend == "auto":
+            if rotaryio is not None:
+                backend = "rotaryio"
+            elif keypad is not None:
+                backend = "keypad"
+            else:
+                backend = "poll"
+        self.backend = backend
+
+        self._debounce_ms = max(1, int(debounce_ms))
+        self._pulses_per_detent = max(1, int(pulses_per_detent))
+
+        self._position_raw = 0
+        self._position = 0
+
+        # bounded event queue: [timestamp_ms, delta]
+        self._events = []
+        self._max_events = max(1, int(max_events))
+
+        if backend == "rotaryio":
+            # count every edge in hardware, detents are computed below like the poll decoder
+            self._hw = rotaryio.IncrementalEncoder(pin_a, pin_b, divisor=1)
+            self._hw_last = self._hw.position
+            return
+
+        if backend == "keypad":
+            # 开机时旋钮不一定停在 11：先把 A/B 读一次当起始状态，
+            # 否则第一个 keypad 事件会从错的状态查转换表（多走或少走一步）
+            ab = []
+            for pin in (pin_a, pin_b):
+                io = digitalio.DigitalInOut(pin)
+                io.switch_to_input(pull=pull)
+                ab.append(io.value)
+                io.deinit()
+            self._ab = ab
+            self._last_q = self._pack(ab)
+
+            # A/B as two "keys": pressed == pin low with the pull-up
+            self._keys = keypad.Keys((pin_a, pin_b), value_when_pressed=False,
+                                     pull=(pull == digitalio.Pull.UP),
+                                     interval=0.001, max_events=64)
+            self._key_event = keypad.Event()
+            return
+
         self._a = digitalio.DigitalInOut(pin_a)
         self._a.switch_to_input(pull=pull)
         self._b = digitalio.DigitalInOut(pin_b)
         self._b.switch_to_input(pull=pull)
 
-        self._debounce_ms = max(1, int(debounce_ms))
-        self._pulses_per_detent = max(1, int(pulses_per_detent))
-
         self._last_raw = (self._a.value, self._b.value)
         self._last_stable = self._last_raw
-        self._last_change_time = time.monotonic() * 1000.0 
+        self._last_change_time = time.monotonic() * 1000.0
 
         self._last_q = (1 if self._last_stable[0] else 0) << 1 | (1 if self._last_stable[1] else 0)
 
-        self._position_raw = 0
-        self._position = 0
-        self._delta_accum = 0
-
     @staticmethod
     def _pack(state):
-        
+
         return (1 if state[0] else 0) << 1 | (1 if state[1] else 0)
 
     def _read_raw(self):
         return (self._a.value, self._b.value)
 
+    def _push_event(self, now_ms, delta):
+        if len(self._events) >= self._max_events:
+            self._events[-1][1] += delta   # queue full: merge, never drop
+        else:
+            self._events.append([now_ms, delta])
+
+    def _add_raw(self, move, now_ms):
+        """Apply raw edge movement, queue an event if the detent position changed."""
+        self._position_raw += int(move)
+
+        new_pos = self._position_raw // self._pulses_per_detent
+        if new_pos != self._position:
+            delta = new_pos - self._position
+            self._position = new_pos
+            self._push_event(now_ms, delta)
+            return True
+        return False
+
+    def _decode(self, curr_q, now_ms):
+        prev_q = self._last_q
+        self._last_q = curr_q
+
+        key = (prev_q << 2) | curr_q
+        move = self._TRANSITIONS.get(key, 0)
+
+
+        if move == 0:
+            diff = (curr_q - prev_q) % 4
+            if diff == 1:
+                move = 1
+            elif diff == 3:
+                move = -1
+            elif diff == 2:
+                move = 2 if ( (curr_q - prev_q) > 0 ) else -2
+
+        if move != 0:
+            return self._add_raw(move, now_ms)
+        return False
+
     def update(self):
+        if self.backend == "rotaryio":
+            pos = self._hw.position
+            if pos == self._hw_last:
+                return False
+            move = pos - self._hw_last
+            self._hw_last = pos
+            return self._add_raw(move, time.monotonic() * 1000.0)
+
+        if self.backend == "keypad":
+            # replay every latched edge in order, with its own timestamp
+            # (ticks_ms of the edge -> monotonic ms: now minus the edge's age)
+            changed = False
+            event = self._key_event
+            now = time.monotonic() * 1000.0
+            ticks = ticks_ms() if ticks_ms is not None else None
+            while self._keys.events.get_into(event):
+                self._ab[event.key_number] = not event.pressed
+                t = now if ticks is None else now - ((ticks - event.timestamp) & _TICKS_MASK)
+                if self._decode(self._pack(self._ab), t):
+                    changed = True
+            return changed
+
         now = time.monotonic() * 1000.0
         raw = self._read_raw()
         if raw != self._last_raw:
-            
+
             self._last_raw = raw
             self._last_change_time = now
             return False
 
         if raw != self._last_stable and (now - self._last_change_time) >= self._debounce_ms:
-            prev_q = self._last_q
             self._last_stable = raw
-            curr_q = self._pack(raw)
-            self._last_q = curr_q
-
-            key = (prev_q << 2) | curr_q
-            move = self._TRANSITIONS.get(key, 0)
-
- 
-            if move == 0:
-                diff = (curr_q - prev_q) % 4
-                if diff == 1:
-                    move = 1
-                elif diff == 3:
-                    move = -1
-                elif diff == 2:
-                    move = 2 if ( (curr_q - prev_q) > 0 ) else -2
-
-            if move != 0:
-                self._position_raw += int(move)
-
-                new_pos = self._position_raw // self._pulses_per_detent
-                if new_pos != self._position:
-                    delta = new_pos - self._position
-                    self._position = new_pos
-                    self._delta_accum += delta
-                    return True
+            return self._decode(self._pack(raw), now)
         return False
 
     @property
@@ -97,9 +201,17 @@ class RotaryEncoder:
     def position_raw(self):
         return self._position_raw
 
+    def get_events(self):
+        """Drain the event queue: list of [timestamp_ms, delta], oldest first."""
+        events = self._events
+        self._events = []
+        return events
+
     def get_delta(self):
-        d = self._delta_accum
-        self._delta_accum = 0
+        d = 0
+        for _, delta in self._events:
+            d += delta
+        self._events.clear()
         return d
 
     def reset(self, *, to_detent=None):
@@ -109,7 +221,6 @@ class RotaryEncoder:
         else:
             self._position = int(to_detent)
             self._position_raw = self._position * self._pulses_per_detent
-        self._delta_accum = 0
+        self._events.clear()
 
-    
 
@@ -0,0 +1,155 @@
+# runtime.py
+import time
+
+try:
+    import asyncio
+except ImportError:
+    # lib/ 里没有 asyncio（+ adafruit_ticks）：run() 退回到一个普通的同步调度循环
+    asyncio = None
+
+
+class TaskStats:
+    """
+    TaskStats(name, period)
+
+    Scheduling latency of one periodic task (integer ns, no float drift):
+    - late: how long after its deadline the task actually woke up
+    - missed: deadlines skipped because the task was more than a whole period behind
+    - busy: time spent inside the task's step()
+    """
+
+    def __init__(self, name, period):
+        self.name = name
+        self.period_ns = int(period * 1000000000)
+        self.reset()
+
+    def reset(self):
+        self.runs = 0
+        self.late_sum_ns = 0
+        self.late_max_ns = 0
+        self.busy_sum_ns = 0
+        self.busy_max_ns = 0
+        self.missed = 0
+        self.first_ns = 0
+        self.last_ns = 0
+
+    def add(self, late_ns, busy_ns, now_ns):
+        if self.runs == 0:
+            self.first_ns = now_ns
+        self.last_ns = now_ns
+        self.runs += 1
+        self.late_sum_ns += late_ns
+        if late_ns > self.late_max_ns:
+            self.late_max_ns = late_ns
+        self.busy_sum_ns += busy_ns
+        if busy_ns > self.busy_max_ns:
+            self.busy_max_ns = busy_ns
+
+    def rate(self):
+        span = self.last_ns - self.first_ns
+        if self.runs < 2 or span <= 0:
+            return 0.0
+        return (self.runs - 1) * 1000000000 / span
+
+    def report(self):
+        runs = max(1, self.runs)
+        return "{:<8} {:5.1f} Hz (target {:5.1f})  late avg {:.2f} ms max {:.2f} ms  busy avg {:.2f} ms max {:.2f} ms  missed {}".format(
+            self.name, self.rate(), 1000000000 / self.period_ns,
+            self.late_sum_ns / runs / 1000000, self.late_max_ns / 1000000,
+            self.busy_sum_ns / runs / 1000000, self.busy_max_ns / 1000000,
+            self.missed)
+
+
+class Runtime:
+    """
+    Runtime()
+
+    Cooperative asyncio runtime: every task is a step(now) function called at its own rate.
+    - add(name, period, step): register a periodic task, returns its TaskStats
+    - run(): run all tasks until one of them calls stop()
+    - report(): one scheduling-latency line per task, then the CPU busy share of all
+      steps together over the last run()
+    A step that takes long (I2C, display refresh) only delays the other tasks by its own
+    length; nothing in a step should sleep.
+    Without the asyncio library on CIRCUITPY, run() uses a plain loop with the same
+    deadlines: run the task that is due first, sleep until the next deadline.
+    """
+
+    def __init__(self):
+        self._tasks = []     # (stats, step)
+        self.running = False
+        self.run_ns = 0      # wall time of the last run()
+
+    def add(self, name, period, step):
+        stats = TaskStats(name, period)
+        self._tasks.append((stats, step))
+        return stats
+
+    def stop(self):
+        self.running = False
+
+    @staticmethod
+    def _run_step(stats, step, deadline):
+        """Run one step that was due at `deadline`; returns the next deadline."""
+        period = stats.period_ns
+        woke = time.monotonic_ns()
+        step(time.monotonic())
+        done = time.monotonic_ns()
+        stats.add(woke - deadline, done - woke, woke)
+
+        deadline += period
+        behind = done - deadline
+        if behind > period:
+            # 落后超过一整个周期：跳过错过的时间点，不连续补跑
+            stats.missed += behind // period
+            deadline = done
+        return deadline
+
+    async def _loop(self, stats, step):
+        deadline = time.monotonic_ns()
+        while self.running:
+            deadline = self._run_step(stats, step, deadline)
+            delay = deadline - time.monotonic_ns()
+            await asyncio.sleep(delay / 1000000000 if delay > 0 else 0)
+
+    def _run_sync(self):
+        now = time.monotonic_ns()
+        deadlines = [now] * len(self._tasks)
+        while self.running:
+            # 最早到期的那个任务（同时到期时按 add() 的顺序）
+            i = 0
+            for k in range(1, len(deadlines)):
+                if deadlines[k] < deadlines[i]:
+                    i = k
+            delay = deadlines[i] - time.monotonic_ns()
+            if delay > 0:
+                time.sleep(delay / 1000000000)
+            stats, step = self._tasks[i]
+            deadlines[i] = self._run_step(stats, step, deadlines[i])
+
+    async def _main(self):
+        tasks = [asyncio.create_task(self._loop(stats, step)) for stats, step in self._tasks]
+        await asyncio.gather(*tasks)
+
+    def run(self):
+        self.running = True
+        for stats, _ in self._tasks:
+            stats.reset()
+        t0 = time.monotonic_ns()
+        if asyncio is None:
+            self._run_sync()
+        else:
+            asyncio.run(self._main())
+        self.run_ns = time.monotonic_ns() - t0
+
+    def cpu_busy(self):
+        """% of the last run() spent inside task steps (the rest was sleeping)."""
+        if self.run_ns <= 0:
+            return 0.0
+        return 100.0 * sum(stats.busy_sum_ns for stats, _ in self._tasks) / self.run_ns
+
+    def report(self):
+        lines = [stats.report() for stats, _ in self._tasks]
+        lines.append("{:<8} CPU busy {:.1f}% of {:.1f} s".format(
+            "all", self.cpu_busy(), self.run_ns / 1000000000))
+        return "\n".join(lines)
@@ -1,47 +1,223 @@
 # score.py
+#
+# 每个难度一个排行榜文件（EASY / NORMAL / DIFFICULT），定长二进制记录：
+#
+#   header : magic "ZSB1" | count (uint16) | record size (uint16)      8 bytes
+#   record : score (uint32) | name (4 bytes, ASCII, 不足补 0)           8 bytes
+#
+# 记录按分数从大到小存放。插入用二分查找找位置，只重写插入点之后的记录；
+# 排行榜画面按页读取（一次 seek + 一次 read），不用把整个文件读进内存，
+# 所以容量可以到几百条。
 import json
 import os
+import struct
 
-SCORE_FILE = "scores.json"
-MAX_SCORES = 10
+SCORE_FILE = "scores.json"          # 旧版 JSON 排行榜（只在第一次启动时导入到 NORMAL）
+SCORE_FILE_DONE = "scores.json.old"  # 导入完改成这个名字，以后开机不再导入
+SCORE_FILE_FMT = "scores_{}.bin"    # {} = E / N / D
+MAX_SCORES = 100                    # 每个难度最多保存多少条
 
-def load_scores():
-    """返回列表: [{"name": "AAA", "score": 30}, ...]，按分数从大到小排序"""
-    if SCORE_FILE not in os.listdir():
+DIFFICULTIES = ("EASY", "NORMAL", "DIFFICULT")
+
+_MAGIC = b"ZSB1"
+_HEADER = "<4sHH"
+_HEADER_SIZE = struct.calcsize(_HEADER)
+_RECORD = "<I4s"
+_RECORD_SIZE = struct.calcsize(_RECORD)
+
+# 内存缓存：每个难度只缓存 (条数, 最低分)，开机后第一次用到时读一次文件头
+_meta = {}
+
+
+def _path(difficulty):
+    return SCORE_FILE_FMT.format(difficulty[0])
+
+
+def _pack_record(name, score_value):
+    # 名字只存 ASCII：UTF-8 按字节截到 4 个可能切断一个多字节字符，读的时候 decode 失败
+    # （旧 JSON 排行榜迁移过来的名字可能有）。CircuitPython 的 encode() 不认 errors 参数，
+    # 所以先把非 ASCII 字符换成 "?"
+    name = "".join(c if ord(c) < 128 else "?" for c in name[:4])
+    return struct.pack(_RECORD, int(score_value), name.encode())
+
+
+def _unpack_record(buf, offset=0):
+    score_value, raw_name = struct.unpack_from(_RECORD, buf, offset)
+    return {"name": raw_name.rstrip(b"\0").decode(), "score": score_value}
+
+
+# ========== 底层文件操作（按路径，bench/bench_scores.py 也会用） ==========
+
+def _read_count(path):
+    """读文件头，返回记录条数；文件不存在或损坏返回 0"""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(_HEADER_SIZE)
+    except OSError:
+        return 0
+    if len(header) < _HEADER_SIZE:
+        return 0
+    magic, count, rec_size = struct.unpack(_HEADER, header)
+    if magic != _MAGIC or rec_size != _RECORD_SIZE:
+        return 0
+    return count
+
+
+def _read_records(path, offset, n):
+    """从第 offset 条开始读 n 条记录（一次 seek + 一次 read）"""
+    if n <= 0:
         return []
+    try:
+        with open(path, "rb") as f:
+            f.seek(_HEADER_SIZE + offset * _RECORD_SIZE)
+            buf = f.read(n * _RECORD_SIZE)
+    except OSError:
+        return []
+    records = []
+    for i in range(len(buf) // _RECORD_SIZE):
+        records.append(_unpack_record(buf, i * _RECORD_SIZE))
+    return records
+
+
+def _read_score_at(f, index):
+    f.seek(_HEADER_SIZE + index * _RECORD_SIZE)
+    return struct.unpack(_RECORD, f.read(_RECORD_SIZE))[0]
+
+
+def _insert(path, count, name, new_score, capacity):
+    """
+    二分查找插入位置（同分排在旧记录后面），只重写插入点之后的部分。
+    返回新的条数；没进榜返回 None（不写文件）。
+    """
+    if count == 0:
+        with open(path, "wb") as f:
+            f.write(struct.pack(_HEADER, _MAGIC, 1, _RECORD_SIZE))
+            f.write(_pack_record(name, new_score))
+        return 1
+
+    with open(path, "r+b") as f:
+        # 分数从大到小：找第一个 score < new_score 的位置
+        lo = 0
+        hi = count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if _read_score_at(f, mid) >= new_score:
+                lo = mid + 1
+            else:
+                hi = mid
+        pos = lo
+        if pos >= capacity:
+            return None
+
+        new_count = min(count + 1, capacity)
+        keep = new_count - pos - 1   # 插入点之后还要保留几条
+
+        f.seek(_HEADER_SIZE + pos * _RECORD_SIZE)
+        tail = f.read(keep * _RECORD_SIZE)
+
+        f.seek(_HEADER_SIZE + pos * _RECORD_SIZE)
+        f.write(_pack_record(name, new_score))
+        f.write(tail)
+
+        f.seek(0)
+        f.write(struct.pack(_HEADER, _MAGIC, new_count, _RECORD_SIZE))
+    return new_count
+
+
+# ========== 缓存 ==========
+
+def _migrate_json():
+    """
+    旧版 scores.json 没有难度信息：第一次启动时整体导入 NORMAL 榜。
+    坏记录（分数不是数字、<= 0）跳过，太大的分数截到 uint32；
+    导入完把文件改名，NORMAL 榜是空的也不会每次开机再导一遍
+    """
     try:
         with open(SCORE_FILE, "r") as f:
             data = json.load(f)
-        scores = []
-        for item in data:
-            if isinstance(item, dict) and "name" in item and "score" in item:
-                scores.append({
-                    "name": item["name"],
-                    "score": int(item["score"])
-                })
-        scores.sort(key=lambda x: x["score"], reverse=True)
-        return scores[:MAX_SCORES]
-    except:
+    except (OSError, ValueError):
+        return
+    path = _path("NORMAL")
+    count = 0
+    for item in data if isinstance(data, list) else ():
+        if not (isinstance(item, dict) and "name" in item and "score" in item):
+            continue
+        try:
+            score_value = int(item["score"])
+        except (ValueError, TypeError, OverflowError):
+            continue
+        if score_value <= 0:
+            continue
+        score_value = min(score_value, 0xFFFFFFFF)
+        new_count = _insert(path, count, str(item["name"]), score_value, MAX_SCORES)
+        if new_count is not None:
+            count = new_count
+    try:
+        os.rename(SCORE_FILE, SCORE_FILE_DONE)
+    except OSError:
+        pass   # 改名失败只是下次开机再导一次
+
+
+def _get_meta(difficulty):
+    meta = _meta.get(difficulty)
+    if meta is None:
+        path = _path(difficulty)
+        count = _read_count(path)
+        if count == 0 and difficulty == "NORMAL":
+            _migrate_json()
+            count = _read_count(path)
+        min_score = _read_records(path, count - 1, 1)[0]["score"] if count else 0
+        meta = (count, min_score)
+        _meta[difficulty] = meta
+    return meta
+
+
+# ========== 对外接口 ==========
+
+def count_scores(difficulty="NORMAL"):
+    """该难度排行榜上有几条记录（走缓存，不读文件）"""
+    return _get_meta(difficulty)[0]
+
+
+def read_page(difficulty, offset, n):
+    """读排行榜的一页：第 offset 名开始的 n 条 [{"name":..., "score":...}, ...]"""
+    count = _get_meta(difficulty)[0]
+    if offset >= count:
         return []
+    return _read_records(_path(difficulty), offset, min(n, count - offset))
+
+
+def load_scores(difficulty="NORMAL"):
+    """返回整张榜（按分数从大到小）。排行榜画面请用 read_page() 按页读"""
+    return read_page(difficulty, 0, MAX_SCORES)
+
+
+def add_score(name, new_score, difficulty="NORMAL"):
+    """
+    添加一条记录，只保留前 MAX_SCORES 名
+    榜满且分数不够时直接返回 False，不碰 flash
+    """
+    new_score = int(new_score)
+    count, min_score = _get_meta(difficulty)
+    if count >= MAX_SCORES and new_score <= min_score:
+        return False
 
-def save_scores(scores):
-    """写回文件前再截断为前 MAX_SCORES"""
-    scores = sorted(scores, key=lambda x: x["score"], reverse=True)[:MAX_SCORES]
-    with open(SCORE_FILE, "w") as f:
-        json.dump(scores, f)
+    path = _path(difficulty)
+    new_count = _insert(path, count, name, new_score, MAX_SCORES)
+    if new_count is None:
+        return False
+
+    min_score = _read_records(path, new_count - 1, 1)[0]["score"]
+    _meta[difficulty] = (new_count, min_score)
+    return True
 
-def add_score(name, new_score):
-    """添加一条记录，然后只保留前 MAX_SCORES 名"""
-    scores = load_scores()
-    scores.append({"name": name, "score": int(new_score)})
-    save_scores(scores)
 
-def can_enter_leaderboard(new_score):
+def can_enter_leaderboard(new_score, difficulty="NORMAL"):
     """
-    判断 new_score 是否有资格进入排行榜：
+    判断 new_score 是否有资格进入该难度的排行榜：
       - 分数 <= 0：不算
       - 现有记录少于 MAX_SCORES：一定可以
-      - 否则，new_score >= 当前榜单最低分 才可以
+      - 否则，new_score 要高于当前榜单最低分（同分排在旧记录后面，会被挤出去）
     """
     try:
         new_score = int(new_score)
@@ -51,11 +227,8 @@ def can_enter_leaderboard(new_score):
     if new_score <= 0:
         return False
 
-    scores = load_scores()
-    if len(scores) < MAX_SCORES:
+    count, min_score = _get_meta(difficulty)
+    if count < MAX_SCORES:
         return True
 
-    # scores 已按从大到小排序，最后一个是最低分
-    min_score = scores[-1]["score"]
-    return new_score >= min_score
-
+    return new_score > min_score
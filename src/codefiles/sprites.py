@@ -0,0 +1,99 @@
+# sprites.py
+#
+# 1-bit 小精灵表：僵尸 Z / S / T、准星 +、彩蛋里的 ASCII 小图，不再一个字一个 label.Label
+#   开机画一次：每个字符一个 TILE_W x TILE_H 的 tile，全部在一张 2 色 Bitmap 里（约 100 字节）
+#   每个精灵是一个 1 格的 displayio.TileGrid：换字形 = grid[0] = sheet.tile("S")，移动 = grid.x / grid.y
+#   label 换 text 要重新排版、重新画它自己的 Bitmap；TileGrid 只改一个索引
+# 坐标和 label.Label 一样（x = 左边，y = 字的竖直中线）：精灵放在 layer() 里，
+# layer 整体往上挪半个 tile，所以僵尸的 x / y、命中框都不用改。
+import displayio
+
+TILE_W = 6
+TILE_H = 8
+
+# characters on the sheet; tile 0 (space) is the blank tile for anything unknown
+CHARS = " ZST+@_()x/|\\^N"
+
+# 5 x 7 glyphs, one byte per row (bit 4 = leftmost column), same order as CHARS
+_ROWS = bytes((
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,   # space
+    0x1F, 0x01, 0x02, 0x04, 0x08, 0x10, 0x1F,   # Z
+    0x0F, 0x10, 0x10, 0x0E, 0x01, 0x01, 0x1E,   # S
+    0x1F, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04,   # T
+    0x00, 0x04, 0x04, 0x1F, 0x04, 0x04, 0x00,   # +
+    0x0E, 0x11, 0x17, 0x15, 0x17, 0x10, 0x0F,   # @
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x1F,   # _
+    0x02, 0x04, 0x08, 0x08, 0x08, 0x04, 0x02,   # (
+    0x08, 0x04, 0x02, 0x02, 0x02, 0x04, 0x08,   # )
+    0x00, 0x00, 0x11, 0x0A, 0x04, 0x0A, 0x11,   # x
+    0x00, 0x01, 0x02, 0x04, 0x08, 0x10, 0x00,   # /
+    0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04,   # |
+    0x00, 0x10, 0x08, 0x04, 0x02, 0x01, 0x00,   # backslash
+    0x04, 0x0A, 0x11, 0x00, 0x00, 0x00, 0x00,   # ^
+    0x11, 0x19, 0x15, 0x13, 0x11, 0x11, 0x11,   # N
+))
+_GLYPH_ROWS = 7
+
+
+class SpriteSheet:
+    """
+    SpriteSheet(chars=CHARS)
+
+    The sprite sheet, drawn once into a 2-colour Bitmap (transparent background, white ink).
+    - tile(ch): tile index of a character (unknown characters -> blank tile)
+    - sprite(ch, x, y): one-tile TileGrid; glyph swap = grid[0] = tile(ch)
+    - art(lines, x, y): multi-tile TileGrid for a block of ASCII art (one tile per character)
+    - layer(x=0, y=0): Group for sprites, shifted so they take label coordinates
+      (x = left edge, y = vertical middle)
+    """
+
+    def __init__(self, chars=CHARS):
+        self.chars = chars
+        self._index = {}
+        self.bitmap = displayio.Bitmap(TILE_W * len(chars), TILE_H, 2)
+        for i, ch in enumerate(chars):
+            self._index[ch] = i
+            k = CHARS.find(ch)
+            if k < 0:
+                continue
+            for row in range(_GLYPH_ROWS):
+                bits = _ROWS[k * _GLYPH_ROWS + row]
+                for col in range(5):
+                    if bits & (0x10 >> col):
+                        self.bitmap[i * TILE_W + col, row] = 1
+        self.palette = displayio.Palette(2)
+        self.palette[0] = 0x000000
+        self.palette[1] = 0xFFFFFF
+        self.palette.make_transparent(0)
+
+    def tile(self, ch):
+        return self._index.get(ch, 0)
+
+    def sprite(self, ch, x=0, y=0):
+        return displayio.TileGrid(self.bitmap, pixel_shader=self.palette,
+                                  tile_width=TILE_W, tile_height=TILE_H,
+                                  default_tile=self.tile(ch), x=x, y=y)
+
+    def art(self, lines, x=0, y=0):
+        width = max(len(line) for line in lines)
+        grid = displayio.TileGrid(self.bitmap, pixel_shader=self.palette,
+                                  width=width, height=len(lines),
+                                  tile_width=TILE_W, tile_height=TILE_H, x=x, y=y)
+        for row, line in enumerate(lines):
+            for col, ch in enumerate(line):
+                grid[col, row] = self.tile(ch)
+        return grid
+
+    def layer(self, x=0, y=0):
+        return displayio.Group(x=x, y=y - TILE_H // 2)
+
+
+_sheet = None
+
+
+def sheet():
+    """The shared sprite sheet (built on first use)."""
+    global _sheet
+    if _sheet is None:
+        _sheet = SpriteSheet()
+    return _sheet
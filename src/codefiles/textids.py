@@ -0,0 +1,9 @@
+# textids.py
+#
+# generated by tools/pack_text.py from src/text/story.txt: do not edit
+# id of the first text of each section in story.bin
+BOOT = 0       # 14 texts
+TUTORIAL = 14  # 3 texts
+NO_SHOT = 17   # 6 texts
+BOSS = 23      # 10 texts
+COUNT = 33
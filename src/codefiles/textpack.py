@@ -0,0 +1,65 @@
+# textpack.py
+#
+# 剧情 / 教程 / 彩蛋文字放在 flash 上的 story.bin 里（tools/pack_text.py 从 src/text/story.txt 生成），
+# 不再是 .py 里的字符串常量（import 之后就一直占着 RAM）：
+#   开机只读文件头和偏移表（每条 2 字节），再分配一个“最长那条”大小的 bytearray
+#   要显示哪一页，seek 到它的偏移、readinto 进这个 buffer，只为当前显示的行建 str
+#   画面结束后这些 str 跟着 label 的文字一起被换掉，没有剧情字符串留在 RAM 里
+import array
+import struct
+
+MAGIC = b"TXT1"
+
+
+class TextPack:
+    """
+    TextPack(path="story.bin")
+
+    Read-only text pack in flash, one text per id (textids.SECTION + n).
+    - read(i): seek + readinto the reused buffer, returns the length (bytes in .buf)
+    - text(i): the whole text as one str (multi-line label)
+    - lines(i): its lines one str at a time (one label per line)
+    - report(): one line for the serial console: texts, file size, RAM used
+    The file stays open; the index is (count + 1) u16 offsets in an array.
+    """
+
+    def __init__(self, path="story.bin"):
+        self.path = path
+        self._f = open(path, "rb")
+        head = self._f.read(8)
+        if head[:4] != MAGIC:
+            raise ValueError(path + " is not a text pack (run tools/pack_text.py)")
+        self.count, longest = struct.unpack("<HH", head[4:])
+        self._index = array.array("H", [0] * (self.count + 1))
+        self._f.readinto(self._index)
+        self._data = 8 + 2 * (self.count + 1)
+        self.buf = bytearray(longest)
+        self._mv = memoryview(self.buf)
+        self.reads = 0
+
+    def read(self, i):
+        start = self._index[i]
+        n = self._index[i + 1] - start
+        self._f.seek(self._data + start)
+        self._f.readinto(self._mv[:n])
+        self.reads += 1
+        return n
+
+    def text(self, i):
+        n = self.read(i)
+        return str(self._mv[:n], "utf-8")
+
+    def lines(self, i):
+        n = self.read(i)
+        buf = self.buf
+        start = 0
+        for k in range(n):
+            if buf[k] == 10:     # "\n"
+                yield str(self._mv[start:k], "utf-8")
+                start = k + 1
+        yield str(self._mv[start:n], "utf-8")
+
+    def report(self):
+        return "Text pack {}: {} texts, {} B in flash; RAM: index {} B + buffer {} B, {} reads".format(
+            self.path, self.count, self._data + self._index[self.count],
+            len(self._index) * 2, len(self.buf), self.reads)
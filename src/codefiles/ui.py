@@ -1,129 +1,50 @@
 # ui.py
-import time
-import displayio
-import terminalio
-from adafruit_display_text import label
-
-
-def _play_note(buzzer, freq, duration, volume=0.3):
-    """播放一个音符。buzzer 为 None 时只延时，不发声。"""
-    if buzzer is None:
-        time.sleep(duration)
-        return
-
-    buzzer.frequency = int(freq)
-    buzzer.duty_cycle = int(65535 * volume)
-    time.sleep(duration)
-    buzzer.duty_cycle = 0
-    time.sleep(0.03)  # 音符之间留一点空隙
-
-
-def _play_boot_melody(buzzer):
+from cutscene import CURSOR
+from music import Tune, REST, PLUCK
+from textids import BOOT
+
+
+TITLE_SLIDE_TIME = 2.0    # "Zombie Shooter" slides from x = -80 to x = 19
+TITLE_HOLD_TIME = 0.5     # title stays still before the story
+SKIP_HOLD_TIME = 0.4      # button held this long -> straight to the menu
+
+# 开机旋律：la, #la, do, re, re, do, 低音la -> A4, A#4, C5, D5, D5, C5, A3
+# (MIDI note, rows of 10 ms, volume %)，音符之间留 30 ms 休止
+BOOT_MELODY = Tune((
+    (69, 18, 30), (REST, 3, 0),
+    (70, 18, 30), (REST, 3, 0),
+    (72, 18, 30), (REST, 3, 0),
+    (74, 22, 30), (REST, 3, 0),
+    (74, 22, 30), (REST, 3, 0),
+    (72, 18, 30), (REST, 3, 0),
+    (57, 30, 30),
+), envelope=PLUCK)
+
+# 开机过场（cutscene.py 脚本）：旋律在后台播，标题飘入，然后英文剧情一页一页（右下角闪烁 N）
+# 文字在 story.bin 的 [BOOT] 里（src/text/story.txt）：0 = 标题，1..13 = 剧情
+BOOT_SCRIPT = (
+    ("screen", "Boot title"),
+    ("music", BOOT_MELODY),
+    ("slide", 0, BOOT, -80, 19, 30, TITLE_SLIDE_TIME),
+    ("wait", TITLE_HOLD_TIME, False),
+    ("screen", "Boot story"),
+    ("style", CURSOR),
+    ("pages", BOOT + 1, 13),
+)
+
+
+def show_boot_animation(scene, on_first_frame=None, setup=()):
     """
-    开机旋律：
-    la, #la, do, re, re, do, 低音la
-    -> A4, A#4, C5, D5, D5, C5, A3
+    Boot animation, played by `scene` (cutscene.Cutscene):
+    1. Boot melody on the buzzer, in the background while
+    2. the title "Zombie Shooter" slides in; one `setup` job (screen building etc.)
+       runs per frame, so that work overlaps the melody too
+    3. Story pages with blinking 'N' (BTN press = next page)
+    - Button held SKIP_HOLD_TIME (title, story page or at power-on): melody stops,
+      rest of the story skipped -> returns "button"
+    on_first_frame(): called once the title is on screen (boot time report)
+    Every setup job has run when this returns; returns None if nothing was skipped.
     """
-    A3  = 220
-    A4  = 440
-    AS4 = 466
-    C5  = 523
-    D5  = 587
-
-    melody = [
-        (A4,  0.18),
-        (AS4, 0.18),
-        (C5,  0.18),
-        (D5,  0.22),
-        (D5,  0.22),
-        (C5,  0.18),
-        (A3,  0.30),
-    ]
-
-    for freq, dur in melody:
-        _play_note(buzzer, freq, dur)
-
-
-def show_boot_animation(display, btn, buzzer=None):
-    """
-    Boot animation:
-    1. Play short boot melody on buzzer (if provided)
-    2. Title "Zombie Shooter" slides in
-    3. Story pages with blinking 'N'
-    """
-
-    # ===== 0) 开机音乐 =====
-    _play_boot_melody(buzzer)
-
-    # ===== 1) 标题飘入 =====
-    splash = displayio.Group()
-    display.root_group = splash
-
-    title = label.Label(terminalio.FONT, text="Zombie Shooter", x=-80, y=30)
-    splash.append(title)
-
-    # 从左往右移动
-    for x in range(-80, 20):
-        title.x = x
-        time.sleep(0.02)
-
-    time.sleep(0.5)
-
-    # ===== 2) 切到剧情画面 =====
-    story = displayio.Group()
-    display.root_group = story
-
-    # 剧情文字（多行）
-    text_label = label.Label(terminalio.FONT, text="", x=0, y=8)
-    story.append(text_label)
-
-    # 右下角闪烁的 N
-    n_label = label.Label(terminalio.FONT, text="N", x=118, y=60)
-    story.append(n_label)
-
-    # 英文剧情（我顺了一下语法）
-    pages = [
-        "\"Who are you?\"",
-        "......",
-        "",
-        "You wake up\nwith no memories.",
-        "You only know\nit's 2080.",
-        "A new virus\nappeared in the world.",
-        "Those infected\nbecame zombies.",
-        "So many zombies...\n......",
-        "ZZZZZZZZZZZZZZZ\nZZZZZZZZZZZZZZZ\nZZZZZZZZZZZZZZZ\nZZZZZZZZZZZZZZZ",
-        "Being eaten or\nkilling them...",
-        "For you it is\nnot a question.",
-        "Only one sentence\nkeeps echoing:",
-        "To stay alive,\n\"SHOOT THEM!\"",
-    ]
-
-    def wait_with_blink():
-        """右下角 N 闪烁 + 等待按钮按下"""
-        visible = True
-        n_label.hidden = False
-        last_toggle = time.monotonic()
-
-        while True:
-            now = time.monotonic()
-            # 每 0.3 秒闪一次
-            if now - last_toggle > 0.3:
-                visible = not visible
-                n_label.hidden = not visible
-                last_toggle = now
-
-            # 检测按钮按下（低电平）
-            if not btn.value:
-                time.sleep(0.05)  # 去抖
-                if not btn.value:
-                    while not btn.value:
-                        time.sleep(0.01)
-                    break
-
-            time.sleep(0.01)
-
-    # 依次播放每一页剧情
-    for txt in pages:
-        text_label.text = txt
-        wait_with_blink()
-
+    if on_first_frame is not None:
+        setup = (on_first_frame,) + tuple(setup)
+    return scene.play(BOOT_SCRIPT, "Boot", setup, skip_hold=SKIP_HOLD_TIME)
@@ -0,0 +1,93 @@
+# zombie_registry.py
+
+
+class Zombie:
+    """One zombie slot. Objects are created once per slot and reused on every spawn."""
+
+    __slots__ = ("slot", "index", "label", "x", "y", "spawn_time", "lifetime", "type", "alive")
+
+    def __init__(self, slot, label):
+        self.slot = slot          # fixed pool slot (label or sprite / hit index bit)
+        self.index = -1           # position in ZombieRegistry.active, -1 when free
+        self.label = label
+        self.x = 0
+        self.y = 0
+        self.spawn_time = 0       # game ms
+        self.lifetime = 0         # ms
+        self.type = "Z"
+        self.alive = False
+
+
+class ZombieRegistry:
+    """
+    ZombieRegistry(labels, hit_index=None, sheet=None)
+
+    Fixed-capacity zombie storage, one slot per pooled label.
+    - labels: label.Label objects, or one-tile TileGrids from sprites.SpriteSheet
+      (then pass the sheet: the glyph is swapped with grid[0] = sheet.tile(type))
+    - active: dense list of alive zombies. Iterate it directly (no copy);
+      when removing inside a loop, walk it from the end.
+    - spawn(...): O(1), takes a slot from the free-list, returns the Zombie (or None if full)
+    - remove(z): O(1) swap-remove: the last active zombie moves into z's place
+    - by_slot(slot): zombie in that slot (hit index lookups)
+    """
+
+    def __init__(self, labels, hit_index=None, sheet=None):
+        self._zombies = [Zombie(slot, lbl) for slot, lbl in enumerate(labels)]
+        self._free = list(range(len(labels) - 1, -1, -1))   # pop() gives slot 0 first
+        self._hit_index = hit_index
+        self._sheet = sheet
+        self.active = []
+
+    def __len__(self):
+        return len(self.active)
+
+    def by_slot(self, slot):
+        return self._zombies[slot]
+
+    def spawn(self, z_type, x, y, spawn_time, lifetime):
+        if not self._free:
+            return None
+        z = self._zombies[self._free.pop()]
+        z.type = z_type
+        z.x = x
+        z.y = y
+        z.spawn_time = spawn_time
+        z.lifetime = lifetime
+        z.alive = True
+        z.index = len(self.active)
+        self.active.append(z)
+
+        lbl = z.label
+        if self._sheet is not None:
+            lbl[0] = self._sheet.tile(z_type)
+        elif lbl.text != z_type:
+            lbl.text = z_type
+        lbl.x = x
+        lbl.y = y
+        lbl.hidden = False
+
+        if self._hit_index is not None:
+            self._hit_index.add(z.slot, x, y)
+        return z
+
+    def remove(self, z):
+        if not z.alive:
+            return
+        z.alive = False
+        z.label.hidden = True   # label stays in its group, just hidden
+        if self._hit_index is not None:
+            self._hit_index.remove(z.slot)
+
+        # swap-remove: move the last active zombie into this hole
+        active = self.active
+        last = active.pop()
+        if last is not z:
+            active[z.index] = last
+            last.index = z.index
+        z.index = -1
+        self._free.append(z.slot)
+
+    def clear(self):
+        while self.active:
+            self.remove(self.active[-1])
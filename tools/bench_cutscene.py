@@ -0,0 +1,65 @@
+# bench_cutscene.py
+#
+# Heap and label cost of each cutscene (boot story, tutorial, both easter eggs) on the
+# host, with the hostsim stand-in modules and the autopilot turning the pages:
+#
+#   python3 tools/bench_cutscene.py
+#
+# For each cutscene:
+#   peak    most Python heap in use while it played, above what was in use before (tracemalloc)
+#   kept    heap still in use after it ended and gc ran (includes the simulator's own
+#           serial / tone logs, so it is never 0 here)
+#   labels  label.Label objects created while it played
+#   renders label.text assignments (each one re-renders the label's bitmap on the board)
+# The host heap is CPython's, so compare the numbers with each other (before / after a
+# change), not with the board. On the board the serial console prints
+# "Cutscene <name>: <frames> frames, peak +<B> B, kept +<B> B" after each one.
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from hostsim import Simulator
+
+
+def measure(sim, rows, name, fn):
+    gc.collect()
+    base = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    labels = sim.label_allocs
+    renders = sim.label_renders
+    fn()
+    peak = tracemalloc.get_traced_memory()[1] - base
+    gc.collect()
+    kept = tracemalloc.get_traced_memory()[0] - base
+    rows.append((name, peak, kept, sim.label_allocs - labels, sim.label_renders - renders))
+
+
+def main():
+    sim = Simulator()
+    sim.autopilot()
+    rows = []
+    tracemalloc.start()
+    with sim.installed():     # the game's serial output goes to sim.serial
+        import game
+        import lazy
+        import ui
+
+        measure(sim, rows, "boot story", lambda: ui.show_boot_animation(game.scene))
+        measure(sim, rows, "tutorial", lambda: game.show_tutorial(game.display))
+        # imported first: only the cutscene itself is measured, not compiling the module
+        easter = lazy.load("easter")
+        measure(sim, rows, "easter egg (no shot)", lambda: easter.show_no_shot(game.scene))
+        easter2 = lazy.load("easter2")
+        measure(sim, rows, "boss easter", lambda: easter2.show_boss_easter(game.scene))
+    tracemalloc.stop()
+
+    print("  {:<22} {:>8} {:>8} {:>7} {:>8}".format("cutscene", "peak B", "kept B", "labels", "renders"))
+    for row in rows:
+        print("  {:<22} {:>8} {:>8} {:>7} {:>8}".format(*row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+# bench_encoder.py
+#
+# Host-side encoder benchmark: drives a fake quadrature signal through
+# src/codefiles/rotary_encoder.py and finds the fastest spin (detents/s)
+# that each backend tracks with no lost steps.
+#
+#   python3 tools/bench_encoder.py [--poll-ms 10] [--edges-per-detent 4] [--seconds 2]
+#
+# The fake hardware runs on a virtual clock:
+#   - "poll":   DigitalInOut reads the quadrature level at the moment update() runs
+#   - "keypad": a fake keypad.Keys scans A/B every 1 ms "in the background" and
+#               queues timestamped edges, like the real keypad module
+import argparse
+import os
+import sys
+import types
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "src", "codefiles"))
+
+
+class Clock:
+    def __init__(self):
+        self.t = 0.0
+
+    def monotonic(self):
+        return self.t
+
+    def sleep(self, s):
+        self.t += s
+
+
+CLOCK = Clock()
+
+
+class Quadrature:
+    """Gray-code A/B levels for a knob turning at `detents_per_s`."""
+
+    SEQ = ((True, True), (False, True), (False, False), (True, False))
+
+    def __init__(self, detents_per_s, edges_per_detent):
+        self.edge_rate = detents_per_s * edges_per_detent
+
+    def edges(self, t):
+        return int(t * self.edge_rate)
+
+    def level(self, pin, t):
+        state = self.SEQ[self.edges(t) % 4]
+        return state[0] if pin == "A" else state[1]
+
+
+SIGNAL = None
+
+
+def _install_fakes():
+    fake_time = types.ModuleType("time")
+    fake_time.monotonic = CLOCK.monotonic
+    fake_time.sleep = CLOCK.sleep
+    fake_time.monotonic_ns = lambda: int(CLOCK.t * 1e9)
+
+    digitalio = types.ModuleType("digitalio")
+
+    class Pull:
+        UP = "UP"
+        DOWN = "DOWN"
+
+    class DigitalInOut:
+        def __init__(self, pin):
+            self.pin = pin
+
+        def switch_to_input(self, pull=None):
+            pass
+
+        @property
+        def value(self):
+            return SIGNAL.level(self.pin, CLOCK.t)
+
+        def deinit(self):
+            pass
+
+    digitalio.Pull = Pull
+    digitalio.DigitalInOut = DigitalInOut
+
+    keypad = types.ModuleType("keypad")
+
+    class Event:
+        def __init__(self, key_number=0, pressed=True):
+            self.key_number = key_number
+            self.pressed = pressed
+            self.timestamp = 0
+
+    class EventQueue:
+        def __init__(self, keys, max_events):
+            self._keys = keys
+            self._queue = []
+            self._max = max_events
+            self.overflowed = False
+
+        def get_into(self, event):
+            self._keys.scan_until(CLOCK.t)
+            if not self._queue:
+                return False
+            key, pressed, ts = self._queue.pop(0)
+            event.key_number = key
+            event.pressed = pressed
+            event.timestamp = ts
+            return True
+
+    class Keys:
+        def __init__(self, pins, value_when_pressed, pull, interval, max_events):
+            self.pins = pins
+            self.interval = interval
+            self.events = EventQueue(self, max_events)
+            self._last_scan = 0.0
+            self._state = [False] * len(pins)
+
+        def scan_until(self, t):
+            # background scanning: one scan every `interval` seconds up to now
+            while self._last_scan + self.interval <= t:
+                self._last_scan += self.interval
+                for i, pin in enumerate(self.pins):
+                    pressed = not SIGNAL.level(pin, self._last_scan)
+                    if pressed != self._state[i]:
+                        self._state[i] = pressed
+                        q = self.events
+                        if len(q._queue) >= q._max:
+                            q.overflowed = True
+                        else:
+                            q._queue.append((i, pressed, int(self._last_scan * 1000)))
+
+    keypad.Event = Event
+    keypad.Keys = Keys
+
+    supervisor = types.ModuleType("supervisor")
+    supervisor.ticks_ms = lambda: int(CLOCK.t * 1000) & ((1 << 29) - 1)
+
+    sys.modules["time"] = fake_time
+    sys.modules["supervisor"] = supervisor
+    sys.modules["digitalio"] = digitalio
+    sys.modules["keypad"] = keypad
+
+
+def track(backend, detents_per_s, edges_per_detent, poll_ms, seconds):
+    """Spin for `seconds`, calling update() every poll_ms. Returns lost edges."""
+    global SIGNAL
+    from rotary_encoder import RotaryEncoder
+
+    SIGNAL = Quadrature(detents_per_s, edges_per_detent)
+    CLOCK.t = 0.0
+    enc = RotaryEncoder("A", "B", debounce_ms=3, pulses_per_detent=1, backend=backend)
+    steps = int(seconds * 1000 / poll_ms)
+    for _ in range(steps):
+        CLOCK.sleep(poll_ms / 1000.0)
+        enc.update()
+    # let the knob stop and the decoder settle
+    stopped_at = SIGNAL.edges(CLOCK.t)
+    SIGNAL.edges = lambda t: stopped_at
+    for _ in range(10):
+        CLOCK.sleep(poll_ms / 1000.0)
+        enc.update()
+    expected = SIGNAL.edges(CLOCK.t)
+    return abs(expected - abs(enc.position_raw))
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--poll-ms", type=float, default=10.0)
+    ap.add_argument("--edges-per-detent", type=int, default=4)
+    ap.add_argument("--seconds", type=float, default=2.0)
+    args = ap.parse_args()
+
+    _install_fakes()
+
+    rates = list(range(1, 20)) + list(range(20, 401, 5))
+    for backend in ("poll", "keypad"):
+        best = 0
+        first_loss = None
+        for rate in rates:
+            lost = track(backend, rate, args.edges_per_detent, args.poll_ms, args.seconds)
+            if lost:
+                first_loss = (rate, lost)
+                break
+            best = rate
+        line = "backend={} poll_ms={} max_detents_per_s={}".format(backend, args.poll_ms, best)
+        if first_loss is not None:
+            line += " (at {} detents/s: {} edges lost)".format(*first_loss)
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# bench_host.py
+#
+# Run bench/bench.py on the host with the hostsim stand-in modules:
+#
+#   python3 tools/bench_host.py [--zombies 5] [--board 100] [--difficulty NORMAL]
+#                               [--baseline bench_baseline.json] [--save] [--json out.json]
+#
+# Timing uses the host's perf_counter_ns (the stand-in time module is a virtual
+# clock). The stand-in gc.mem_alloc() counts tracemalloc bytes, so the "bytes" of the
+# render results are measured with tracemalloc on for that build only (not while timing). Results are keyed by platform + parameters in the baseline file, so host
+# and device numbers never get compared with each other.
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from hostsim import Simulator
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--zombies", type=int, default=5, help="zombies on screen (max 32)")
+    parser.add_argument("--board", type=int, default=100, help="leaderboard records")
+    parser.add_argument("--difficulty", default="NORMAL", choices=("EASY", "NORMAL", "DIFFICULT"))
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3, help="keep the best of N runs")
+    parser.add_argument("--baseline", default="bench_baseline.json")
+    parser.add_argument("--save", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--json", help="also write the results list to this file")
+    args = parser.parse_args()
+
+    baseline = os.path.abspath(args.baseline) if args.baseline else None
+    sim = Simulator(echo=True)
+    with sim.installed():
+        import bench
+
+        build_bytes = bench._build_bytes
+
+        def traced_build_bytes(kind, zombies):
+            tracemalloc.start()
+            try:
+                return build_bytes(kind, zombies)
+            finally:
+                tracemalloc.stop()
+
+        bench._build_bytes = traced_build_bytes
+        results = bench.run(zombies=args.zombies, board=args.board, difficulty=args.difficulty,
+                            calls=args.calls, rounds=args.rounds, repeat=args.repeat, baseline=baseline,
+                            save=args.save, tolerance=args.tolerance,
+                            clock_ns=time.perf_counter_ns)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+# bench_sound.py
+#
+# Host-side sound sensor benchmark: a pulse generator drives the sound pin of the
+# hostsim stand-ins, and src/codefiles/inputs.py's InputManager ticks at 100 Hz like
+# the game's input task. For each pulse width it reports the share of claps that
+# became EDGE events and how far the event timestamp is from the real edge.
+#
+#   python3 tools/bench_sound.py [--pulses 200] [--tick-ms 10] [--busy-ms 0]
+#
+#   keypad: keypad.Keys scans the pin every 1 ms in the background (latched edges)
+#   poll:   the level is read once per tick (the old behaviour)
+# --busy-ms blocks for that long after every tick (a slow frame / blocking effect).
+# The last table checks the buzzer mask: pulses while a tone plays must be dropped,
+# pulses between tones must still count.
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from hostsim import Simulator
+
+WIDTHS_MS = (0.5, 1, 2, 5, 10, 20, 50)
+
+
+def _schedule(sim, rng, start, count, width, gap=0.12):
+    """`count` pulses of `width` s, random spacing between gap and 2 * gap."""
+    times = []
+    t = start
+    for _ in range(count):
+        t += rng.uniform(gap, 2 * gap)
+        sim.sound(t, width)
+        times.append(t)
+    return times, t + gap
+
+
+def _capture(inp, sim, until, tick, busy, mask_log=None):
+    from inputs import EDGE, SOUND
+    got = []
+    while sim.clock.t < until:
+        inp.tick()
+        for kind, source, t, _ in inp.events:
+            if kind == EDGE and source == SOUND:
+                got.append(t)
+        sim.clock.advance(tick + busy)
+    return got
+
+
+def _match(pulses, got, window=0.05):
+    """Captured pulses and mean |timestamp error| (ms)."""
+    hits = 0
+    err = 0.0
+    j = 0
+    for t in pulses:
+        while j < len(got) and got[j] < t - 0.002:
+            j += 1
+        if j < len(got) and got[j] - t <= window:
+            hits += 1
+            err += abs(got[j] - t)
+            j += 1
+    return hits, (err / hits * 1000 if hits else 0.0)
+
+
+def run_widths(backend, args):
+    rows = []
+    for width_ms in WIDTHS_MS:
+        sim = Simulator(keypad=(backend == "keypad"))
+        rng = random.Random(width_ms)
+        with sim.installed():
+            import board
+            from inputs import InputManager
+            inp = InputManager(board.D9, board.D2, board.D3, None, use_keypad=(backend == "keypad"))
+            pulses, end = _schedule(sim, rng, 0.5, args.pulses, width_ms / 1000)
+            got = _capture(inp, sim, end, args.tick_ms / 1000, args.busy_ms / 1000)
+        hits, err = _match(pulses, got)
+        rows.append((width_ms, hits, err, len(got)))
+    return rows
+
+
+def run_mask(args):
+    sim = Simulator()
+    rng = random.Random(1)
+    with sim.installed():
+        import board
+        import pwmio
+        from music import Music
+        from inputs import InputManager
+
+        buzzer = pwmio.PWMOut(board.D7, duty_cycle=0, frequency=440, variable_frequency=True)
+        music = Music(buzzer)
+        inp = InputManager(board.D9, board.D2, board.D3, None, sound_mask=music.masked)
+
+        # a 100 ms beep every 0.5 s; the "buzzer noise" pulse starts 10-60 ms into it,
+        # a real clap comes 200-300 ms after the beep starts
+        noise, claps = [], []
+        t = 0.5
+        for _ in range(args.pulses):
+            sim.at(t, lambda: music.beep(800, 100, 30))
+            n = t + rng.uniform(0.01, 0.06)
+            c = t + rng.uniform(0.2, 0.3)
+            sim.sound(n, 0.02)
+            sim.sound(c, 0.01)
+            noise.append(n)
+            claps.append(c)
+            t += 0.5
+        got = []
+        from inputs import EDGE, SOUND
+        while sim.clock.t < t:
+            inp.tick()
+            for kind, source, et, _ in inp.events:
+                if kind == EDGE and source == SOUND:
+                    got.append(et)
+            music.update(sim.clock.t)
+            sim.clock.advance(args.tick_ms / 1000)
+    noise_hits, _ = _match(noise, got, 0.03)
+    clap_hits, _ = _match(claps, got, 0.03)
+    return noise_hits, clap_hits, inp.sound_masked
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pulses", type=int, default=200)
+    parser.add_argument("--tick-ms", type=float, default=10.0, help="InputManager.tick() period")
+    parser.add_argument("--busy-ms", type=float, default=0.0, help="blocking time after every tick")
+    args = parser.parse_args()
+
+    print("capture rate vs pulse width ({} pulses, tick {} ms, busy {} ms)".format(
+        args.pulses, args.tick_ms, args.busy_ms))
+    results = {b: run_widths(b, args) for b in ("poll", "keypad")}
+    print("  width ms   poll captured   keypad captured   keypad ts error")
+    for i, width in enumerate(WIDTHS_MS):
+        _, poll_hits, _, _ = results["poll"][i]
+        _, key_hits, key_err, _ = results["keypad"][i]
+        print("  {:>8}   {:>12.1f}%   {:>14.1f}%   {:>11.2f} ms".format(
+            width, 100 * poll_hits / args.pulses, 100 * key_hits / args.pulses, key_err))
+
+    noise_hits, clap_hits, masked = run_mask(args)
+    print("buzzer mask: {}/{} buzzer-noise pulses got through, {}/{} claps between beeps counted ({} edges masked)".format(
+        noise_hits, args.pulses, clap_hits, args.pulses, masked))
+
+
+if __name__ == "__main__":
+    main()
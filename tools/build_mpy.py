@@ -0,0 +1,111 @@
+# build_mpy.py
+#
+# Precompile src/codefiles to .mpy with mpy-cross, so the board does not compile
+# every module from source at each boot:
+#
+#   python3 tools/build_mpy.py [--mpy-cross mpy-cross] [--out build/mpy]
+#   python3 tools/build_mpy.py --deploy /media/$USER/CIRCUITPY      # build + copy to the board
+#   python3 tools/build_mpy.py --deploy /media/$USER/CIRCUITPY --source   # back to .py
+#   python3 tools/build_mpy.py --deploy /media/$USER/CIRCUITPY --bench    # + bench/ modules
+#
+# mpy-cross must come from the same CircuitPython major version as the board
+# (https://adafruit-circuit-python.s3.amazonaws.com/index.html?prefix=bin/mpy-cross/);
+# a mismatched .mpy fails to import with "Incompatible .mpy file".
+# code.py always stays source (CircuitPython only runs code.py / main.py).
+# The benchmark and replay modules live in bench/, outside src/codefiles, so a normal
+# deploy does not put them on the board (and removes copies left by an earlier --bench).
+# --bench copies them as source; the *_runner.py files are then copied over code.py by hand.
+# On the board a .py next to a .mpy of the same name wins the import, so --deploy
+# deletes the .py copies it replaces (and --source deletes the .mpy copies).
+# --deploy also copies story.bin (the packed story text, tools/pack_text.py).
+# Compare the "Boot (.py)" / "Boot (.mpy)" line game.py prints on the serial console.
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+CODE_DIR = os.path.join(ROOT, "src", "codefiles")
+BENCH_DIR = os.path.join(ROOT, "bench")
+SKIP = ("code.py",)
+ASSETS = ("story.bin",)     # data files game.py opens (tools/pack_text.py)
+
+
+def sources(directory=CODE_DIR, skip=SKIP):
+    names = []
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".py") and name not in skip:
+            names.append(name)
+    return names
+
+
+def build(mpy_cross, out):
+    try:
+        version = subprocess.run([mpy_cross, "--version"], capture_output=True, text=True).stdout.strip()
+    except FileNotFoundError:
+        sys.exit("mpy-cross not found: pass --mpy-cross /path/to/mpy-cross (or set MPY_CROSS)")
+    print(version)
+    os.makedirs(out, exist_ok=True)
+
+    total_py = total_mpy = 0
+    print("  {:<20} {:>8} {:>8}".format("module", ".py B", ".mpy B"))
+    for name in sources():
+        src = os.path.join(CODE_DIR, name)
+        dst = os.path.join(out, name[:-3] + ".mpy")
+        result = subprocess.run([mpy_cross, "-o", dst, src], capture_output=True, text=True)
+        if result.returncode != 0:
+            sys.exit("mpy-cross failed on {}:\n{}".format(name, result.stderr))
+        py_size = os.path.getsize(src)
+        mpy_size = os.path.getsize(dst)
+        total_py += py_size
+        total_mpy += mpy_size
+        print("  {:<20} {:>8} {:>8}".format(name, py_size, mpy_size))
+    print("  {:<20} {:>8} {:>8}".format("total", total_py, total_mpy))
+
+
+def _remove(path):
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def deploy(out, drive, source, bench):
+    for name in sources():
+        stem = name[:-3]
+        if source:
+            shutil.copy(os.path.join(CODE_DIR, name), os.path.join(drive, name))
+            _remove(os.path.join(drive, stem + ".mpy"))
+        else:
+            shutil.copy(os.path.join(out, stem + ".mpy"), os.path.join(drive, stem + ".mpy"))
+            _remove(os.path.join(drive, name))
+    shutil.copy(os.path.join(CODE_DIR, "code.py"), os.path.join(drive, "code.py"))
+    for name in ASSETS:
+        shutil.copy(os.path.join(CODE_DIR, name), os.path.join(drive, name))
+    for name in sources(BENCH_DIR, ()):
+        _remove(os.path.join(drive, name[:-3] + ".mpy"))   # built by older versions of this script
+        if bench:
+            shutil.copy(os.path.join(BENCH_DIR, name), os.path.join(drive, name))
+        else:
+            _remove(os.path.join(drive, name))
+    print("deployed {} {} modules + code.py + {}{} to {}".format(
+        len(sources()), ".py" if source else ".mpy", ", ".join(ASSETS),
+        " + {} bench/ modules".format(len(sources(BENCH_DIR, ()))) if bench else "", drive))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mpy-cross", default=os.environ.get("MPY_CROSS", "mpy-cross"))
+    parser.add_argument("--out", default=os.path.join(ROOT, "build", "mpy"))
+    parser.add_argument("--deploy", metavar="CIRCUITPY", help="copy the result to the mounted board")
+    parser.add_argument("--source", action="store_true", help="with --deploy: copy the .py sources instead")
+    parser.add_argument("--bench", action="store_true", help="with --deploy: also copy the bench/ modules (source)")
+    args = parser.parse_args()
+
+    if not (args.deploy and args.source):
+        build(args.mpy_cross, args.out)
+    if args.deploy:
+        deploy(args.out, args.deploy, args.source, args.bench)
+
+
+if __name__ == "__main__":
+    main()
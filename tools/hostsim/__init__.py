@@ -0,0 +1,13 @@
+"""
+hostsim: run the game headless on a Linux / macOS / Windows host.
+
+Stand-ins for board, busio, digitalio, pwmio, neopixel, keypad, displayio,
+terminalio, adafruit_display_text, i2cdisplaybus, adafruit_displayio_ssd1306,
+adafruit_adxl34x, adafruit_bus_device, supervisor, time, gc and asyncio, all driven by one
+virtual clock. See Simulator for the scripting API and tools/run_headless.py
+for a command-line example.
+"""
+from .clock import VirtualClock, StopSimulation
+from .sim import Simulator
+
+__all__ = ["Simulator", "VirtualClock", "StopSimulation"]
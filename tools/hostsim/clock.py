@@ -0,0 +1,55 @@
+"""Virtual clock shared by every stand-in module."""
+import heapq
+
+
+class StopSimulation(Exception):
+    """Raised by the clock when it passes its limit (ends Simulator.run())."""
+
+
+class VirtualClock:
+    """
+    VirtualClock(limit=None)
+
+    Simulated time in seconds. Nothing really waits: sleep() just moves `t` forward,
+    so a headless game runs as fast as the host CPU allows.
+    - cost(seconds): time charged for a hardware access (pin read, I2C transfer,
+      display refresh), so busy loops without a sleep still move forward
+    - at(t, fn): call fn() once the clock reaches t (scripted inputs, probes)
+    - limit: StopSimulation is raised when the clock passes it
+    """
+
+    def __init__(self, limit=None):
+        self.t = 0.0
+        self.limit = limit
+        self._timers = []   # heap of (t, seq, fn)
+        self._seq = 0
+
+    def monotonic(self):
+        return self.t
+
+    def monotonic_ns(self):
+        return int(round(self.t * 1000000000))
+
+    def advance(self, dt):
+        if dt > 0:
+            self.t += dt
+        timers = self._timers
+        while timers and timers[0][0] <= self.t:
+            fn = heapq.heappop(timers)[2]
+            fn()
+        if self.limit is not None and self.t >= self.limit:
+            raise StopSimulation(self.t)
+
+    sleep = advance
+    cost = advance
+
+    def at(self, t, fn):
+        self._seq += 1
+        heapq.heappush(self._timers, (t, self._seq, fn))
+
+    def every(self, period, fn, start=0.0):
+        """Call fn() at start, start + period, ... until fn returns False."""
+        def tick(when=start):
+            if fn() is not False:
+                self.at(when + period, lambda: tick(when + period))
+        self.at(start, tick)
@@ -0,0 +1,93 @@
+"""Scripted input signals: pin levels, encoder quadrature and accelerometer tilt over time."""
+import bisect
+
+
+class DigitalSignal:
+    """
+    DigitalSignal(idle)
+
+    Level of one input pin: `idle` except inside scripted spans.
+    set(start, end, value) adds a span; where spans overlap, the one that started last wins.
+    """
+
+    def __init__(self, idle):
+        self.idle = idle
+        self._spans = []   # sorted by start: (start, seq, end, value)
+        self._seq = 0
+
+    def set(self, start, end, value):
+        self._seq += 1
+        bisect.insort(self._spans, (start, self._seq, end, value))
+
+    def value(self, t):
+        spans = self._spans
+        # time only moves forward: spans that are over can go
+        while spans and spans[0][2] <= t:
+            spans.pop(0)
+        level = self.idle
+        for start, _, end, value in spans:
+            if start > t:
+                break
+            if t < end:
+                level = value
+        return level
+
+
+class Quadrature:
+    """
+    Quadrature()
+
+    A/B levels of the rotary encoder (pull-ups, idle = both high).
+    step(t, n, interval): n raw edges (negative = backwards), one every `interval` seconds.
+    """
+
+    SEQ = ((True, True), (False, True), (False, False), (True, False))
+
+    def __init__(self):
+        self._edges = []   # sorted (t, delta)
+        self._pos = 0
+        self._next = 0
+
+    def step(self, t, n, interval):
+        delta = 1 if n > 0 else -1
+        for i in range(abs(n)):
+            bisect.insort(self._edges, (t + i * interval, delta))
+
+    def _position(self, t):
+        edges = self._edges
+        while self._next < len(edges) and edges[self._next][0] <= t:
+            self._pos += edges[self._next][1]
+            self._next += 1
+        if self._next > 256:
+            del edges[:self._next]
+            self._next = 0
+        return self._pos
+
+    def a(self, t):
+        return self.SEQ[self._position(t) % 4][0]
+
+    def b(self, t):
+        return self.SEQ[self._position(t) % 4][1]
+
+
+class Tilt:
+    """
+    Tilt(x=0.0, y=0.0, z=9.8)
+
+    Piecewise-constant acceleration (m/s^2) seen by the ADXL345.
+    set(t, x, y, z) changes it from time t on.
+    """
+
+    def __init__(self, x=0.0, y=0.0, z=9.8):
+        self._points = [(-1.0, 0, (x, y, z))]
+        self._seq = 0
+
+    def set(self, t, x, y, z=9.8):
+        self._seq += 1
+        bisect.insort(self._points, (t, self._seq, (x, y, z)))
+
+    def value(self, t):
+        points = self._points
+        while len(points) > 1 and points[1][0] <= t:
+            points.pop(0)
+        return points[0][2]
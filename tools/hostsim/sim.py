@@ -0,0 +1,252 @@
+"""Simulator: runs src/codefiles/game.py headless on the virtual clock."""
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time as _host_time
+
+from .clock import VirtualClock, StopSimulation
+from .signals import DigitalSignal, Quadrature, Tilt
+from . import stubs
+
+CODE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                         "..", "..", "src", "codefiles"))
+# benchmark / replay modules (not deployed with the game, importable in the simulator)
+BENCH_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                          "..", "..", "bench"))
+
+# wiring used by game.py
+BTN_PIN = "D9"      # pull-up, pressed = low
+TOUCH_PIN = "D2"    # pull-down, touched = high
+SOUND_PIN = "D3"    # pull-up, loud = low
+ENC_A_PIN = "D0"
+ENC_B_PIN = "D1"
+
+# game modules are imported fresh on every run (module-level state starts clean)
+_GAME_MODULES = (
+    "game", "ui", "menu", "NameInput", "easter", "easter2", "score", "inputs", "effects",
+    "pacer", "runtime", "adxl_stream", "hitindex", "zombie_registry", "rotary_encoder", "bench",
+    "replay", "lazy", "heapwatch", "profiler", "sprites", "cutscene", "textpack", "textids",
+    "music",
+)
+
+# data files game.py opens by name from the CIRCUITPY root (copied into the workdir)
+_ASSETS = ("story.bin",)
+
+
+class Simulator:
+    """
+    Simulator(workdir=None, *, keypad=True, asyncio=True, pin_cost=2e-5, refresh_cost=0.0,
+              i2c_hz=400000, heap_size=160000, run_reason="STARTUP", echo=False)
+
+    Headless run of the game on CPython, faster than real time.
+    Inputs are scripted on the virtual clock before (or during) run():
+        sim = Simulator()
+        sim.press(1.0)                    # trigger button for 0.1 s at t = 1.0
+        sim.hold_touch(5.0, 1.0)          # shield pad for 1 s
+        sim.sound(6.0)                    # a clap
+        sim.turn(2.0, 2)                  # encoder, 2 edges clockwise
+        sim.tilt_to(0.0, x=1.5, y=-2.0)   # accelerometer (m/s^2) from t = 0 on
+        sim.at(10.0, fn)                  # any callback at t = 10.0
+        results = sim.run(games=1)        # game.main(games=1)
+    - workdir: where scores_*.bin are written (fresh temp dir by default)
+    - keypad: provide the keypad module (button / encoder scanned in the background)
+    - asyncio: provide asyncio (False: lib/ without it, Runtime's plain loop runs the game)
+    - pin_cost / refresh_cost / i2c_hz: virtual time charged per hardware access
+    - run_reason: supervisor.runtime.run_reason ("AUTO_RELOAD": a restart after a file save)
+    - serial: everything the game printed; screen_text(): visible labels right now
+    """
+
+    def __init__(self, workdir=None, *, keypad=True, asyncio=True, pin_cost=2e-5, refresh_cost=0.0,
+                 i2c_hz=400000, heap_size=160000, run_reason="STARTUP", echo=False):
+        self.clock = VirtualClock()
+        self.workdir = workdir or tempfile.mkdtemp(prefix="hostsim-")
+        self.keypad = keypad
+        self.asyncio = asyncio
+        self.pin_cost = pin_cost
+        self.refresh_cost = refresh_cost
+        self.i2c_hz = i2c_hz
+        self.heap_size = heap_size
+        self.run_reason = run_reason
+        self.echo = echo
+        self.epoch = 1700000000.0
+
+        self.signals = {
+            BTN_PIN: DigitalSignal(True),
+            TOUCH_PIN: DigitalSignal(False),
+            SOUND_PIN: DigitalSignal(True),
+        }
+        self.encoder = Quadrature()
+        self.tilt = Tilt()
+
+        # filled in by the stand-in modules
+        self.display = None
+        self.adxl = None
+        self.buzzer = None
+        self.outputs = {}
+        self.tone_log = []        # (t, freq or 0) whenever the buzzer starts / stops
+        self.label_allocs = 0
+        self.label_renders = 0
+
+        self.serial = ""
+        self.game = None
+        self.wall_time = 0.0
+
+    # ---------- hardware hooks used by stubs ----------
+
+    def read_pin(self, pin, pull=None, t=None):
+        if t is None:
+            t = self.clock.t
+        if pin == ENC_A_PIN:
+            return self.encoder.a(t)
+        if pin == ENC_B_PIN:
+            return self.encoder.b(t)
+        signal = self.signals.get(pin)
+        if signal is None:
+            return pull == "UP"
+        return signal.value(t)
+
+    def i2c_cost(self, nbytes):
+        # address + register + data, 9 clocks per byte
+        return (nbytes + 1) * 9 / self.i2c_hz
+
+    def heap_used(self):
+        import tracemalloc
+        if tracemalloc.is_tracing():
+            return tracemalloc.get_traced_memory()[0]
+        return 0
+
+    # ---------- scripted inputs ----------
+
+    def press(self, t, duration=0.1):
+        """Trigger button down at t for `duration` seconds."""
+        self.signals[BTN_PIN].set(t, t + duration, False)
+
+    def hold_touch(self, t, duration):
+        self.signals[TOUCH_PIN].set(t, t + duration, True)
+
+    def sound(self, t, duration=0.05):
+        """A loud sound: the sensor output goes low for `duration`."""
+        self.signals[SOUND_PIN].set(t, t + duration, False)
+
+    def turn(self, t, edges, interval=0.03):
+        """Rotate the encoder by `edges` raw edges (negative = counter-clockwise)."""
+        self.encoder.step(t, edges, interval)
+
+    def tilt_to(self, t, x=0.0, y=0.0, z=9.8):
+        self.tilt.set(t, x, y, z)
+
+    def at(self, t, fn):
+        self.clock.at(t, fn)
+
+    def every(self, period, fn, start=0.0):
+        self.clock.every(period, fn, start)
+
+    def autopilot(self, *, press_every=0.9, press_time=0.3, sound_every=1.3,
+                  touch_every=5.0, touch_time=1.0, start=0.0):
+        """
+        Simple bot that gets through every screen: presses the button, claps and
+        touches the pad periodically (crosshair stays centred unless tilt_to() is used).
+        """
+        self.every(press_every, lambda: self.press(self.clock.t, press_time), start)
+        self.every(sound_every, lambda: self.sound(self.clock.t), start + 0.4)
+        self.every(touch_every, lambda: self.hold_touch(self.clock.t, touch_time), start + 2.0)
+
+    # ---------- output ----------
+
+    def screen_text(self):
+        """Text of every visible label (and sprites.py tile) on the display, top to bottom."""
+        found = []
+        sprites = sys.modules.get("sprites")
+
+        def walk(node, ox, oy):
+            if getattr(node, "hidden", False):
+                return
+            if hasattr(node, "text"):
+                found.append((oy + node.y, ox + node.x, node.text))
+            elif hasattr(node, "tile_width") and sprites is not None:
+                chars = sprites.sheet().chars
+                for row in range(node.height):
+                    text = "".join(chars[node[col, row]] for col in range(node.width))
+                    found.append((oy + node.y + row * node.tile_height, ox + node.x, text))
+            elif isinstance(node, list):
+                for child in node:
+                    walk(child, ox + node.x, oy + node.y)
+
+        if self.display is not None and self.display.root_group is not None:
+            walk(self.display.root_group, 0, 0)
+        found.sort()
+        return [text for _, _, text in found]
+
+    # ---------- running ----------
+
+    @contextlib.contextmanager
+    def installed(self):
+        """
+        Context manager: stand-in modules in sys.modules, src/codefiles and bench/ on sys.path,
+        cwd = workdir, stdout captured into `serial`. Game modules imported inside
+        start fresh and are dropped again on exit.
+        """
+        saved_modules = {}
+        fakes = stubs.build(self)
+        for name in list(fakes) + list(_GAME_MODULES):
+            saved_modules[name] = sys.modules.pop(name, None)
+        sys.modules.update(fakes)
+
+        saved_cwd = os.getcwd()
+        saved_stdout = sys.stdout
+        out = _Tee(saved_stdout if self.echo else None)
+        sys.path.insert(0, BENCH_DIR)
+        sys.path.insert(0, CODE_DIR)
+        for name in _ASSETS:
+            shutil.copy(os.path.join(CODE_DIR, name), os.path.join(self.workdir, name))
+        os.chdir(self.workdir)
+        wall = _host_time.perf_counter()
+        try:
+            sys.stdout = out
+            yield self
+        finally:
+            sys.stdout = saved_stdout
+            self.wall_time += _host_time.perf_counter() - wall
+            self.serial += out.getvalue()
+            os.chdir(saved_cwd)
+            sys.path.remove(CODE_DIR)
+            sys.path.remove(BENCH_DIR)
+            for name, mod in saved_modules.items():
+                if mod is None:
+                    sys.modules.pop(name, None)
+                else:
+                    sys.modules[name] = mod
+
+    def run(self, games=None, seconds=None, **options):
+        """
+        Import game.py with the stand-in modules and call game.main(games, **options)
+        (e.g. record=True, difficulty="DIFFICULT").
+        Stops after `games` games, or when `seconds` of virtual time have passed.
+        Returns game.main()'s result list, or None if the time limit ended the run.
+        """
+        self.clock.limit = None if seconds is None else self.clock.t + seconds
+        with self.installed():
+            try:
+                import game
+                self.game = game
+                return game.main(games, **options)
+            except StopSimulation:
+                return None
+
+    def speedup(self):
+        """Virtual seconds simulated per wall-clock second."""
+        return self.clock.t / self.wall_time if self.wall_time > 0 else 0.0
+
+
+class _Tee(io.StringIO):
+    def __init__(self, echo):
+        super().__init__()
+        self._echo = echo
+
+    def write(self, s):
+        if self._echo is not None:
+            self._echo.write(s)
+        return super().write(s)
@@ -0,0 +1,462 @@
+"""
+Stand-in modules for the CircuitPython APIs the game imports.
+
+build(sim) returns {module name: module}. Every module reads time and inputs from
+the Simulator, and charges its hardware costs to the virtual clock.
+"""
+import gc as _host_gc
+import struct
+import time as _host_time
+import types
+
+from . import vasyncio
+
+# ADXL345 registers used by adxl_stream.py
+_ADXL_DATAX0 = 0x32
+_ADXL_FIFO_CTL = 0x38
+_ADXL_FIFO_STATUS = 0x39
+_ADXL_RATE_HZ = {6: 6.25, 7: 12.5, 8: 25, 9: 50, 10: 100, 11: 200, 12: 400, 13: 800, 14: 1600, 15: 3200}
+_ADXL_LSB = 0.004 * 9.80665
+_TICKS_MASK = (1 << 29) - 1    # supervisor.ticks_ms() wraps at 2**29
+
+
+def _module(name, **attrs):
+    mod = types.ModuleType(name)
+    for key, value in attrs.items():
+        setattr(mod, key, value)
+    return mod
+
+
+def build(sim):
+    clock = sim.clock
+    mods = {}
+
+    # ---------- time / gc / asyncio ----------
+
+    mods["time"] = _module(
+        "time",
+        monotonic=clock.monotonic,
+        monotonic_ns=clock.monotonic_ns,
+        sleep=clock.sleep,
+        time=lambda: sim.epoch + clock.t,
+        localtime=_host_time.localtime,
+        struct_time=_host_time.struct_time,
+    )
+
+    def mem_alloc():
+        return sim.heap_used()
+
+    def mem_free():
+        return max(0, sim.heap_size - sim.heap_used())
+
+    mods["gc"] = _module("gc", collect=_host_gc.collect, enable=_host_gc.enable,
+                         disable=_host_gc.disable, mem_alloc=mem_alloc, mem_free=mem_free)
+
+    # None in sys.modules: `import asyncio` raises ImportError (no asyncio in lib/)
+    mods["asyncio"] = vasyncio.build(clock) if sim.asyncio else None
+
+    run_reasons = ("STARTUP", "AUTO_RELOAD", "SUPERVISOR_RELOAD", "REPL_RELOAD")
+    mods["supervisor"] = _module(
+        "supervisor", ticks_ms=lambda: int(clock.t * 1000) & _TICKS_MASK,
+        RunReason=_module("RunReason", **{r: r for r in run_reasons}),
+        runtime=_module("runtime", run_reason=sim.run_reason))
+
+    # ---------- board / digitalio / pwmio / neopixel ----------
+
+    board = _module("board")
+    for name in ("SCL", "SDA", "D0", "D1", "D2", "D3", "D4", "D5", "D6", "D7", "D8", "D9", "D10"):
+        setattr(board, name, name)
+    mods["board"] = board
+
+    class Pull:
+        UP = "UP"
+        DOWN = "DOWN"
+
+    class Direction:
+        INPUT = "INPUT"
+        OUTPUT = "OUTPUT"
+
+    class DigitalInOut:
+        def __init__(self, pin):
+            self.pin = pin
+            self.direction = Direction.INPUT
+            self.pull = None
+            self._out = False
+
+        def switch_to_input(self, pull=None):
+            self.direction = Direction.INPUT
+            self.pull = pull
+
+        def switch_to_output(self, value=False, drive_mode=None):
+            self.direction = Direction.OUTPUT
+            self._out = value
+            sim.outputs[self.pin] = value
+
+        @property
+        def value(self):
+            if self.direction == Direction.OUTPUT:
+                return self._out
+            clock.cost(sim.pin_cost)
+            return sim.read_pin(self.pin, self.pull)
+
+        @value.setter
+        def value(self, v):
+            self._out = bool(v)
+            sim.outputs[self.pin] = self._out
+
+        def deinit(self):
+            pass
+
+    mods["digitalio"] = _module("digitalio", Pull=Pull, Direction=Direction, DigitalInOut=DigitalInOut)
+
+    class PWMOut:
+        def __init__(self, pin, duty_cycle=0, frequency=500, variable_frequency=False):
+            self.pin = pin
+            self.frequency = frequency
+            self._duty = duty_cycle
+            sim.buzzer = self
+
+        @property
+        def duty_cycle(self):
+            return self._duty
+
+        @duty_cycle.setter
+        def duty_cycle(self, value):
+            if (value > 0) != (self._duty > 0):
+                sim.tone_log.append((clock.t, self.frequency if value > 0 else 0))
+            self._duty = value
+
+        def deinit(self):
+            pass
+
+    mods["pwmio"] = _module("pwmio", PWMOut=PWMOut)
+
+    class NeoPixel(list):
+        def __init__(self, pin, n, brightness=1.0, auto_write=True, **kwargs):
+            super().__init__([(0, 0, 0)] * n)
+            self.brightness = brightness
+            self.auto_write = auto_write
+
+        def show(self):
+            pass
+
+        def fill(self, color):
+            for i in range(len(self)):
+                self[i] = color
+
+    mods["neopixel"] = _module("neopixel", NeoPixel=NeoPixel)
+
+    # ---------- keypad (background edge scanning) ----------
+
+    if sim.keypad:
+        class Event:
+            def __init__(self, key_number=0, pressed=True):
+                self.key_number = key_number
+                self.pressed = pressed
+                self.released = not pressed
+                self.timestamp = 0
+
+        class EventQueue:
+            def __init__(self, keys, max_events):
+                self._keys = keys
+                self._queue = []
+                self._max = max_events
+                self.overflowed = False
+
+            def get_into(self, event):
+                self._keys._scan_until(clock.t)
+                if not self._queue:
+                    return False
+                key, pressed, ts = self._queue.pop(0)
+                event.key_number = key
+                event.pressed = pressed
+                event.released = not pressed
+                event.timestamp = ts
+                return True
+
+            def clear(self):
+                self._queue.clear()
+
+            def __len__(self):
+                return len(self._queue)
+
+        class Keys:
+            def __init__(self, pins, *, value_when_pressed, pull=True, interval=0.02, max_events=64):
+                self.pins = pins
+                self.key_count = len(pins)
+                self._vwp = value_when_pressed
+                self._pull = (Pull.UP if not value_when_pressed else Pull.DOWN) if pull else None
+                self._interval = interval
+                self._last_scan = clock.t
+                self._state = [False] * len(pins)
+                self.events = EventQueue(self, max_events)
+
+            def _scan_until(self, t):
+                # the real module scans every `interval` in the background
+                while self._last_scan + self._interval <= t:
+                    self._last_scan += self._interval
+                    for i, pin in enumerate(self.pins):
+                        pressed = sim.read_pin(pin, self._pull, self._last_scan) == self._vwp
+                        if pressed != self._state[i]:
+                            self._state[i] = pressed
+                            q = self.events
+                            if len(q._queue) >= q._max:
+                                q.overflowed = True
+                            else:
+                                q._queue.append((i, pressed, int(self._last_scan * 1000) & _TICKS_MASK))
+
+            def reset(self):
+                self._state = [False] * len(self.pins)
+
+            def deinit(self):
+                pass
+
+        mods["keypad"] = _module("keypad", Event=Event, Keys=Keys, EventQueue=EventQueue)
+
+    # ---------- displayio / terminalio / label ----------
+
+    class Group(list):
+        def __init__(self, *, x=0, y=0, scale=1):
+            super().__init__()
+            self.x = x
+            self.y = y
+            self.scale = scale
+            self.hidden = False
+
+        def __hash__(self):
+            return id(self)
+
+        def __eq__(self, other):
+            return self is other
+
+        def __ne__(self, other):
+            return self is not other
+
+        def remove(self, item):
+            for i, child in enumerate(self):
+                if child is item:
+                    del self[i]
+                    return
+            raise ValueError("item not in group")
+
+    class Bitmap:
+        def __init__(self, width, height, value_count):
+            self.width = width
+            self.height = height
+            self._pixels = bytearray(width * height)
+
+        def __getitem__(self, xy):
+            if isinstance(xy, tuple):
+                x, y = xy
+                return self._pixels[y * self.width + x]
+            return self._pixels[xy]
+
+        def __setitem__(self, xy, value):
+            if isinstance(xy, tuple):
+                x, y = xy
+                self._pixels[y * self.width + x] = value
+            else:
+                self._pixels[xy] = value
+
+        def fill(self, value):
+            for i in range(len(self._pixels)):
+                self._pixels[i] = value
+
+    class Palette(list):
+        def __init__(self, color_count):
+            super().__init__([0] * color_count)
+
+        def make_transparent(self, index):
+            pass
+
+        def make_opaque(self, index):
+            pass
+
+    class TileGrid:
+        def __init__(self, bitmap, *, pixel_shader=None, width=1, height=1,
+                     tile_width=None, tile_height=None, default_tile=0, x=0, y=0):
+            self.bitmap = bitmap
+            self.pixel_shader = pixel_shader
+            self.width = width
+            self.height = height
+            self.tile_width = tile_width if tile_width is not None else bitmap.width
+            self.tile_height = tile_height if tile_height is not None else bitmap.height
+            self.x = x
+            self.y = y
+            self.hidden = False
+            self._tiles = [default_tile] * (width * height)
+
+        def _index(self, key):
+            if isinstance(key, tuple):
+                return key[1] * self.width + key[0]
+            return key
+
+        def __getitem__(self, key):
+            return self._tiles[self._index(key)]
+
+        def __setitem__(self, key, value):
+            self._tiles[self._index(key)] = value
+
+    mods["displayio"] = _module("displayio", Group=Group, Bitmap=Bitmap, Palette=Palette,
+                                TileGrid=TileGrid, release_displays=lambda: None)
+
+    class _Font:
+        def get_bounding_box(self):
+            return (6, 12)
+
+    mods["terminalio"] = _module("terminalio", FONT=_Font())
+
+    class Label:
+        def __init__(self, font=None, *, text="", x=0, y=0, color=0xFFFFFF, scale=1, **kwargs):
+            self.font = font
+            self._text = text
+            self.x = x
+            self.y = y
+            self.color = color
+            self.scale = scale
+            self.hidden = False
+            sim.label_allocs += 1
+
+        @property
+        def text(self):
+            return self._text
+
+        @text.setter
+        def text(self, value):
+            self._text = value
+            sim.label_renders += 1
+
+    mods["adafruit_display_text"] = _module("adafruit_display_text")
+    mods["adafruit_display_text.label"] = _module("adafruit_display_text.label", Label=Label)
+    mods["adafruit_display_text"].label = mods["adafruit_display_text.label"]
+
+    # ---------- I2C bus, OLED, ADXL345 ----------
+
+    class I2C:
+        def __init__(self, scl, sda, frequency=100000):
+            self.frequency = frequency
+
+        def try_lock(self):
+            return True
+
+        def unlock(self):
+            pass
+
+        def deinit(self):
+            pass
+
+    mods["busio"] = _module("busio", I2C=I2C)
+
+    class I2CDisplayBus:
+        def __init__(self, i2c, device_address=0x3C):
+            self.i2c = i2c
+
+    mods["i2cdisplaybus"] = _module("i2cdisplaybus", I2CDisplayBus=I2CDisplayBus)
+
+    class SSD1306:
+        def __init__(self, bus, width=128, height=64, **kwargs):
+            self.width = width
+            self.height = height
+            self.root_group = None
+            self.auto_refresh = True
+            self.refreshes = 0
+            sim.display = self
+
+        def refresh(self, **kwargs):
+            clock.cost(sim.refresh_cost)
+            self.refreshes += 1
+            return True
+
+    mods["adafruit_displayio_ssd1306"] = _module("adafruit_displayio_ssd1306", SSD1306=SSD1306)
+
+    class DataRate:
+        RATE_3200_HZ = 15
+        RATE_1600_HZ = 14
+        RATE_800_HZ = 13
+        RATE_400_HZ = 12
+        RATE_200_HZ = 11
+        RATE_100_HZ = 10
+        RATE_50_HZ = 9
+        RATE_25_HZ = 8
+        RATE_12_5_HZ = 7
+        RATE_6_25HZ = 6
+
+    class Range:
+        RANGE_16_G = 3
+        RANGE_8_G = 2
+        RANGE_4_G = 1
+        RANGE_2_G = 0
+
+    class ADXL345:
+        def __init__(self, i2c, address=0x53):
+            self.data_rate = DataRate.RATE_100_HZ
+            self.range = Range.RANGE_2_G
+            sim.adxl = self
+            # FIFO model (stream mode keeps the newest 32 samples)
+            self.fifo_mode = 0
+            self.fifo = 0
+            self._fifo_t = clock.t
+
+        def _lsb(self, t):
+            x, y, z = sim.tilt.value(t)
+            return int(x / _ADXL_LSB), int(y / _ADXL_LSB), int(z / _ADXL_LSB)
+
+        @property
+        def acceleration(self):
+            clock.cost(sim.i2c_cost(6))
+            x, y, z = self._lsb(clock.t)
+            return x * _ADXL_LSB, y * _ADXL_LSB, z * _ADXL_LSB
+
+        def _fill(self):
+            period = 1.0 / _ADXL_RATE_HZ.get(self.data_rate, 100)
+            new = int((clock.t - self._fifo_t) / period)
+            if new > 0:
+                self._fifo_t += new * period
+                if self.fifo_mode:
+                    self.fifo = min(32, self.fifo + new)
+
+    mods["adafruit_adxl34x"] = _module("adafruit_adxl34x", ADXL345=ADXL345, DataRate=DataRate, Range=Range)
+
+    class I2CDevice:
+        """Register access to the simulated ADXL345 (the only raw I2C device the game uses)."""
+
+        def __init__(self, i2c, device_address, probe=True):
+            self.device_address = device_address
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def write(self, buf, *, start=0, end=None):
+            clock.cost(sim.i2c_cost(len(buf)))
+            adxl = sim.adxl
+            if adxl is not None and buf[0] == _ADXL_FIFO_CTL:
+                adxl._fill()
+                adxl.fifo_mode = buf[1] >> 6
+                if adxl.fifo_mode == 0:
+                    adxl.fifo = 0   # bypass clears the FIFO
+
+        def readinto(self, buf, *, start=0, end=None):
+            clock.cost(sim.i2c_cost(len(buf)))
+
+        def write_then_readinto(self, out_buf, in_buf, **kwargs):
+            clock.cost(sim.i2c_cost(len(out_buf) + len(in_buf)))
+            adxl = sim.adxl
+            if adxl is None:
+                return
+            adxl._fill()
+            reg = out_buf[0]
+            if reg == _ADXL_FIFO_STATUS:
+                in_buf[0] = adxl.fifo & 0x3F
+            elif reg == _ADXL_DATAX0:
+                if adxl.fifo:
+                    adxl.fifo -= 1
+                struct.pack_into("<hhh", in_buf, 0, *adxl._lsb(clock.t))
+
+    mods["adafruit_bus_device"] = _module("adafruit_bus_device")
+    mods["adafruit_bus_device.i2c_device"] = _module("adafruit_bus_device.i2c_device", I2CDevice=I2CDevice)
+    mods["adafruit_bus_device"].i2c_device = mods["adafruit_bus_device.i2c_device"]
+
+    return mods
@@ -0,0 +1,83 @@
+"""
+Stand-in for CircuitPython's asyncio on the virtual clock.
+
+Only what the game uses: run(), create_task(), gather(), sleep().
+Tasks are stepped in wake-up order; the clock jumps straight to the next wake-up.
+"""
+import heapq
+import types
+
+
+def build(clock):
+    mod = types.ModuleType("asyncio")
+    state = {"queue": None, "seq": 0}
+
+    def _schedule(task, when):
+        state["seq"] += 1
+        heapq.heappush(state["queue"], (when, state["seq"], task))
+
+    class _Sleep:
+        def __init__(self, delay):
+            self.delay = delay
+
+        def __await__(self):
+            yield ("sleep", self.delay)
+
+    class Task:
+        def __init__(self, coro):
+            self.coro = coro
+            self.done = False
+            self.result = None
+            self.waiters = []
+            _schedule(self, clock.t)
+
+        def __await__(self):
+            if not self.done:
+                yield ("wait", self)
+            return self.result
+
+        def _step(self):
+            try:
+                kind, arg = self.coro.send(None)
+            except StopIteration as stop:
+                self.done = True
+                self.result = stop.value
+                for waiter in self.waiters:
+                    _schedule(waiter, clock.t)
+                return
+            if kind == "sleep":
+                _schedule(self, clock.t + max(0.0, arg))
+            elif arg.done:
+                _schedule(self, clock.t)
+            else:
+                arg.waiters.append(self)
+
+    async def gather(*aws):
+        results = []
+        for aw in aws:
+            if not isinstance(aw, Task):
+                aw = Task(aw)
+            results.append(await aw)
+        return results
+
+    def run(coro):
+        outer = state["queue"]
+        state["queue"] = []
+        try:
+            main = Task(coro)
+            queue = state["queue"]
+            while queue and not main.done:
+                when, _, task = heapq.heappop(queue)
+                if when > clock.t:
+                    clock.advance(when - clock.t)
+                task._step()
+            return main.result
+        finally:
+            state["queue"] = outer
+
+    mod.sleep = _Sleep
+    mod.create_task = Task
+    mod.Task = Task
+    mod.gather = gather
+    mod.run = run
+    return mod
@@ -0,0 +1,120 @@
+# pack_text.py
+#
+# Pack the story / tutorial / easter-egg texts into one file the board reads on demand:
+#
+#   python3 tools/pack_text.py [--src src/text/story.txt] [--out src/codefiles/story.bin]
+#
+# Writes
+#   story.bin    "TXT1", u16 count, u16 longest text, (count + 1) u16 offsets, UTF-8 texts
+#   textids.py   id of the first text of each [SECTION] (the scripts use SECTION + n)
+# and prints what the texts would cost as str literals on the board vs the pack's
+# index + read buffer (textpack.TextPack). Copy story.bin to CIRCUITPY with the .py
+# files (tools/build_mpy.py --deploy does); run this again after editing story.txt.
+import argparse
+import os
+import struct
+import sys
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+MAGIC = b"TXT1"
+SEPARATOR = "==="
+
+# CircuitPython heap: 16-byte blocks; a str is a 16-byte object + its data (+ 1 NUL)
+HEAP_BLOCK = 16
+STR_OBJECT = 16
+
+
+def parse(path):
+    """[(section, [texts])] in file order."""
+    sections = []
+    text = None
+    with open(path, encoding="utf-8") as f:
+        for n, raw in enumerate(f, 1):
+            line = raw.rstrip("\n")
+            if text is None:
+                # between texts: comments, blank lines, section headers
+                if not line.strip() or line.startswith("#"):
+                    continue
+                if line.startswith("[") and line.endswith("]"):
+                    sections.append((line[1:-1], []))
+                    continue
+                if not sections:
+                    sys.exit("{}:{}: text before the first [SECTION]".format(path, n))
+                if line == SEPARATOR:
+                    sections[-1][1].append("")
+                    continue
+                text = [line]
+            elif line == SEPARATOR:
+                sections[-1][1].append("\n".join(text))
+                text = None
+            else:
+                text.append(line)
+    if text is not None:
+        sys.exit("{}: last text has no closing {}".format(path, SEPARATOR))
+    return sections
+
+
+def pack(sections):
+    data = bytearray()
+    offsets = [0]
+    longest = 0
+    for _, texts in sections:
+        for text in texts:
+            b = text.encode("utf-8")
+            data += b
+            offsets.append(len(data))
+            longest = max(longest, len(b))
+    count = len(offsets) - 1
+    if len(data) > 0xFFFF:
+        sys.exit("texts are {} bytes, the u16 offsets stop at 65535".format(len(data)))
+    head = MAGIC + struct.pack("<HH", count, longest) + struct.pack("<{}H".format(count + 1), *offsets)
+    return head + bytes(data), count, longest
+
+
+def _blocks(n):
+    return (n + HEAP_BLOCK - 1) // HEAP_BLOCK * HEAP_BLOCK
+
+
+def write_ids(path, sections, src):
+    lines = [
+        "# textids.py",
+        "#",
+        "# generated by tools/pack_text.py from {}: do not edit".format(src),
+        "# id of the first text of each section in story.bin",
+    ]
+    first = 0
+    for name, texts in sections:
+        lines.append("{} = {}{}# {} texts".format(name, first, " " * max(1, 12 - len(name) - len(str(first))),
+                                                len(texts)))
+        first += len(texts)
+    lines.append("COUNT = {}".format(first))
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--src", default=os.path.join(ROOT, "src", "text", "story.txt"))
+    parser.add_argument("--out", default=os.path.join(ROOT, "src", "codefiles", "story.bin"))
+    parser.add_argument("--ids", default=os.path.join(ROOT, "src", "codefiles", "textids.py"))
+    args = parser.parse_args()
+
+    sections = parse(args.src)
+    blob, count, longest = pack(sections)
+    with open(args.out, "wb") as f:
+        f.write(blob)
+    write_ids(args.ids, sections, os.path.relpath(args.src, ROOT))
+
+    texts = [t for _, ts in sections for t in ts]
+    text_bytes = sum(len(t.encode("utf-8")) for t in texts)
+    as_literals = sum(_blocks(STR_OBJECT) + _blocks(len(t.encode("utf-8")) + 1) for t in texts)
+    in_ram = _blocks(2 * (count + 1)) + _blocks(longest)
+    print("{}: {} texts in {} sections, {} B of text, file {} B".format(
+        os.path.relpath(args.out, ROOT), count, len(sections), text_bytes, len(blob)))
+    print("RAM as str literals: about {} B; with the pack: index {} B + buffer {} B".format(
+        as_literals, _blocks(2 * (count + 1)), _blocks(longest)))
+    print("saved after boot: about {} B (plus the tuples that held the strings)".format(as_literals - in_ram))
+
+
+if __name__ == "__main__":
+    main()
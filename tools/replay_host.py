@@ -0,0 +1,78 @@
+# replay_host.py
+#
+# Record a game on the host simulator, or replay a trace (recorded here or on the
+# device, copied off CIRCUITPY) through the real game logic:
+#
+#   python3 tools/replay_host.py record trace.bin [--difficulty DIFFICULT] [--seed 7] [--shield]
+#   python3 tools/replay_host.py replay trace.bin [--realtime] [--profile]
+#
+# record: the autopilot plays one game (plus a wandering tilt so the crosshair moves)
+#         with game.main(record=True); the trace is copied to the given path.
+# replay: game.replay_trace(); fast-forward by default, --realtime goes through the
+#         40 Hz task runtime. Exits with status 1 if score / HP / level differ from
+#         the recording. --profile prints the per-phase profile (host timer).
+# Spawns come from game.py's own xorshift32 (not `random`, whose algorithm differs
+# between CircuitPython and CPython), so a device trace spawns the same zombies here.
+import argparse
+import os
+import random
+import shutil
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from hostsim import Simulator
+
+
+def record(args):
+    sim = Simulator(echo=args.echo)
+    sim.autopilot()
+    if args.shield:
+        sim.hold_touch(0.0, args.seconds)
+    rng = random.Random(args.seed)
+    sim.every(0.7, lambda: sim.tilt_to(sim.clock.t, x=rng.uniform(-5, 5), y=rng.uniform(-3, 3)))
+    results = sim.run(games=1, seconds=args.seconds, record=True, difficulty=args.difficulty)
+    if not results:
+        print("time limit reached before the game ended")
+        return 1
+    shutil.copy(os.path.join(sim.workdir, "trace.bin"), args.trace)
+    r = results[0]
+    print("recorded {}: {} score={} hp={} level={} cleared={} ({} bytes)".format(
+        args.trace, r["difficulty"], r["score"], r["hp"], r["level"], r["cleared"],
+        os.path.getsize(args.trace)))
+    return 0
+
+
+def replay(args):
+    sim = Simulator(echo=True)
+    trace = os.path.abspath(args.trace)
+    wall = time.perf_counter()
+    with sim.installed():
+        import game
+        game.prof.on = args.profile
+        result = game.replay_trace(trace, fast=not args.realtime, clock_ns=time.perf_counter_ns)
+    print("host wall time {:.2f} s".format(time.perf_counter() - wall))
+    return 0 if result["match"] else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("record")
+    p.add_argument("trace")
+    p.add_argument("--difficulty", default="DIFFICULT", choices=("EASY", "NORMAL", "DIFFICULT"))
+    p.add_argument("--seed", type=int, default=1, help="seed of the autopilot's tilt (not the game)")
+    p.add_argument("--seconds", type=float, default=600.0, help="virtual time limit")
+    p.add_argument("--shield", action="store_true", help="keep the touch pad held (survive every level)")
+    p.add_argument("--echo", action="store_true")
+    p = sub.add_parser("replay")
+    p.add_argument("trace")
+    p.add_argument("--realtime", action="store_true", help="through the task runtime instead of fast-forward")
+    p.add_argument("--profile", action="store_true", help="per-phase timing of the logic frames")
+    args = parser.parse_args()
+    return record(args) if args.cmd == "record" else replay(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+# run_headless.py
+#
+# Run the game headless on the host with the hostsim stand-in modules:
+#
+#   python3 tools/run_headless.py [--games 3] [--seconds 600] [--refresh-ms 0] [--echo]
+#                                 [--hold-button 1.0] [--auto-reload] [--no-asyncio]
+#
+# The autopilot presses the button, claps and touches the pad on a fixed rhythm,
+# which is enough to get through the boot story, tutorial, menus and games.
+# Prints each game's result, the virtual time used and how much faster than
+# real time the run was.
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from hostsim import Simulator
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=3)
+    parser.add_argument("--seconds", type=float, default=1800.0, help="virtual time limit")
+    parser.add_argument("--refresh-ms", type=float, default=0.0, help="virtual cost of display.refresh()")
+    parser.add_argument("--shield", action="store_true", help="keep the touch pad held (survive every level)")
+    parser.add_argument("--no-keypad", action="store_true", help="boards without the keypad module")
+    parser.add_argument("--no-asyncio", action="store_true", help="lib/ without asyncio (plain task loop)")
+    parser.add_argument("--hold-button", type=float, default=0.0, metavar="S",
+                        help="button held for S seconds from power-on (skips the boot story)")
+    parser.add_argument("--auto-reload", action="store_true", help="boot as after a file save")
+    parser.add_argument("--echo", action="store_true", help="show the game's serial output")
+    args = parser.parse_args()
+
+    sim = Simulator(keypad=not args.no_keypad, asyncio=not args.no_asyncio, refresh_cost=args.refresh_ms / 1000.0, echo=args.echo,
+                    run_reason="AUTO_RELOAD" if args.auto_reload else "STARTUP")
+    if args.hold_button:
+        sim.press(0.0, args.hold_button)
+    sim.autopilot(start=args.hold_button + 0.5 if args.hold_button else 0.0)
+    if args.shield:
+        sim.hold_touch(0.0, args.seconds)
+
+    results = sim.run(games=args.games, seconds=args.seconds)
+    if results is None:
+        print("time limit reached after {:.1f} virtual s".format(sim.clock.t))
+        results = []
+    for i, r in enumerate(results):
+        print("game {}: {} score={} hp={} level={} cleared={}".format(
+            i + 1, r["difficulty"], r["score"], r["hp"], r["level"], r["cleared"]))
+    for line in sim.serial.splitlines():
+        if line.startswith("Boot ("):
+            print(line)
+    print("virtual {:.1f} s in {:.2f} s wall ({:.0f}x real time)".format(
+        sim.clock.t, sim.wall_time, sim.speedup()))
+
+
+if __name__ == "__main__":
+    main()